@@ -0,0 +1,47 @@
+"""Compare polynomial multiplication strategies by degree and coefficient size.
+
+Usage: python benchmarks/bench_arithmetic.py [--max-length N] [--repeat N]
+"""
+import argparse
+import random
+import timeit
+
+from computor import arithmetic
+
+
+def lengths(max_length: int):
+    length = 4
+    while length <= max_length:
+        yield length
+        length *= 2
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--max-length", type=int, default=2048, help="Largest number of coefficients")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Runs of each product, the fastest is kept")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    methods = arithmetic.MULTIPLY_METHODS + ("auto",)
+    print(f"{'bits':>5} {'length':>7} " + " ".join(f"{method + ' ms':>14}" for method in methods))
+    for bits in (8, 128):
+        for length in lengths(args.max_length):
+            a = [rng.getrandbits(bits) - (1 << (bits - 1)) for _ in range(length)]
+            b = [rng.getrandbits(bits) - (1 << (bits - 1)) for _ in range(length)]
+            timings = []
+            for method in methods:
+                if method == "numpy" and not arithmetic.fits_int64(a, b):
+                    timings.append(f"{'-':>14}")
+                    continue
+                method = None if method == "auto" else method
+                number = max(1, 20000 // (length * length))
+                elapsed = min(
+                    timeit.repeat(lambda: arithmetic.multiply(a, b, method), number=number, repeat=args.repeat)
+                )
+                timings.append(f"{elapsed / number * 1e3:>14.3f}")
+            print(f"{bits:>5} {length:>7} " + " ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
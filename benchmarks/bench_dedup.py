@@ -0,0 +1,74 @@
+"""Compare batch solving with and without canonical deduplication of the equations.
+
+The batch draws its equations from a few distinct polynomials, each written
+as a random multiple with terms moved between the sides, so only canonical
+deduplication finds the repeats; the factory cache only sees distinct strings.
+
+Usage: python benchmarks/bench_dedup.py [--size N] [--distinct N] [--repeat N]
+"""
+import argparse
+import io
+import random
+import time
+
+from computor import stats
+from computor.batch import solve_solutions, write_jsonl
+from computor.polynominal import PolynomialFactory, PolynomParser
+
+
+def random_polynomial(rng: random.Random) -> dict:
+    coefficients = {degree: rng.randint(-10**6, 10**6) for degree in range(2)}
+    coefficients[2] = rng.choice([-1, 1]) * rng.randint(1, 10**6)
+    return coefficients
+
+
+def random_multiple(rng: random.Random, coefficients: dict) -> str:
+    factor = rng.choice([-1, 1]) * rng.randint(1, 1000)
+    left, right = [], []
+    for degree, coefficient in coefficients.items():
+        if rng.random() < 0.5:
+            left.append(f"{coefficient * factor} * X^{degree}")
+        else:
+            right.append(f"{-coefficient * factor} * X^{degree}")
+    return (" + ".join(left) or "0") + " = " + (" + ".join(right) or "0")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=50000, help="Equations in the batch")
+    arg_parser.add_argument("--distinct", type=int, default=1000, help="Distinct polynomials up to a factor")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs of each variant, the fastest is kept")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    polynomials = [random_polynomial(rng) for _ in range(args.distinct)]
+    equations = [
+        (line, random_multiple(rng, rng.choice(polynomials)).replace("+ -", "- "))
+        for line in range(1, args.size + 1)
+    ]
+    variants = {
+        "plain": {},
+        "cache": {"cache_size": args.distinct},
+        "dedup": {"dedup_size": args.distinct},
+    }
+    print(f"{'variant':>8} {'CPU s':>8} {'equations/s':>12} {'dedup ratio':>12}")
+    for name, options in variants.items():
+        best = float("inf")
+        # the last, untimed, run counts the duplicates
+        for run in range(args.repeat + 1):
+            if run == args.repeat:
+                stats.reset()
+                stats.enable()
+            # a new factory every run, so polynomials and their strings are not reused
+            factory = PolynomialFactory(PolynomParser(), cache_size=options.get("cache_size", 0))
+            start = time.process_time()
+            write_jsonl(solve_solutions(equations, factory, options.get("dedup_size", 0)), io.StringIO())
+            if run < args.repeat:
+                best = min(best, time.process_time() - start)
+        stats.disable()
+        ratio = stats.dedup_ratio()
+        print(f"{name:>8} {best:>8.2f} {args.size / best:>12.0f} {'-' if ratio is None else f'{ratio:.3f}':>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare Polynomial.evaluate on a NumPy grid with evaluating term by term in Python.
+
+Usage: python benchmarks/bench_evaluate.py [--points N] [--degree N]
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from computor.polynominal import Polynomial
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--points", type=int, default=1_000_000, help="Points of the grid")
+    arg_parser.add_argument("--degree", type=int, default=8, help="Degree of the random polynomial")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    polynomial = Polynomial.from_coefficients({degree: rng.randint(-100, 100) for degree in range(args.degree + 1)})
+    xs = np.linspace(-2, 2, args.points)
+
+    start = time.perf_counter()
+    values = polynomial.evaluate(xs)
+    vectorized = time.perf_counter() - start
+
+    # the term by term loop is slow, time it on a sample
+    sample = xs[:: max(1, args.points // 20000)]
+    start = time.perf_counter()
+    expected = [sum(term.coefficient * x**term.degree for term in polynomial.terms) for x in sample.tolist()]
+    loop = (time.perf_counter() - start) * len(xs) / len(sample)
+    assert np.allclose(values[:: max(1, args.points // 20000)], expected)
+
+    print(f"{args.points} points, degree {args.degree}")
+    print(f"{'method':>12} {'seconds':>8}")
+    print(f"{'python loop':>12} {loop:>8.3f} (extrapolated)")
+    print(f"{'evaluate':>12} {vectorized:>8.3f} ({loop / vectorized:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
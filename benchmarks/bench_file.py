@@ -0,0 +1,58 @@
+"""Compare reading and parsing an equation file through text lines and through the memory-mapped bytes path.
+
+Solving is left out, it is the same for both inputs.
+Usage: python benchmarks/bench_file.py [--size N] [--path FILE] [--repeat N]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from computor.batch import read_lines, read_mapped_lines
+from computor.polynominal import PolynomialFactory, PolynomParser
+
+
+def random_equation(rng: random.Random) -> str:
+    terms = [f"{rng.randint(0, 10**6)} * X^{rng.randint(0, 2)}" for _ in range(rng.randint(3, 8))]
+    return " + ".join(terms[:-1]) + " = " + terms[-1]
+
+
+def run(equations) -> float:
+    create = PolynomialFactory(PolynomParser()).create
+    start = time.process_time()
+    for _, equation in equations:
+        create(equation)
+    return time.process_time() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=200000, help="Equations in the generated file")
+    arg_parser.add_argument("--path", help="Parse this file instead of a generated one")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs of each input, the fastest is kept")
+    args = arg_parser.parse_args()
+
+    path = args.path
+    if path is None:
+        rng = random.Random(0)
+        file, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(file, "w") as stream:
+            for _ in range(args.size):
+                stream.write(random_equation(rng) + "\n")
+    try:
+        text = mapped = float("inf")
+        for _ in range(args.repeat):
+            with open(path, encoding="utf-8") as stream:
+                text = min(text, run(read_lines(stream)))
+            mapped = min(mapped, run(read_mapped_lines(path)))
+    finally:
+        if args.path is None:
+            os.remove(path)
+    print(f"{'input':>7} {'CPU s':>8}")
+    print(f"{'text':>7} {text:>8.2f}")
+    print(f"{'mmap':>7} {mapped:>8.2f} ({text / mapped:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare batch output formats: full records, numeric record fields and NPY.
+
+Usage: python benchmarks/bench_output.py [--size N] [--repeat N]
+"""
+import argparse
+import io
+import random
+import time
+
+from computor.batch import solve_solutions, write_jsonl, write_npy
+from computor.polynominal import PolynomialFactory, PolynomParser
+
+NUMERIC_FIELDS = ("line", "degree", "discriminant", "solutions_count", "roots", "error")
+
+
+def random_equation(rng: random.Random) -> str:
+    terms = [f"{rng.randint(1, 10**6)} * X^{rng.randint(0, 2)}" for _ in range(rng.randint(3, 8))]
+    return " + ".join(terms[:-1]) + " = " + terms[-1]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=50000, help="Equations in the batch")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs of each format, the fastest is kept")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    equations = [(line, random_equation(rng)) for line in range(1, args.size + 1)]
+    outputs = {
+        "jsonl": lambda solutions: write_jsonl(solutions, io.StringIO()),
+        "jsonl numeric": lambda solutions: write_jsonl(solutions, io.StringIO(), NUMERIC_FIELDS),
+        "npy": lambda solutions: write_npy(solutions, io.BytesIO()),
+    }
+    print(f"{'output':>14} {'CPU s':>8} {'equations/s':>12}")
+    for name, write in outputs.items():
+        best = float("inf")
+        for _ in range(args.repeat):
+            # a new factory every run, so polynomials and their strings are not reused
+            solutions = solve_solutions(equations, PolynomialFactory(PolynomParser()))
+            start = time.process_time()
+            write(solutions)
+            best = min(best, time.process_time() - start)
+        print(f"{name:>14} {best:>8.2f} {args.size / best:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark batch throughput of the process pool for 1..N workers.
+
+Usage: python benchmarks/bench_parallel.py [--size N] [--max-workers N] [--chunk-size N]
+"""
+import argparse
+import os
+import random
+import time
+
+from computor.batch import solve_stream
+from computor.parallel import DEFAULT_CHUNK_SIZE, solve_parallel
+
+
+def random_equation(rng: random.Random) -> str:
+    terms = [f"{rng.randint(-10**6, 10**6)} * X^{rng.randint(0, 2)}" for _ in range(rng.randint(3, 8))]
+    return " + ".join(terms[:-1]) + " = " + terms[-1]
+
+
+def worker_counts(max_workers: int):
+    count = 1
+    while count < max_workers:
+        yield count
+        count *= 2
+    yield max_workers
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=50000, help="Equations in the batch")
+    arg_parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    equations = [(line, random_equation(rng)) for line in range(1, args.size + 1)]
+
+    start = time.perf_counter()
+    for _ in solve_stream(equations):
+        pass
+    serial = time.perf_counter() - start
+    print(f"{'workers':>7} {'seconds':>8} {'equations/s':>12} {'speedup':>8}")
+    print(f"{'serial':>7} {serial:>8.2f} {args.size / serial:>12.0f} {1:>8.2f}")
+    for workers in worker_counts(args.max_workers):
+        start = time.perf_counter()
+        for _ in solve_parallel(equations, workers, args.chunk_size):
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"{workers:>7} {elapsed:>8.2f} {args.size / elapsed:>12.0f} {serial / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the single pass lexer with the original multi-scan parsing path.
+
+Usage: python benchmarks/bench_parser.py [--repeat N]
+"""
+import argparse
+import csv
+import os
+import timeit
+
+from computor.lexer import tokenize
+from computor.polynominal import PolynomParser, PolynomialTerm
+
+DATASET = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "quadratic_equations_dataset_with_solutions.csv"
+)
+
+
+def legacy_parse(polynomial_str):
+    """The parsing pipeline as it was before the lexer: normalize, split, parse every term."""
+    polynomial_str = PolynomParser.normalize(polynomial_str)
+    polynomial_left, polynomial_right = polynomial_str.split("=")
+    terms = [PolynomialTerm.from_string(term) for term in PolynomParser.split_terms(polynomial_left)]
+    for term in PolynomParser.split_terms(polynomial_right):
+        terms.append(PolynomialTerm.from_string(term) * -1)
+    return terms
+
+
+def load_equations():
+    with open(DATASET, newline="") as f:
+        return [row["Equation"] for row in csv.DictReader(f)]
+
+
+def bench(name, func, equations, repeat):
+    best = min(timeit.repeat(lambda: [func(equation) for equation in equations], number=1, repeat=repeat))
+    per_equation = best / len(equations) * 1e6
+    print(f"{name:<10} {best * 1e3:9.2f} ms  {per_equation:7.2f} us/equation  {len(equations) / best:12.0f} equations/s")
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    datasets = {
+        "dataset": load_equations(),
+        "long": [" + ".join(f"{i}X^{i % 7}" for i in range(1, 200)) + " = 5X^2 - 3"] * 200,
+    }
+    for dataset, equations in datasets.items():
+        print(f"{dataset}: {len(equations)} equations")
+        legacy = bench("legacy", legacy_parse, equations, args.repeat)
+        lexer = bench("lexer", tokenize, equations, args.repeat)
+        print(f"speedup    {legacy / lexer:.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
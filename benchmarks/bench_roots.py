@@ -0,0 +1,35 @@
+"""Benchmark the numeric root solver across polynomial degrees.
+
+Usage: python benchmarks/bench_roots.py [--repeat N]
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from computor.roots import find_roots
+
+DEGREES = (3, 4, 5, 10, 25, 50, 100, 200, 500, 1000)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'degree':>6} {'aberth/closed':>14} {'numpy.roots':>12} {'max residual':>13}")
+    for degree in DEGREES:
+        coefficients = rng.integers(-100, 101, degree + 1)
+        coefficients[0] = rng.integers(1, 101)
+        solver = min(timeit.repeat(lambda: find_roots(coefficients), number=1, repeat=args.repeat))
+        reference = min(timeit.repeat(lambda: np.roots(coefficients), number=1, repeat=args.repeat))
+        roots = np.array(find_roots(coefficients))
+        # residual relative to the size of the terms at the root
+        scale = np.polyval(np.abs(coefficients).astype(float), np.maximum(np.abs(roots), 1))
+        residual = np.max(np.abs(np.polyval(coefficients.astype(float), roots)) / scale)
+        print(f"{degree:>6} {solver * 1e3:>11.2f} ms {reference * 1e3:>9.2f} ms {residual:>13.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark cold-start time of the command line entry point.
+
+Every run starts a fresh interpreter, like a shell loop calling the console
+script does. Times are reported on top of a bare ``python -c pass``.
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ENTRY_POINT = "import sys; sys.argv = ['computor'] + sys.argv[1:]; import computor; computor.main()"
+CASES = {
+    "single equation": ["5 * X^0 + 4 * X^1 - 9 * X^2 = 1 * X^0"],
+    "verbose (argparse)": ["-v", "5 * X^0 + 4 * X^1 - 9 * X^2 = 1 * X^0"],
+}
+
+
+def cold_start(arguments, runs):
+    """Median wall time in seconds of running the interpreter with the arguments."""
+    env = dict(os.environ, PYTHONPATH=os.path.join(os.path.dirname(__file__), ".."))
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *arguments], env=env, stdout=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--runs", type=int, default=20)
+    arg_parser.add_argument(
+        "--budget-ms", type=float, help="Exit with an error when the single equation case costs more"
+    )
+    args = arg_parser.parse_args()
+
+    interpreter = cold_start(["-c", "pass"], args.runs)
+    print(f"{'case':<20} {'median ms':>10} {'over python':>12}")
+    print(f"{'python -c pass':<20} {interpreter * 1e3:>10.1f} {0:>12.1f}")
+    overheads = {}
+    for name, arguments in CASES.items():
+        elapsed = cold_start(["-c", ENTRY_POINT, *arguments], args.runs)
+        overheads[name] = elapsed - interpreter
+        print(f"{name:<20} {elapsed * 1e3:>10.1f} {overheads[name] * 1e3:>12.1f}")
+
+    if args.budget_ms is not None and overheads["single equation"] * 1e3 > args.budget_ms:
+        print(f"start-up over budget of {args.budget_ms} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark fraction simplification and factorization on large coefficients.
+
+Usage: python benchmarks/bench_str_math.py
+"""
+import time
+
+from computor.factorization import factorize
+from computor.str_math import simplify_fraction, sqrt_str
+
+
+def legacy_prime_factors(number):
+    """Recursive trial division used by str_math before the factorization engine."""
+    if number <= 1:
+        return set()
+    divisor = 2
+    while divisor * divisor <= number:
+        if number % divisor == 0:
+            return {divisor} | legacy_prime_factors(number // divisor)
+        divisor += 1
+    return {number}
+
+
+def legacy_simplify_fraction(x, y):
+    """simplify_fraction as it was before it was rebuilt on math.gcd."""
+    if x % y == 0:
+        return x // y, 1
+    sign = -1 if x / y < 0 else 1
+    x, y = abs(x), abs(y)
+    common_primes = legacy_prime_factors(x) & legacy_prime_factors(y)
+    common_multiplier = 1
+    for prime in common_primes:
+        x_reduced, y_reduced = x, y
+        while x_reduced % prime == 0 and y_reduced % prime == 0:
+            common_multiplier *= prime
+            x_reduced //= prime
+            y_reduced //= prime
+    return sign * x // common_multiplier, y // common_multiplier
+
+
+def legacy_sqrt_str(x):
+    """Largest square factor search of sqrt_str before the square-free decomposition."""
+    i = int(x**0.5)
+    while i > 1:
+        if x % (i * i) == 0:
+            return i, x // (i * i)
+        i -= 1
+    return 1, x
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def report(name, elapsed):
+    print(f"  {name:<12} {'skipped' if elapsed is None else f'{elapsed * 1e3:10.3f} ms'}")
+
+
+def main():
+    # (numerator, denominator) pairs sharing a large common factor
+    fractions = {
+        "12 digits": (2 * 3 * 99991 * 10007, 4 * 99991 * 10009),
+        "20 digits": ((10**9 + 7) * (10**10 + 19) * 6, (10**9 + 7) * 4 * 998244353),
+        "40 digits": ((10**19 + 51) * (10**20 + 39), (10**19 + 51) * (10**20 + 129) * 3),
+    }
+    print("simplify_fraction")
+    for name, (x, y) in fractions.items():
+        print(f" {name}")
+        # trial division over two 10+ digit primes takes hours, only the small case runs
+        report("legacy", timed(legacy_simplify_fraction, x, y) if name == "12 digits" else None)
+        report("gcd", timed(simplify_fraction, x, y))
+
+    numbers = {
+        "20 digits": (10**9 + 7) * (10**10 + 19),
+        "22 digits": 3 * 7 * (10**20 + 39),
+        "24 digits": 1000000000039 * 99999999977,
+    }
+    print("factorize")
+    for name, number in numbers.items():
+        print(f" {name}")
+        report("pollard rho", timed(factorize, number))
+
+    discriminants = {
+        "12 digits": 4 * 10**12 + 12,
+        "19 digits": 10**18 + 12,
+        "40 digits": 3 * (10**19 + 51) ** 2,
+    }
+    print("sqrt_str")
+    for name, number in discriminants.items():
+        print(f" {name}")
+        report("legacy", timed(legacy_sqrt_str, number) if name == "12 digits" else None)
+        report("square-free", timed(sqrt_str, number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compare time and peak memory of parsing one long equation at once and in chunks.
+
+Usage: python benchmarks/bench_stream.py [--terms N] [--chunk-size N]
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from computor.polynominal import PolynomialFactory, PolynomParser
+
+
+def random_terms(rng: random.Random, count: int):
+    for _ in range(count):
+        yield f" {rng.choice('+-')} {rng.randint(0, 10**6)} * X^{rng.randint(0, 2)}"
+
+
+def equation_chunks(terms: int, chunk_size: int):
+    """The equation ``1 ... = 0`` in pieces of about ``chunk_size`` characters."""
+    pending = ["1"]
+    size = 1
+    for term in random_terms(random.Random(0), terms):
+        pending.append(term)
+        size += len(term)
+        if size >= chunk_size:
+            yield "".join(pending)
+            pending, size = [], 0
+    pending.append(" = 0")
+    yield "".join(pending)
+
+
+def measure(create):
+    tracemalloc.start()
+    start = time.perf_counter()
+    polynomial = create()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return polynomial, elapsed, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--terms", type=int, default=200000, help="Terms in the equation")
+    arg_parser.add_argument("--chunk-size", type=int, default=1 << 16, help="Characters per chunk")
+    args = arg_parser.parse_args()
+
+    factory = PolynomialFactory(PolynomParser())
+    equation = "".join(equation_chunks(args.terms, args.chunk_size))
+    whole, whole_time, whole_peak = measure(lambda: factory.create(equation))
+    streamed, stream_time, stream_peak = measure(
+        lambda: factory.create_from_chunks(equation_chunks(args.terms, args.chunk_size))
+    )
+    assert whole.coefficients == streamed.coefficients
+    print(f"{len(equation)} characters, {args.terms} terms")
+    print(f"{'mode':>8} {'seconds':>8} {'peak MiB':>9}")
+    print(f"{'string':>8} {whole_time:>8.2f} {whole_peak / 2**20:>9.1f}")
+    print(f"{'chunks':>8} {stream_time:>8.2f} {stream_peak / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure memory, allocations and time of parsing and reducing a long equation term by term.
+
+Small coefficients (-10..10, degrees 0..2) reuse the interned terms, large ones
+allocate a term each. Run it on two revisions to compare term representations.
+Usage: python benchmarks/bench_terms.py [--terms N] [--repeat N]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from computor.polynominal import Polynomial, PolynomParser
+
+
+def equation(rng: random.Random, terms: int, largest: int) -> str:
+    parts = [f"{rng.randint(0, largest)} * X^{rng.randint(0, 2)}"]
+    for _ in range(terms - 1):
+        parts.append(f"{rng.choice('+-')} {rng.randint(0, largest)} * X^{rng.randint(0, 2)}")
+    return " ".join(parts) + " = 0"
+
+
+def allocations(equation_str: str):
+    """Bytes and blocks held by the parsed terms, and the peak while parsing and reducing."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    terms, _ = PolynomParser.parse_scaled(equation_str)
+    after = tracemalloc.take_snapshot()
+    Polynomial.reduce_coefficients(terms)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    differences = after.compare_to(before, "filename")
+    held = sum(difference.size_diff for difference in differences)
+    blocks = sum(difference.count_diff for difference in differences)
+    return held, blocks, peak
+
+
+def timed(equation_str: str, repeat: int):
+    """Best process time of parsing, and of reducing the parsed terms."""
+    parse_times, reduce_times = [], []
+    for _ in range(repeat):
+        start = time.process_time()
+        terms, _ = PolynomParser.parse_scaled(equation_str)
+        middle = time.process_time()
+        Polynomial.reduce_coefficients(terms)
+        parse_times.append(middle - start)
+        reduce_times.append(time.process_time() - middle)
+        del terms
+    return min(parse_times), min(reduce_times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--terms", type=int, default=1000000, help="Terms in each equation")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timing runs, the best is kept")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{args.terms} terms")
+    print(f"{'coefficients':>12} {'held MiB':>9} {'blocks':>9} {'peak MiB':>9} {'parse s':>8} {'reduce s':>9}")
+    for name, largest in (("0..10", 10), ("0..10^6", 10**6)):
+        equation_str = equation(rng, args.terms, largest)
+        held, blocks, peak = allocations(equation_str)
+        parse_time, reduce_time = timed(equation_str, args.repeat)
+        print(
+            f"{name:>12} {held / 2**20:>9.1f} {blocks:>9} {peak / 2**20:>9.1f} "
+            f"{parse_time:>8.2f} {reduce_time:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
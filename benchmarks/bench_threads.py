@@ -0,0 +1,70 @@
+"""Compare batch throughput of the thread pool and the process pool for 1..N workers.
+
+Threads only run in parallel on a free-threaded build (``python3.13t``), run
+the benchmark with both builds to compare them; the header tells which one is used.
+Usage: python benchmarks/bench_threads.py [--size N] [--max-workers N] [--chunk-size N]
+"""
+import argparse
+import os
+import random
+import sys
+import sysconfig
+import time
+
+from computor.batch import solve_stream
+from computor.parallel import DEFAULT_CHUNK_SIZE, solve_parallel, solve_threaded
+
+
+def random_equation(rng: random.Random) -> str:
+    terms = [f"{rng.randint(-10**6, 10**6)} * X^{rng.randint(0, 2)}" for _ in range(rng.randint(3, 8))]
+    return " + ".join(terms[:-1]) + " = " + terms[-1]
+
+
+def worker_counts(max_workers: int):
+    count = 1
+    while count < max_workers:
+        yield count
+        count *= 2
+    yield max_workers
+
+
+def build() -> str:
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    # the GIL can be enabled again at run time, e.g. by PYTHON_GIL=1
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    kind = "free-threaded" if free_threaded else "default"
+    return f"Python {sys.version.split()[0]} {kind} build, GIL {'enabled' if gil_enabled else 'disabled'}"
+
+
+def timed(records) -> float:
+    start = time.perf_counter()
+    for _ in records:
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=50000, help="Equations in the batch")
+    arg_parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    equations = [(line, random_equation(rng)) for line in range(1, args.size + 1)]
+
+    print(build())
+    serial = timed(solve_stream(equations))
+    print(f"{'workers':>7} {'threads s':>10} {'speedup':>8} {'processes s':>12} {'speedup':>8}")
+    print(f"{'serial':>7} {serial:>10.2f} {1:>8.2f} {serial:>12.2f} {1:>8.2f}")
+    for workers in worker_counts(args.max_workers):
+        threads = timed(solve_threaded(equations, workers, args.chunk_size))
+        processes = timed(solve_parallel(equations, workers, args.chunk_size))
+        print(
+            f"{workers:>7} {threads:>10.2f} {serial / threads:>8.2f} "
+            f"{processes:>12.2f} {serial / processes:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare separating valid from invalid equations through exceptions and through ``validate``.
+
+The old way is to parse every line and catch the PolynomialSyntaxError with
+its message; ``split_valid`` gets an error code and position instead.
+Parsing the valid lines only is the lexer speed the others are measured against.
+Usage: python benchmarks/bench_validate.py [--size N] [--invalid SHARE] [--repeat N]
+"""
+import argparse
+import random
+import time
+
+from computor.batch import split_valid
+from computor.lexer import tokenize_scaled
+
+
+def random_equation(rng: random.Random) -> str:
+    terms = [f"{rng.randint(0, 10**6)} * X^{rng.randint(0, 2)}" for _ in range(rng.randint(3, 8))]
+    return " + ".join(terms[:-1]) + " = " + terms[-1]
+
+
+def corrupt(rng: random.Random, equation: str) -> str:
+    position = rng.randrange(len(equation))
+    return equation[:position] + rng.choice("a^+=*.") + equation[position:]
+
+
+def split_with_exceptions(equations):
+    valid, invalid = [], []
+    for line, equation in equations:
+        try:
+            tokenize_scaled(equation)
+        except ValueError as e:
+            invalid.append((line, equation, str(e)))
+        else:
+            valid.append((line, equation))
+    return valid, invalid
+
+
+def parse_valid(equations):
+    for _, equation in equations:
+        tokenize_scaled(equation)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=100000, help="Equations in the batch")
+    arg_parser.add_argument("--invalid", type=float, default=0.8, help="Share of corrupted equations")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Runs of each variant, the fastest is kept")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(0)
+    equations = [(line, random_equation(rng)) for line in range(1, args.size + 1)]
+    equations = [
+        (line, corrupt(rng, equation) if rng.random() < args.invalid else equation) for line, equation in equations
+    ]
+    valid, _ = split_valid(equations)
+    variants = {
+        "exceptions": lambda: split_with_exceptions(equations),
+        "split_valid": lambda: split_valid(equations),
+        "lexer only": lambda: parse_valid(valid),
+    }
+    best = dict.fromkeys(variants, float("inf"))
+    # interleaved, so load changes on the machine affect every variant alike
+    for _ in range(args.repeat):
+        for name, run in variants.items():
+            start = time.process_time()
+            run()
+            best[name] = min(best[name], time.process_time() - start)
+    print(f"{len(equations) - len(valid)} of {len(equations)} equations are invalid")
+    print(f"{'variant':>12} {'CPU s':>8} {'equations/s':>12}")
+    for name, elapsed in best.items():
+        size = len(valid) if name == "lexer only" else len(equations)
+        print(f"{name:>12} {elapsed:>8.2f} {size / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Per-stage benchmark suite for the parse, reduce, solve and format stages.
+
+Every stage is timed call by call, the report holds throughput and latency
+percentiles per dataset and stage as JSON, so revisions can be compared:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --compare before.json
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+from computor.polynominal import Polynomial, PolynomialFactory, PolynomParser
+
+DATASET = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "quadratic_equations_dataset_with_solutions.csv"
+)
+PERCENTILES = (50, 90, 99)
+
+
+def load_dataset() -> List[str]:
+    with open(DATASET, newline="") as f:
+        return [row["Equation"] for row in csv.DictReader(f)]
+
+
+def random_term(rng: random.Random, max_degree: int, digits: int) -> str:
+    coefficient = rng.randint(1, 10**digits)
+    degree = rng.randint(0, max_degree)
+    return rng.choice(("{c} * X^{d}", "{c}X^{d}", "{c}x^{d}", "{c} * X^{d}")).format(c=coefficient, d=degree)
+
+
+def random_equation(rng: random.Random, terms: int, max_degree: int = 2, digits: int = 3) -> str:
+    def side(count):
+        parts = [random_term(rng, max_degree, digits) for _ in range(count)]
+        return parts[0] + "".join(rng.choice((" + ", " - ")) + part for part in parts[1:])
+
+    left = max(1, terms * 2 // 3)
+    return side(left) + " = " + side(max(1, terms - left))
+
+
+def synthetic_datasets(seed: int, size: int) -> Dict[str, List[str]]:
+    rng = random.Random(seed)
+    return {
+        "synthetic-short": [random_equation(rng, 3) for _ in range(size)],
+        "synthetic-big-coefficients": [random_equation(rng, 4, digits=25) for _ in range(size)],
+        "synthetic-long": [random_equation(rng, 200) for _ in range(max(1, size // 50))],
+    }
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(timings: List[int]) -> Dict[str, float]:
+    """Summarize nanosecond timings of single calls."""
+    timings = sorted(timings)
+    total = sum(timings) / 1e9
+    summary = {
+        "calls": len(timings),
+        "total_s": total,
+        "throughput_per_s": len(timings) / total if total else float("inf"),
+    }
+    for percent in PERCENTILES:
+        summary[f"p{percent}_us"] = percentile(timings, percent) / 1e3
+    summary["max_us"] = timings[-1] / 1e3
+    return summary
+
+
+def run_stages(equations: List[str], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Time every stage of solving each equation, on fresh objects for every call."""
+    factory = PolynomialFactory(PolynomParser())
+    timings: Dict[str, List[int]] = {}
+    clock = time.perf_counter_ns
+
+    def timed(stage: str, func: Callable, *args):
+        start = clock()
+        result = func(*args)
+        timings.setdefault(stage, []).append(clock() - start)
+        return result
+
+    for _ in range(repeat):
+        for equation in equations:
+            normalized = timed("normalize", PolynomParser.normalize, equation)
+            left, right = normalized.split("=")
+            timed("split_terms", lambda: (PolynomParser.split_terms(left), PolynomParser.split_terms(right)))
+            terms = timed("parse", PolynomParser.parse, equation)
+            coefficients = timed("reduce_terms", Polynomial.reduce_coefficients, terms)
+            try:
+                polynomial = timed("create", factory.create, equation)
+            except ValueError:
+                # unsupported degree, nothing more to time
+                continue
+            polynomial_class = type(polynomial)
+            timed("get_solutions", polynomial_class(coefficients).get_solutions)
+            timed("get_solution_string", polynomial_class(coefficients).get_solution_string)
+            timed("get_reduced_form", polynomial_class(coefficients).get_reduced_form)
+    return {stage: summarize(stage_timings) for stage, stage_timings in timings.items()}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[str]:
+    """Returns a line for every stage whose p50 latency grew by more than threshold."""
+    regressions = []
+    for dataset, stages in report["results"].items():
+        for stage, summary in stages.items():
+            before = baseline.get("results", {}).get(dataset, {}).get(stage)
+            if not before or not before["p50_us"]:
+                continue
+            change = summary["p50_us"] / before["p50_us"] - 1
+            if change > threshold:
+                regressions.append(
+                    f"{dataset}/{stage}: p50 {before['p50_us']:.2f}us -> {summary['p50_us']:.2f}us ({change:+.0%})"
+                )
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Passes over every dataset")
+    arg_parser.add_argument("--size", type=int, default=2000, help="Equations per synthetic dataset")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--output", help="Write the JSON report to a file instead of stdout")
+    arg_parser.add_argument("--compare", metavar="BASELINE", help="JSON report to check for regressions")
+    arg_parser.add_argument("--threshold", type=float, default=0.2, help="Allowed p50 slowdown, 0.2 is 20%%")
+    args = arg_parser.parse_args()
+
+    datasets = {"quadratic-dataset": load_dataset(), **synthetic_datasets(args.seed, args.size)}
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": args.repeat,
+        },
+        "results": {name: run_stages(equations, args.repeat) for name, equations in datasets.items()},
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print("regression: " + regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
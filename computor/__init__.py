@@ -0,0 +1,8 @@
+def main(argv=None):
+    """Entry point of the console script.
+
+    Kept free of imports, so ``import computor`` costs nothing until the CLI runs.
+    """
+    from computor.computor import main as cli_main
+
+    cli_main(argv)
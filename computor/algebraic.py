@@ -0,0 +1,244 @@
+"""Exact numbers of the form p/q + (r/s)*sqrt(d), optionally with the imaginary unit.
+
+Roots of quadratic equations with integer coefficients are all of this form.
+They are kept as integers, normalized once (square-free radicand, reduced
+fractions, positive denominators) and only turned into text by ``str``.
+"""
+import math
+from typing import Tuple, Union
+
+from computor import stats
+from computor.factorization import square_free_decomposition
+
+
+class AlgebraicNumber:
+    """Immutable exact value ``numerator/denominator + (radical_numerator/radical_denominator)*sqrt(radicand)``.
+
+    With ``imaginary`` set, the radical part is multiplied by ``I``. Negative
+    radicands are turned into imaginary ones, rational values have a zero
+    radical part and a radicand of 1.
+    """
+
+    __slots__ = ("numerator", "denominator", "radical_numerator", "radical_denominator", "radicand", "imaginary")
+
+    def __init__(
+        self,
+        numerator: int = 0,
+        denominator: int = 1,
+        radical_numerator: int = 0,
+        radical_denominator: int = 1,
+        radicand: int = 1,
+        imaginary: bool = False,
+    ):
+        if radicand < 0:
+            # sqrt(-n) = sqrt(n)*I, and I*I = -1
+            radicand = -radicand
+            if imaginary:
+                radical_numerator = -radical_numerator
+            imaginary = not imaginary
+        if radicand > 1:
+            outside, radicand = square_free_decomposition(radicand)
+            radical_numerator *= outside
+        self._set(numerator, denominator, radical_numerator, radical_denominator, radicand, imaginary)
+
+    @classmethod
+    def _normalized(cls, numerator, denominator, radical_numerator, radical_denominator, radicand, imaginary):
+        """Build a number from parts whose radicand is already square-free."""
+        number = cls.__new__(cls)
+        number._set(numerator, denominator, radical_numerator, radical_denominator, radicand, imaginary)
+        return number
+
+    def _set(self, numerator, denominator, radical_numerator, radical_denominator, radicand, imaginary):
+        if denominator == 0 or radical_denominator == 0:
+            raise ZeroDivisionError("Division by zero")
+        if radical_numerator == 0 or radicand == 0:
+            radical_numerator, radical_denominator, radicand, imaginary = 0, 1, 1, False
+        elif radicand == 1 and not imaginary:
+            # a rational radical part belongs to the rational part
+            numerator = numerator * radical_denominator + radical_numerator * denominator
+            denominator *= radical_denominator
+            radical_numerator, radical_denominator = 0, 1
+        # reduce both fractions, keeping the sign in the numerators
+        divisor = math.gcd(numerator, denominator)
+        if denominator < 0:
+            divisor = -divisor
+        numerator, denominator = numerator // divisor, denominator // divisor
+        divisor = math.gcd(radical_numerator, radical_denominator)
+        if radical_denominator < 0:
+            divisor = -divisor
+        radical_numerator, radical_denominator = radical_numerator // divisor, radical_denominator // divisor
+        set_attribute = object.__setattr__
+        set_attribute(self, "numerator", numerator)
+        set_attribute(self, "denominator", denominator)
+        set_attribute(self, "radical_numerator", radical_numerator)
+        set_attribute(self, "radical_denominator", radical_denominator)
+        set_attribute(self, "radicand", radicand)
+        set_attribute(self, "imaginary", imaginary)
+
+    @classmethod
+    @stats.stage("algebraic.sqrt", lambda args, result: {"bits": abs(args[1]).bit_length()})
+    def sqrt(cls, number: int) -> "AlgebraicNumber":
+        """Exact square root of an integer, imaginary for negative numbers."""
+        return cls(radical_numerator=1, radicand=number)
+
+    @classmethod
+    @stats.stage("algebraic.quadratic_roots", lambda args, result: {"bits": abs(args[2]).bit_length()})
+    def quadratic_roots(
+        cls, numerator: int, radicand: int, denominator: int
+    ) -> Tuple["AlgebraicNumber", "AlgebraicNumber"]:
+        """Exact (numerator + sqrt(radicand)) / denominator and (numerator - sqrt(radicand)) / denominator.
+
+        The radicand is decomposed once for both numbers.
+        """
+        imaginary = radicand < 0
+        outside, radicand = square_free_decomposition(-radicand if imaginary else radicand)
+        return (
+            cls._normalized(numerator, denominator, outside, denominator, radicand, imaginary),
+            cls._normalized(numerator, denominator, -outside, denominator, radicand, imaginary),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def is_rational(self) -> bool:
+        return self.radical_numerator == 0
+
+    def conjugate(self) -> "AlgebraicNumber":
+        """Returns p/q - (r/s)*sqrt(d), the other root of the same quadratic equation."""
+        return self._normalized(
+            self.numerator,
+            self.denominator,
+            -self.radical_numerator,
+            self.radical_denominator,
+            self.radicand,
+            self.imaginary,
+        )
+
+    def __neg__(self) -> "AlgebraicNumber":
+        return self._normalized(
+            -self.numerator,
+            self.denominator,
+            -self.radical_numerator,
+            self.radical_denominator,
+            self.radicand,
+            self.imaginary,
+        )
+
+    def __add__(self, other: Union["AlgebraicNumber", int]) -> "AlgebraicNumber":
+        if isinstance(other, int):
+            other = self._normalized(other, 1, 0, 1, 1, False)
+        elif not isinstance(other, AlgebraicNumber):
+            return NotImplemented
+        if other.is_rational:
+            radical = self
+        elif self.is_rational:
+            radical = other
+        elif (self.radicand, self.imaginary) == (other.radicand, other.imaginary):
+            radical = None
+        else:
+            raise ValueError("Cannot add numbers with different radicals exactly.")
+        if radical is None:
+            radical_numerator = (
+                self.radical_numerator * other.radical_denominator
+                + other.radical_numerator * self.radical_denominator
+            )
+            radical_denominator = self.radical_denominator * other.radical_denominator
+        else:
+            radical_numerator, radical_denominator = radical.radical_numerator, radical.radical_denominator
+        return self._normalized(
+            self.numerator * other.denominator + other.numerator * self.denominator,
+            self.denominator * other.denominator,
+            radical_numerator,
+            radical_denominator,
+            self.radicand if radical is None else radical.radicand,
+            self.imaginary if radical is None else radical.imaginary,
+        )
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["AlgebraicNumber", int]) -> "AlgebraicNumber":
+        if not isinstance(other, (AlgebraicNumber, int)):
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other: int) -> "AlgebraicNumber":
+        return -self + other
+
+    def __mul__(self, other: int) -> "AlgebraicNumber":
+        if not isinstance(other, int):
+            return NotImplemented
+        return self._normalized(
+            self.numerator * other,
+            self.denominator,
+            self.radical_numerator * other,
+            self.radical_denominator,
+            self.radicand,
+            self.imaginary,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: int) -> "AlgebraicNumber":
+        if not isinstance(other, int):
+            return NotImplemented
+        return self._normalized(
+            self.numerator,
+            self.denominator * other,
+            self.radical_numerator,
+            self.radical_denominator * other,
+            self.radicand,
+            self.imaginary,
+        )
+
+    def _key(self):
+        return (
+            self.numerator,
+            self.denominator,
+            self.radical_numerator,
+            self.radical_denominator,
+            self.radicand,
+            self.imaginary,
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, int):
+            return self.is_rational and self.denominator == 1 and self.numerator == other
+        if not isinstance(other, AlgebraicNumber):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        if self.is_rational and self.denominator == 1:
+            return hash(self.numerator)
+        return hash(self._key())
+
+    def __complex__(self) -> complex:
+        radical = self.radical_numerator / self.radical_denominator * self.radicand**0.5
+        rational = self.numerator / self.denominator
+        return complex(rational, radical) if self.imaginary else complex(rational + radical, 0)
+
+    def __float__(self) -> float:
+        if self.imaginary:
+            raise TypeError("Cannot convert an imaginary number to float.")
+        return complex(self).real
+
+    def __str__(self):
+        """Render like "1/2 + 3*sqrt(5)/2", "-sqrt(2)*I" or "7/3"."""
+        rational = str(self.numerator) if self.denominator == 1 else f"{self.numerator}/{self.denominator}"
+        if self.is_rational:
+            return rational
+        radical = "sqrt(" + str(self.radicand) + ")" if self.radicand != 1 else ""
+        if self.imaginary:
+            radical = radical + "*I" if radical else "I"
+        coefficient = abs(self.radical_numerator)
+        if coefficient != 1:
+            radical = f"{coefficient}*{radical}"
+        if self.radical_denominator != 1:
+            radical = f"{radical}/{self.radical_denominator}"
+        if self.numerator == 0:
+            return "-" + radical if self.radical_numerator < 0 else radical
+        return f"{rational} {'-' if self.radical_numerator < 0 else '+'} {radical}"
+
+    def __repr__(self):
+        return f"AlgebraicNumber({str(self)!r})"
@@ -0,0 +1,290 @@
+"""Exact arithmetic on integer coefficients, behind the ``Polynomial`` operators.
+
+Dense coefficient lists are indexed by degree, lowest first. Products pick a
+strategy by size:
+
+- schoolbook multiplication for short operands,
+- NumPy convolution when every partial sum provably fits into an int64,
+- Karatsuba multiplication otherwise (large degrees with big coefficients).
+
+Sparse operands, mappings of degree to coefficient with few terms compared
+to their degree (``X^1000 + 1``), are multiplied term by term instead of
+being expanded. ``benchmarks/bench_arithmetic.py`` compares the strategies.
+
+``square_free_factors`` splits a polynomial into factors without repeated
+roots (Yun's algorithm over exact gcds), so numeric root finding only ever
+sees simple roots.
+"""
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# below this length, splitting costs more than it saves
+KARATSUBA_THRESHOLD = 32
+# below this length, the conversion to arrays costs more than it saves
+NUMPY_THRESHOLD = 8
+# bits available to partial sums of an int64 convolution
+INT64_BITS = 63
+# a polynomial without common factor with its derivative modulo this prime is square-free,
+# products of two residues fit into an int64
+SQUARE_FREE_PRIME = 2**31 - 1
+
+MULTIPLY_METHODS = ("schoolbook", "karatsuba", "numpy")
+
+
+def add(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    if len(a) < len(b):
+        a, b = b, a
+    result = list(a)
+    for degree, coefficient in enumerate(b):
+        result[degree] += coefficient
+    return result
+
+
+def subtract(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    return add(a, [-coefficient for coefficient in b])
+
+
+def multiply_schoolbook(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    if not a or not b:
+        return []
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b, start=i):
+                result[j] += x * y
+    return result
+
+
+def multiply_karatsuba(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    if len(a) < KARATSUBA_THRESHOLD or len(b) < KARATSUBA_THRESHOLD:
+        return multiply_schoolbook(a, b)
+    if len(a) < len(b):
+        a, b = b, a
+    length = len(a) + len(b) - 1
+    half = (len(a) + 1) // 2
+    if len(b) <= half:
+        # unbalanced: multiply b with both halves of a
+        low, high = multiply_karatsuba(a[:half], b), multiply_karatsuba(a[half:], b)
+        result = low + [0] * (length - len(low))
+        for degree, coefficient in enumerate(high, start=half):
+            result[degree] += coefficient
+        return result
+    a0, a1, b0, b1 = a[:half], a[half:], b[:half], b[half:]
+    z0 = multiply_karatsuba(a0, b0)
+    z2 = multiply_karatsuba(a1, b1)
+    z1 = multiply_karatsuba(add(a0, a1), add(b0, b1))
+    # room for the middle product, whose top coefficients are zero
+    result = [0] * max(length, half + len(z1))
+    for degree, coefficient in enumerate(z0):
+        result[degree] += coefficient
+        result[degree + half] -= coefficient
+    for degree, coefficient in enumerate(z2):
+        result[degree + 2 * half] += coefficient
+        result[degree + half] -= coefficient
+    for degree, coefficient in enumerate(z1, start=half):
+        result[degree] += coefficient
+    del result[length:]
+    return result
+
+
+def multiply_numpy(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Product through ``numpy.convolve`` on int64 arrays.
+
+    :raises OverflowError: If the coefficients are too large for an exact int64 result.
+    """
+    if not a or not b:
+        return []
+    if not fits_int64(a, b):
+        raise OverflowError("Coefficients are too large for an exact int64 convolution.")
+    import numpy as np
+
+    return np.convolve(np.array(a, dtype=np.int64), np.array(b, dtype=np.int64)).tolist()
+
+
+def fits_int64(a: Sequence[int], b: Sequence[int]) -> bool:
+    """Whether every coefficient of the product a*b, and every partial sum, fits into an int64."""
+    bits = max(abs(x) for x in a).bit_length() + max(abs(y) for y in b).bit_length()
+    return bits + min(len(a), len(b)).bit_length() < INT64_BITS
+
+
+def multiply(a: Sequence[int], b: Sequence[int], method: Optional[str] = None) -> List[int]:
+    """Product of two dense coefficient lists.
+
+    :param method: One of ``MULTIPLY_METHODS``, chosen by size when None.
+    """
+    if method is None:
+        shorter = min(len(a), len(b))
+        if shorter < NUMPY_THRESHOLD:
+            method = "schoolbook"
+        elif fits_int64(a, b):
+            method = "numpy"
+        else:
+            method = "karatsuba"
+    if method == "schoolbook":
+        return multiply_schoolbook(a, b)
+    if method == "karatsuba":
+        return multiply_karatsuba(a, b)
+    if method == "numpy":
+        return multiply_numpy(a, b)
+    raise ValueError(f'Unknown multiplication method "{method}".')
+
+
+def multiply_mappings(a: Dict[int, int], b: Dict[int, int]) -> Dict[int, int]:
+    """Product of two sparse mappings of degree to coefficient, without zero coefficients."""
+    a = {degree: coefficient for degree, coefficient in a.items() if coefficient}
+    b = {degree: coefficient for degree, coefficient in b.items() if coefficient}
+    if not a or not b:
+        return {}
+    dense_a, dense_b = max(a) + 1, max(b) + 1
+    if len(a) * len(b) * 4 <= dense_a * dense_b:
+        # mostly empty, term by term is cheaper than expanding the gaps
+        result = {}
+        for x_degree, x in a.items():
+            for y_degree, y in b.items():
+                degree = x_degree + y_degree
+                result[degree] = result.get(degree, 0) + x * y
+        return {degree: result[degree] for degree in sorted(result) if result[degree]}
+    return to_mapping(multiply(to_list(a), to_list(b)))
+
+
+def power_mapping(a: Dict[int, int], exponent: int) -> Dict[int, int]:
+    """``a`` raised to a non-negative integer power by repeated squaring."""
+    if exponent < 0:
+        raise ValueError("Exponent must be a non-negative integer.")
+    result = {0: 1}
+    while exponent:
+        if exponent & 1:
+            result = multiply_mappings(result, a)
+        exponent >>= 1
+        if exponent:
+            a = multiply_mappings(a, a)
+    return result
+
+
+def to_list(coefficients: Dict[int, int]) -> List[int]:
+    dense = [0] * (max(coefficients, default=-1) + 1)
+    for degree, coefficient in coefficients.items():
+        dense[degree] = coefficient
+    return dense
+
+
+def to_mapping(coefficients) -> Dict[int, int]:
+    return {degree: coefficient for degree, coefficient in enumerate(coefficients) if coefficient}
+
+
+def derivative(a: Sequence[int]) -> List[int]:
+    return [degree * coefficient for degree, coefficient in enumerate(a)][1:]
+
+
+def trim(a: Sequence[int]) -> List[int]:
+    """Drops the zero coefficients of the highest degrees."""
+    a = list(a)
+    while a and a[-1] == 0:
+        a.pop()
+    return a
+
+
+def primitive(a: Sequence[int]) -> List[int]:
+    """``a`` divided by the gcd of its coefficients, with a positive leading coefficient."""
+    a = trim(a)
+    if not a:
+        return a
+    content = math.gcd(*a)
+    if a[-1] < 0:
+        content = -content
+    return [coefficient // content for coefficient in a]
+
+
+def divide_exact(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Quotient of a by b, which must divide it with integer coefficients.
+
+    :raises ValueError: If the division leaves a remainder or a fraction.
+    """
+    a, b = trim(a), trim(b)
+    if not b:
+        raise ValueError("Division by zero")
+    remainder = list(a)
+    quotient = [0] * max(len(a) - len(b) + 1, 0)
+    for shift in range(len(quotient) - 1, -1, -1):
+        coefficient, rest = divmod(remainder[shift + len(b) - 1], b[-1])
+        if rest:
+            raise ValueError("Polynomial division is not exact.")
+        quotient[shift] = coefficient
+        if coefficient:
+            for degree, y in enumerate(b, start=shift):
+                remainder[degree] -= coefficient * y
+    if any(remainder):
+        raise ValueError("Polynomial division is not exact.")
+    return quotient
+
+
+def gcd(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Primitive greatest common divisor of two integer polynomials, by primitive pseudo-remainders."""
+    a, b = primitive(a), primitive(b)
+    if len(a) < len(b):
+        a, b = b, a
+    while b:
+        # pseudo-remainder: scale by the leading coefficient of b instead of dividing
+        remainder = list(a)
+        while len(remainder) >= len(b):
+            leading, shift = remainder[-1], len(remainder) - len(b)
+            remainder = [coefficient * b[-1] for coefficient in remainder]
+            for degree, y in enumerate(b, start=shift):
+                remainder[degree] -= leading * y
+            remainder = trim(remainder)
+        a, b = b, primitive(remainder)
+    return a
+
+
+def is_square_free_modular(a: Sequence[int], prime: int = SQUARE_FREE_PRIME) -> bool:
+    """Quick sufficient test: True proves a has no repeated factor, False is inconclusive.
+
+    Runs Euclid's algorithm on a and its derivative modulo a prime, in
+    machine-sized numbers however large the coefficients are.
+    """
+    a = trim(a)
+    if len(a) < 3:
+        return True
+    if a[-1] % prime == 0:
+        return False
+    import numpy as np
+
+    f = np.array([coefficient % prime for coefficient in a], dtype=np.int64)
+    g = np.array(trim(coefficient % prime for coefficient in derivative(a)), dtype=np.int64)
+    while len(g):
+        inverse = pow(int(g[-1]), -1, prime)
+        while len(f) >= len(g):
+            factor, shift = int(f[-1]) * inverse % prime, len(f) - len(g)
+            f[shift:] = (f[shift:] - factor * g) % prime
+            f = np.trim_zeros(f, "b")
+        f, g = g, f
+    return len(f) == 1
+
+
+def square_free_factors(a: Sequence[int]) -> List[Tuple[List[int], int]]:
+    """Split a into (factor, multiplicity) pairs with a = c * product of factor^multiplicity.
+
+    Factors are primitive, have no repeated roots and no common roots, and
+    constant factors are left out. Uses Yun's algorithm on exact gcds.
+    """
+    a = primitive(a)
+    if len(a) < 2:
+        return []
+    if is_square_free_modular(a):
+        return [(a, 1)]
+    factors = []
+    da = derivative(a)
+    c = gcd(a, da)
+    w = divide_exact(a, c)
+    y = divide_exact(da, c)
+    z = subtract(y, derivative(w))
+    multiplicity = 1
+    while len(w) > 1:
+        g = gcd(w, z)
+        if len(g) > 1:
+            factors.append((g, multiplicity))
+        w = divide_exact(w, g)
+        y = divide_exact(z, g)
+        z = subtract(y, derivative(w))
+        multiplicity += 1
+    return factors
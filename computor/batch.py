@@ -0,0 +1,295 @@
+import csv
+import itertools
+import json
+import mmap
+import os
+import stat
+import struct
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from computor import stats
+from computor.cache import LRUCache
+from computor.lexer import ParseResult, validate
+from computor.polynominal import PolynomParser, PolynomialFactory
+from computor.solution import DEFAULT_MAX_ROOTS, RECORD_FIELDS, Solution, array_dtype, solve, to_array
+
+NPY_BLOCK_SIZE = 4096
+
+
+def read_lines(stream: TextIO, field: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, equation) pairs from a stream with one equation per line.
+
+    Blank lines are skipped, but still counted, so line numbers match the source.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+def read_csv(stream: TextIO, field: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+    """Yield (row number, equation) pairs from a CSV stream with a header row."""
+    field = field or "Equation"
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None or field not in reader.fieldnames:
+        raise ValueError(f'CSV input has no "{field}" column.')
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, row[field]
+
+
+def read_jsonl(stream: TextIO, field: Optional[str] = None) -> Iterator[Tuple[int, Any]]:
+    """Yield (line number, equation) pairs from a stream of JSON objects, one per line.
+
+    Lines that are not valid JSON objects are passed on as they are, so they
+    are reported as errors for that line only.
+    """
+    field = field or "equation"
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            document = json.loads(line)
+        except json.JSONDecodeError:
+            yield line_number, line
+            continue
+        if isinstance(document, dict):
+            yield line_number, document.get(field)
+        else:
+            yield line_number, document
+
+
+def read_mapped_lines(path: str, field: Optional[str] = None) -> Iterator[Tuple[int, bytes]]:
+    """Yield (line number, equation bytes) pairs from a file with one equation per line.
+
+    The file is memory-mapped and split on the raw bytes, so no line is decoded
+    and memory does not grow with the file size. The factory parses ASCII lines
+    as bytes and decodes the others. Blank lines are skipped, but still counted.
+    Pipes and other files that cannot be mapped are read line by line instead.
+    The file is opened right away, so a missing file is reported by this call.
+    """
+    file = open(path, "rb")
+    try:
+        status = os.fstat(file.fileno())
+        # an empty file cannot be mapped either
+        mappable = stat.S_ISREG(status.st_mode) and status.st_size
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if mappable else None
+    except BaseException:
+        file.close()
+        raise
+    return _mapped_lines(file, data)
+
+
+def _mapped_lines(file, data: Optional[mmap.mmap]) -> Iterator[Tuple[int, bytes]]:
+    try:
+        read_line = data.readline if data is not None else file.readline
+        for line_number, line in enumerate(iter(read_line, b""), start=1):
+            if line.strip():
+                yield line_number, line
+    finally:
+        if data is not None:
+            data.close()
+        file.close()
+
+
+READERS = {
+    "lines": read_lines,
+    "csv": read_csv,
+    "jsonl": read_jsonl,
+}
+
+
+def deduplicate(solution: Solution, canonical_cache: LRUCache) -> Solution:
+    """Take the roots of the solution from the canonical polynomial shared with its duplicates.
+
+    ``canonical_cache`` maps ``Polynomial.canonical_key`` to the canonical
+    polynomial, whose roots and solution string are computed once for all
+    the equations equal up to a constant factor. Counts ``batch.canonical``
+    for new keys and ``batch.duplicates`` for the others.
+    """
+    if solution.polynomial is None:
+        return solution
+    key = solution.polynomial.canonical_key()
+    canonical = canonical_cache.get(key)
+    if canonical is None:
+        canonical = solution.polynomial.canonical()
+        canonical_cache.put(key, canonical)
+        stats.count("batch.canonical")
+    else:
+        stats.count("batch.duplicates")
+    solution.solved = canonical
+    return solution
+
+
+def solve_record(
+    factory: PolynomialFactory,
+    line: int,
+    equation: Any,
+    fields: Sequence[str] = RECORD_FIELDS,
+    canonical_cache: Optional[LRUCache] = None,
+) -> Dict[str, Any]:
+    """Solve a single equation and describe the outcome as a flat record.
+
+    Errors raised while parsing or solving the equation are stored in the
+    ``error`` field instead of being propagated. Only the requested fields are
+    computed, see ``Solution.to_record``.
+
+    :param canonical_cache: Cache of canonical polynomials to share the roots
+        with equal equations up to a constant factor, see ``deduplicate``.
+    """
+    solution = solve(factory, equation, line)
+    if canonical_cache is not None:
+        deduplicate(solution, canonical_cache)
+    record = solution.to_record(fields)
+    if solution.error is not None or record.get("error") is not None:
+        stats.count("batch.errors")
+    stats.count("batch.records")
+    return record
+
+
+def solve_stream(
+    equations: Iterable[Tuple[int, Any]], factory: Optional[PolynomialFactory] = None, dedup_size: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """Lazily solve (line number, equation) pairs through one long-lived factory.
+
+    :param dedup_size: Number of canonical polynomials to remember, equations
+        equal up to a constant factor to one of them are not solved again.
+        0 disables the deduplication, see ``deduplicate``.
+    """
+    if factory is None:
+        factory = PolynomialFactory(PolynomParser())
+    canonical_cache = LRUCache(dedup_size) if dedup_size else None
+    for line, equation in equations:
+        yield solve_record(factory, line, equation, canonical_cache=canonical_cache)
+
+
+def solve_solutions(
+    equations: Iterable[Tuple[int, Any]], factory: Optional[PolynomialFactory] = None, dedup_size: int = 0
+) -> Iterator[Solution]:
+    """Like ``solve_stream``, yielding Solution objects that render nothing until asked to."""
+    if factory is None:
+        factory = PolynomialFactory(PolynomParser())
+    canonical_cache = LRUCache(dedup_size) if dedup_size else None
+    for line, equation in equations:
+        solution = solve(factory, equation, line)
+        if canonical_cache is not None:
+            deduplicate(solution, canonical_cache)
+        if solution.error is not None:
+            stats.count("batch.errors")
+        stats.count("batch.records")
+        yield solution
+
+
+def validate_stream(equations: Iterable[Tuple[int, Any]]) -> Iterator[Tuple[int, Any, ParseResult]]:
+    """Lazily check the syntax of (line number, equation) pairs, yielding (line number, equation, result).
+
+    Nothing is raised or caught for invalid equations and no message is built,
+    see ``computor.lexer.validate``: the result holds the error code and position.
+    """
+    for line, equation in equations:
+        yield line, equation, validate(equation)
+
+
+def split_valid(
+    equations: Iterable[Tuple[int, Any]],
+) -> Tuple[List[Tuple[int, Any]], List[Tuple[int, Any, ParseResult]]]:
+    """Separate syntactically valid equations from invalid ones, at about the speed of the lexer.
+
+    The valid (line number, equation) pairs can be passed on to ``solve_solutions``,
+    the invalid ones come with their ParseResult. Limits checked while solving,
+    like the highest supported degree, are not checked here.
+    """
+    valid, invalid = [], []
+    for line, equation in equations:
+        result = validate(equation)
+        if result.code:
+            invalid.append((line, equation, result))
+        else:
+            valid.append((line, equation))
+    return valid, invalid
+
+
+def solve_file(path: str, factory: Optional[PolynomialFactory] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily solve a file with one equation per line, see ``read_mapped_lines``."""
+    return solve_stream(read_mapped_lines(path), factory)
+
+
+def write_jsonl(
+    records: Iterable[Union[Dict[str, Any], Solution]], stream: TextIO, fields: Optional[Sequence[str]] = None
+) -> int:
+    """Write records or solutions as JSON lines. Returns the number of records written.
+
+    :param fields: Record fields to write, all of ``RECORD_FIELDS`` by default.
+        Solutions only compute these fields.
+    """
+    count = 0
+    for record in records:
+        stream.write(json.dumps(_as_record(record, fields)) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(
+    records: Iterable[Union[Dict[str, Any], Solution]], stream: TextIO, fields: Optional[Sequence[str]] = None
+) -> int:
+    """Write records or solutions as CSV with a header row. Returns the number of records written."""
+    writer = csv.DictWriter(stream, fieldnames=fields or RECORD_FIELDS)
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(_as_record(record, fields))
+        count += 1
+    return count
+
+
+def write_npy(solutions: Iterable[Solution], stream: BinaryIO, max_roots: int = DEFAULT_MAX_ROOTS) -> int:
+    """Write solutions as a NumPy ``.npy`` file of ``solution.array_dtype`` rows, loadable with ``numpy.load``.
+
+    Rows are converted and written in blocks, and the row count is filled into
+    the header at the end, so memory stays flat but the stream must be
+    seekable. Returns the number of rows written.
+    """
+    if not stream.seekable():
+        raise ValueError("NPY output needs a seekable file.")
+    dtype = array_dtype(max_roots)
+    start = stream.tell()
+    stream.write(_npy_header(dtype, 0))
+    count = 0
+    solutions = iter(solutions)
+    while True:
+        block = to_array(itertools.islice(solutions, NPY_BLOCK_SIZE), max_roots)
+        if not len(block):
+            break
+        stream.write(block.tobytes())
+        count += len(block)
+    end = stream.tell()
+    stream.seek(start)
+    stream.write(_npy_header(dtype, count))
+    stream.seek(end)
+    return count
+
+
+def _npy_header(dtype, count: int) -> bytes:
+    """Version 1.0 ``.npy`` header, the same length for any row count."""
+    from numpy.lib.format import dtype_to_descr
+
+    shape = f"({count},)".ljust(24)
+    header = f"{{'descr': {dtype_to_descr(dtype)!r}, 'fortran_order': False, 'shape': {shape}}}"
+    # magic, version and length take 10 bytes, the data starts 64 byte aligned
+    header += " " * (-(10 + len(header) + 1) % 64) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def _as_record(record: Union[Dict[str, Any], Solution], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    if isinstance(record, Solution):
+        return record.to_record(fields or RECORD_FIELDS)
+    if fields is None:
+        return record
+    return {field: record.get(field) for field in fields}
+
+
+WRITERS = {
+    "jsonl": write_jsonl,
+    "csv": write_csv,
+    "npy": write_npy,
+}
+# writers taking a fields argument and text streams
+TEXT_WRITERS = ("jsonl", "csv")
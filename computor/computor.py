@@ -1,24 +1,134 @@
-import argparse
+import sys
+
+from computor import stats
 from computor.polynominal import PolynomParser, PolynomialFactory
 
+# The CLI is called in tight shell loops: modules only needed by the batch,
+# parallel and service modes (argparse, csv, json, asyncio, multiprocessing)
+# are imported when the mode is used.
+
 
 def init_argparse():
+    import argparse
+
+    from computor.batch import READERS, WRITERS
+
     parser = argparse.ArgumentParser(
         prog="ft_computor_v1",
-        description="program that solves a polynomial second or lower degree equation.",
+        description="program that solves a polynomial equation, exactly up to the second degree.",
     )
-    parser.add_argument("equation", type=str, help="An equation to solve")
+    parser.add_argument("equation", type=str, nargs="?", help="An equation to solve")
     parser.add_argument("-v", "--verbose", action="store_true", help="Print additional information")
+    parser.add_argument(
+        "-i", "--input", metavar="FILE", help="Solve every equation from FILE ('-' for stdin)"
+    )
+    parser.add_argument(
+        "--input-format", choices=sorted(READERS), default="lines", help="Format of the batch input"
+    )
+    parser.add_argument(
+        "--field", help="CSV column or JSONL field holding the equation (Equation / equation)"
+    )
+    parser.add_argument(
+        "-o", "--output", metavar="FILE", default="-", help="Write batch results to FILE ('-' for stdout)"
+    )
+    parser.add_argument(
+        "--output-format", choices=sorted(WRITERS), default="jsonl", help="Format of the batch results"
+    )
+    parser.add_argument(
+        "--fields",
+        metavar="NAMES",
+        help="Comma separated record fields of jsonl/csv results, e.g. line,degree,roots (all but roots by default)",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=0, metavar="N", help="Reuse results of the last N distinct equations"
+    )
+    parser.add_argument(
+        "--dedup",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Solve batch equations equal up to a constant factor once, among the last N distinct ones",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Solve batch input on N processes, 0 for one per CPU",
+    )
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Run the --workers as threads sharing one factory, for free-threaded Python builds",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help="Serve line-delimited JSON requests on HOST:PORT or unix:PATH",
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Print time spent and input sizes per stage to stderr"
+    )
     return parser
 
 
-def main():
-    polynomial_factory = PolynomialFactory(PolynomParser())
-    arg_parser = init_argparse()
-    args = arg_parser.parse_args()
+def open_stream(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def solve_batch(args, polynomial_factory):
+    """Stream equations from the batch input to the batch output, one record per equation."""
+    from computor.batch import READERS, RECORD_FIELDS, TEXT_WRITERS, WRITERS, read_mapped_lines, solve_solutions
+
+    if args.input_format == "lines" and args.input != "-":
+        # files of plain lines are memory-mapped and parsed as bytes
+        input_stream = None
+        equations = read_mapped_lines(args.input)
+    else:
+        input_stream = open_stream(args.input, "r")
+        equations = READERS[args.input_format](input_stream, args.field)
+    text_output = args.output_format in TEXT_WRITERS
+    output_stream = open_stream(args.output, "w") if text_output else open(args.output, "wb")
+    try:
+        if args.workers == 1:
+            # strings are only rendered for the fields that are written
+            records = solve_solutions(equations, polynomial_factory, dedup_size=args.dedup)
+        elif args.threads:
+            from computor.parallel import solve_threaded
+
+            records = solve_threaded(
+                equations,
+                args.workers or None,
+                factory=polynomial_factory,
+                fields=args.fields or RECORD_FIELDS,
+                dedup_size=args.dedup,
+            )
+        else:
+            from computor.parallel import solve_parallel
+
+            records = solve_parallel(
+                equations,
+                args.workers or None,
+                cache_size=args.cache_size,
+                fields=args.fields or RECORD_FIELDS,
+                dedup_size=args.dedup,
+            )
+        if text_output:
+            WRITERS[args.output_format](records, output_stream, args.fields)
+        else:
+            WRITERS[args.output_format](records, output_stream)
+    finally:
+        for stream in (input_stream, output_stream):
+            if stream not in (None, sys.stdin, sys.stdout):
+                stream.close()
+
+
+def solve_single(equation, verbose, polynomial_factory):
     try:
-        polynomial = polynomial_factory.create(args.equation)
-        if args.verbose:
+        polynomial = polynomial_factory.create(equation)
+        if verbose:
             print("Reduced form: ", polynomial.get_reduced_form())
             print("Polynomial degree: ", polynomial.degree)
             if polynomial.degree == 2:
@@ -29,5 +139,59 @@ def main():
         print("Error: " + str(e))
 
 
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        # a plain equation, nothing for argparse to do
+        solve_single(argv[0], False, PolynomialFactory(PolynomParser()))
+        return
+    arg_parser = init_argparse()
+    args = arg_parser.parse_args(argv)
+    if sum(option is not None for option in (args.equation, args.input, args.serve)) != 1:
+        arg_parser.error("exactly one of an equation, --input or --serve is required")
+    if args.cache_size < 0:
+        arg_parser.error("--cache-size must not be negative")
+    if args.dedup < 0:
+        arg_parser.error("--dedup must not be negative")
+    if args.workers < 0:
+        arg_parser.error("--workers must not be negative")
+    if args.fields is not None:
+        from computor.solution import EXTRA_FIELDS, RECORD_FIELDS
+
+        args.fields = tuple(field.strip() for field in args.fields.split(","))
+        unknown = [field for field in args.fields if field not in RECORD_FIELDS + EXTRA_FIELDS]
+        if unknown:
+            arg_parser.error(f"unknown --fields: {', '.join(unknown)}")
+    if args.output_format == "npy" and (args.output == "-" or args.workers != 1):
+        arg_parser.error("npy output needs --output FILE and --workers 1")
+    if args.stats:
+        stats.enable()
+    polynomial_factory = PolynomialFactory(PolynomParser(), cache_size=args.cache_size)
+    try:
+        if args.serve is not None:
+            import asyncio
+
+            from computor.server import serve
+
+            try:
+                asyncio.run(serve(args.serve, factory=polynomial_factory))
+            except KeyboardInterrupt:
+                pass
+            except (OSError, ValueError) as e:
+                print("Error: " + str(e), file=sys.stderr)
+                sys.exit(1)
+        elif args.input is not None:
+            try:
+                solve_batch(args, polynomial_factory)
+            except (OSError, ValueError) as e:
+                print("Error: " + str(e), file=sys.stderr)
+                sys.exit(1)
+        else:
+            solve_single(args.equation, args.verbose, polynomial_factory)
+    finally:
+        if args.stats:
+            print(stats.format_summary(), file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,208 @@
+"""Integer factorization for arbitrary size Python ints.
+
+Small factors are stripped with a table of primes built by a sieve, the rest
+is split with Pollard's rho (Brent's variant) and checked with Miller-Rabin.
+"""
+import functools
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+SIEVE_LIMIT = 1 << 12
+# Miller-Rabin with these bases is deterministic below 3.3 * 10^24
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+# rho steps spent on a square-free decomposition before giving up on a cofactor
+SQUARE_FREE_RHO_BUDGET = 1 << 13
+
+
+@functools.lru_cache(maxsize=None)
+def small_primes() -> List[int]:
+    """Returns all primes below SIEVE_LIMIT, sieved on first use."""
+    sieve = bytearray([1]) * SIEVE_LIMIT
+    sieve[0:2] = b"\x00\x00"
+    for number in range(2, math.isqrt(SIEVE_LIMIT - 1) + 1):
+        if sieve[number]:
+            sieve[number * number :: number] = bytes(len(range(number * number, SIEVE_LIMIT, number)))
+    return [number for number in range(SIEVE_LIMIT) if sieve[number]]
+
+
+def is_prime(number: int) -> bool:
+    """Miller-Rabin primality test, exact for numbers below 3.3 * 10^24."""
+    if number < 2:
+        return False
+    for prime in MILLER_RABIN_BASES:
+        if number % prime == 0:
+            return number == prime
+    odd, shift = number - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        shift += 1
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, odd, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(shift - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_rho(number: int, max_steps: Optional[int] = None) -> Optional[int]:
+    """Find a non-trivial divisor of a composite number with Brent's variant of Pollard's rho.
+
+    Returns None if no divisor was found within max_steps iterations.
+    """
+    if number % 2 == 0:
+        return 2
+    # only large inputs get here, keep random out of the CLI start-up
+    import random
+
+    generator = random.Random(number)
+    steps = 0
+    while max_steps is None or steps < max_steps:
+        y = generator.randrange(1, number)
+        increment = generator.randrange(1, number)
+        batch = 128
+        divisor = cycle = product = 1
+        while divisor == 1:
+            if max_steps is not None and steps >= max_steps:
+                return None
+            steps += 2 * cycle
+            x = y
+            for _ in range(cycle):
+                y = (y * y + increment) % number
+            step = 0
+            while step < cycle and divisor == 1:
+                saved_y = y
+                for _ in range(min(batch, cycle - step)):
+                    y = (y * y + increment) % number
+                    product = product * abs(x - y) % number
+                divisor = math.gcd(product, number)
+                step += batch
+            cycle *= 2
+        if divisor == number:
+            # the batched gcd overshot, walk back one step at a time
+            divisor = 1
+            while divisor == 1:
+                saved_y = (saved_y * saved_y + increment) % number
+                divisor = math.gcd(abs(x - saved_y), number)
+        if divisor != number:
+            return divisor
+    return None
+
+
+def factorize(number: int) -> Dict[int, int]:
+    """Decompose a positive integer into a {prime: exponent} mapping.
+
+    Signs are ignored, 0 and 1 have no prime factors.
+    """
+    return partial_factorize(number)[0]
+
+
+def partial_factorize(number: int, max_steps: Optional[int] = None) -> Tuple[Dict[int, int], int]:
+    """Decompose a number as far as possible with at most max_steps rho iterations per split.
+
+    Returns the {prime: exponent} mapping and the product of the composite
+    cofactors that could not be split in time (1 for a complete factorization).
+    """
+    number = abs(number)
+    factors: Dict[int, int] = {}
+    cofactor = 1
+    if number < 2:
+        return factors, cofactor
+    for prime in small_primes():
+        if prime * prime > number:
+            break
+        if number % prime == 0:
+            exponent = 0
+            while number % prime == 0:
+                number //= prime
+                exponent += 1
+            factors[prime] = exponent
+    if number == 1:
+        return factors, cofactor
+
+    pending = [(number, 1)]
+    while pending:
+        number, multiplicity = pending.pop()
+        if number < SIEVE_LIMIT * SIEVE_LIMIT or is_prime(number):
+            # everything below the square of the sieve limit left here is prime
+            factors[number] = factors.get(number, 0) + multiplicity
+            continue
+        # rho is hopeless on prime powers, take their roots first
+        root, exponent = perfect_power(number)
+        if exponent > 1:
+            pending.append((root, multiplicity * exponent))
+            continue
+        divisor = pollard_rho(number, max_steps)
+        if divisor is None:
+            cofactor *= number**multiplicity
+            continue
+        pending.extend(((divisor, multiplicity), (number // divisor, multiplicity)))
+    return factors, cofactor
+
+
+def integer_root(number: int, exponent: int) -> int:
+    """Returns the largest integer r with r^exponent <= number, for a non-negative number."""
+    if exponent == 2:
+        return math.isqrt(number)
+    if number < 2:
+        return number
+    root = 1 << -(-number.bit_length() // exponent)
+    while True:
+        smaller = ((exponent - 1) * root + number // root ** (exponent - 1)) // exponent
+        if smaller >= root:
+            return root
+        root = smaller
+
+
+def perfect_power(number: int) -> Tuple[int, int]:
+    """Write a number without factors below SIEVE_LIMIT as root^exponent with the largest exponent."""
+    # every prime factor left is at least SIEVE_LIMIT, which bounds the exponent
+    max_exponent = number.bit_length() // (SIEVE_LIMIT.bit_length() - 1)
+    for exponent in small_primes():
+        if exponent > max_exponent:
+            break
+        root = integer_root(number, exponent)
+        if root**exponent == number:
+            inner_root, inner_exponent = perfect_power(root)
+            return inner_root, exponent * inner_exponent
+    return number, 1
+
+
+def prime_factors(number: int) -> Set[int]:
+    """Returns the set of distinct prime factors of a number."""
+    return set(factorize(number))
+
+
+@functools.lru_cache(maxsize=4096)
+def square_free_decomposition(number: int) -> Tuple[int, int]:
+    """Split a non-negative integer into (outside, inside) with number == outside^2 * inside.
+
+    ``sqrt(number) == outside * sqrt(inside)`` always holds, and ``inside`` is
+    square-free whenever ``number`` could be fully factored, giving the simplest
+    radical form. Results are cached per number.
+
+    Factoring is capped at SQUARE_FREE_RHO_BUDGET rho steps per split. A cofactor
+    that resists it stays inside the root unless it is a perfect square, so for
+    huge numbers ``inside`` may keep a square factor.
+    """
+    if number < 0:
+        raise ValueError("Cannot decompose a negative number.")
+    root = math.isqrt(number)
+    if root * root == number:
+        return root, 1
+    factors, cofactor = partial_factorize(number, SQUARE_FREE_RHO_BUDGET)
+    outside = inside = 1
+    for prime, exponent in factors.items():
+        outside *= prime ** (exponent // 2)
+        if exponent % 2:
+            inside *= prime
+    root = math.isqrt(cofactor)
+    if root * root == cofactor:
+        outside *= root
+    else:
+        inside *= cofactor
+    return outside, inside
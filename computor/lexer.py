@@ -0,0 +1,491 @@
+"""Single pass tokenizer turning an equation string into (coefficient, degree) pairs.
+
+The whole equation is normalized with one ``str.translate`` call and then
+scanned term by term with a single compiled pattern. Terms on the right side
+of ``=`` are emitted with their coefficient already negated, so the pairs can
+be reduced directly.
+
+Decimal coefficients like ``0.5`` are parsed straight into integers sharing
+one power of ten scale: ``0.5X^2 + 1.25 = 0`` becomes ``50X^2 + 125 = 0``
+with a scale of 2, an equivalent equation with the same roots.
+
+ASCII equations read as bytes (``tokenize_bytes``) are scanned the same way
+with a bytes pattern, without decoding them first.
+
+Invalid input is diagnosed on a separate slow path that reports the reason
+and the character position in the original string. ``try_tokenize`` and
+``validate`` report it as an ``ErrorCode`` and a position instead, without
+raising an exception or formatting a message.
+"""
+import enum
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+NORMALIZATION_TABLE = str.maketrans({" ": None, "\t": None, "\n": None, "x": "X", "²": "^2"})
+# the same for ASCII bytes, as a translation table and the deleted characters
+ASCII_NORMALIZATION_TABLE = bytes.maketrans(b"x", b"X")
+ASCII_DELETED = b" \t\n"
+ALLOWED_SYMBOLS = frozenset("0123456789X^+-*=.")
+SIGNS = ("+", "-")
+
+# sign, coefficient, "[*]X[^degree]" after a coefficient, degree, degree of a bare X;
+# only coefficients can be decimal
+TERM_PATTERN = re.compile(r"([+-]?)(?:([0-9]+(?:\.[0-9]+)?)(\*?X(?:\^([0-9]+))?)?|X(?:\^([0-9]+))?)")
+BYTES_TERM_PATTERN = re.compile(TERM_PATTERN.pattern.encode())
+# characters that end a term
+SEPARATOR_PATTERN = re.compile(r"[+\-=]")
+SIGN_PATTERN = re.compile(r"[+-]")
+# patterns of the errors found by diagnose, on normalized equations
+INVALID_CHARACTER_PATTERN = re.compile(r"[^0-9X^+\-*=.]")
+# "^" without a degree, with a decimal degree, or after a number that is not a degree itself
+INVALID_POWER_PATTERN = re.compile(r"(\^)(?![0-9])|(\^)[0-9]+\.|(?:^|(?<=[^0-9^]))[0-9]+(\^)")
+OPERATOR_SEQUENCE_PATTERN = re.compile(r"[+-](?=[+-]|$)")
+# characters whose normalization is not a single character
+RESIZED_PATTERN = re.compile("[ \t\n²]")
+
+
+class PolynomialSyntaxError(ValueError):
+    """Raised for invalid equations, keeps the offending position in the original string."""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(message)
+        self.position = position
+
+
+class ErrorCode(enum.IntEnum):
+    """Reason an equation is invalid, ``OK`` for valid ones."""
+
+    OK = 0
+    NOT_A_STRING = 1
+    INVALID_ENCODING = 2
+    INVALID_CHARACTERS = 3
+    EQUAL_SIGN = 4
+    POWER_NOTATION = 5
+    EMPTY_SIDE = 6
+    OPERATOR_SEQUENCE = 7
+    INVALID_TERM = 8
+    UNPARSABLE = 9
+
+
+# message of the equation errors, see diagnose
+REASONS = {
+    ErrorCode.NOT_A_STRING: "not a string",
+    ErrorCode.INVALID_ENCODING: "not valid UTF-8",
+    ErrorCode.INVALID_CHARACTERS: "contains invalid characters",
+    ErrorCode.EQUAL_SIGN: "'=' should be present exactly once",
+    ErrorCode.POWER_NOTATION: "contains invalid power notation",
+    ErrorCode.EMPTY_SIDE: "both sides of '=' should contain terms",
+    ErrorCode.OPERATOR_SEQUENCE: "contains invalid operator sequence",
+    ErrorCode.INVALID_TERM: "contains an invalid term",
+    ErrorCode.UNPARSABLE: "cannot be parsed",
+}
+
+
+class ParseResult(NamedTuple):
+    """Outcome of ``try_tokenize``: the terms and their scale, or where and why the equation is invalid.
+
+    ``position`` is the offset of the error in the original string, -1 for
+    valid equations. For bytes, it is the offset in the decoded string, or
+    the byte offset of an ``INVALID_ENCODING`` error.
+    """
+
+    code: ErrorCode
+    position: int
+    terms: Optional[list] = None
+    scale: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.code is ErrorCode.OK
+
+
+# result of validate for every valid equation
+VALID = ParseResult(ErrorCode.OK, -1)
+
+
+def tokenize(polynom_str: str) -> List[Tuple[int, int]]:
+    """Parse an equation into (coefficient, degree) pairs in the order of appearance.
+
+    Coefficients of the terms on the right side are negated, so the pairs
+    describe the equation moved to the ``... = 0`` form. Decimal coefficients
+    are multiplied by the power of ten of ``tokenize_scaled``.
+
+    :raises PolynomialSyntaxError: If the equation is invalid.
+    """
+    return tokenize_scaled(polynom_str)[0]
+
+
+def tokenize_scaled(polynom_str: str) -> Tuple[List[Tuple[int, int]], int]:
+    """Parse an equation into integer (coefficient, degree) pairs and their decimal scale.
+
+    Every coefficient is the real one multiplied by ``10 ** scale``, where the
+    scale is the longest fractional part among the decimal coefficients (0
+    without any).
+
+    :raises PolynomialSyntaxError: If the equation is invalid.
+    """
+    if not isinstance(polynom_str, str):
+        raise PolynomialSyntaxError("Invalid polynomial string to parse: not a string.", 0)
+    result = _scan_terms(polynom_str.strip().translate(NORMALIZATION_TABLE), TERM_PATTERN.match, ("=", ".", "-"))
+    if result is None:
+        raise diagnose(polynom_str)
+    return result
+
+
+def tokenize_bytes(data: bytes) -> Tuple[List[Tuple[int, int]], int]:
+    """Like ``tokenize_scaled`` for a UTF-8 encoded equation, e.g. a line of a file.
+
+    ASCII equations are parsed from the bytes directly, others, like ones
+    using ``²``, are decoded and parsed as a string.
+
+    :raises PolynomialSyntaxError: If the equation is invalid.
+    :raises UnicodeDecodeError: If the bytes are not valid UTF-8.
+    """
+    if not data.isascii():
+        return tokenize_scaled(data.decode())
+    text = data.strip().translate(ASCII_NORMALIZATION_TABLE, ASCII_DELETED)
+    result = _scan_terms(text, BYTES_TERM_PATTERN.match, (b"=", b".", b"-"))
+    if result is None:
+        # the string path reports the error
+        return tokenize_scaled(data.decode("ascii"))
+    return result
+
+
+def try_tokenize(polynom_str) -> ParseResult:
+    """Like ``tokenize_scaled``, and ``tokenize_bytes`` for bytes, reporting errors in the result.
+
+    No exception is raised or caught for valid and invalid strings and ASCII
+    bytes, and no error message is built: ``diagnose`` explains an error when
+    its message is needed.
+    """
+    text = None
+    if isinstance(polynom_str, str):
+        text = polynom_str.strip().translate(NORMALIZATION_TABLE)
+        result = _scan_terms(text, TERM_PATTERN.match, ("=", ".", "-"))
+    elif isinstance(polynom_str, bytes):
+        if not polynom_str.isascii():
+            try:
+                return try_tokenize(polynom_str.decode())
+            except UnicodeDecodeError as e:
+                return ParseResult(ErrorCode.INVALID_ENCODING, e.start)
+        text = polynom_str.strip().translate(ASCII_NORMALIZATION_TABLE, ASCII_DELETED)
+        result = _scan_terms(text, BYTES_TERM_PATTERN.match, (b"=", b".", b"-"))
+        if result is None:
+            # normalized the same way as the decoded string
+            polynom_str, text = polynom_str.decode("ascii"), text.decode("ascii")
+    else:
+        return ParseResult(ErrorCode.NOT_A_STRING, 0)
+    if result is None:
+        code, position, _ = _locate(polynom_str, text=text)
+        return ParseResult(code, position)
+    return ParseResult(ErrorCode.OK, -1, *result)
+
+
+def validate(polynom_str) -> ParseResult:
+    """Like ``try_tokenize``, without the terms: every valid equation gives ``VALID``."""
+    result = try_tokenize(polynom_str)
+    return VALID if result.code is ErrorCode.OK else result
+
+
+def _scan_terms(text, match, symbols) -> Optional[Tuple[List[Tuple[int, int]], int]]:
+    """Scan a normalized equation, str or bytes, returning None if it is invalid.
+
+    :param symbols: The equal sign, decimal point and minus sign of the text type.
+    """
+    equal, point, minus = symbols
+    equal_sign = text.find(equal)
+    if equal_sign <= 0 or text.find(equal, equal_sign + 1) != -1 or equal_sign == len(text) - 1:
+        return None
+
+    decimal = point in text
+    pairs = []
+    for start, end, side in ((0, equal_sign, 1), (equal_sign + 1, len(text), -1)):
+        position = start
+        while position < end:
+            term = match(text, position, end)
+            if term is None:
+                return None
+            sign, coefficient, variable, degree, power = term.groups()
+            if not sign and position != start:
+                return None
+            if coefficient is None:
+                coefficient, degree = 1, int(power) if power else 1
+            else:
+                if not decimal:
+                    coefficient = int(coefficient)
+                degree = (int(degree) if degree else 1) if variable else 0
+            if decimal:
+                # rescaled below, once the longest fraction is known
+                pairs.append((coefficient, -side if sign == minus else side, degree))
+            else:
+                pairs.append((-coefficient * side if sign == minus else coefficient * side, degree))
+            position = term.end()
+    if not decimal:
+        return pairs, 0
+    return _scale_decimals(pairs)
+
+
+def _scale_decimals(pairs) -> Tuple[List[Tuple[int, int]], int]:
+    """Turn (coefficient text or 1, sign, degree) triples into integers with a shared scale."""
+    parsed = []
+    scale = 0
+    for coefficient, sign, degree in pairs:
+        if coefficient == 1:
+            digits, fraction = 1, 0
+        else:
+            if isinstance(coefficient, bytes):
+                coefficient = coefficient.decode("ascii")
+            whole, _, fraction_digits = coefficient.partition(".")
+            fraction_digits = fraction_digits.rstrip("0")
+            digits, fraction = int(whole + fraction_digits), len(fraction_digits)
+            scale = max(scale, fraction)
+        parsed.append((sign * digits, fraction, degree))
+    return [(value * 10 ** (scale - fraction), degree) for value, fraction, degree in parsed], scale
+
+
+def tokenize_stream(chunks: Iterable[str]) -> Iterator[Tuple[int, int, int]]:
+    """Parse an equation given in pieces, yielding (coefficient, degree, scale) for every term.
+
+    Accepts the same equations as ``tokenize`` on ``"".join(chunks)``, but only
+    holds one chunk and one unfinished term at a time, and chunks may split the
+    equation anywhere. ``coefficient / 10 ** scale`` is the real coefficient of
+    the term, negated on the right side.
+
+    :raises PolynomialSyntaxError: When the first invalid part of the equation
+        is read, terms before it have already been yielded.
+    """
+    scanner = _StreamScanner()
+    for chunk in chunks:
+        yield from scanner.feed(chunk)
+    yield from scanner.finish()
+
+
+class _StreamScanner:
+    """State of ``tokenize_stream`` between chunks."""
+
+    def __init__(self):
+        # unconsumed input as received and normalized, and its offset in the whole input
+        self.original = ""
+        self.buffer = ""
+        self.offset = 0
+        self.started = False
+        self.side = 1
+        self.side_terms = 0
+
+    def feed(self, chunk: str) -> Iterator[Tuple[int, int, int]]:
+        if not isinstance(chunk, str):
+            raise PolynomialSyntaxError("Invalid polynomial string to parse: not a string.", self.offset)
+        if not self.started:
+            # like str.strip() at the start of the equation
+            stripped = chunk.lstrip()
+            self.offset += len(chunk) - len(stripped)
+            chunk = stripped
+            if not chunk:
+                return
+            self.started = True
+        self.original += chunk
+        self.buffer += chunk.translate(NORMALIZATION_TABLE)
+        yield from self._scan(final=False)
+
+    def finish(self) -> Iterator[Tuple[int, int, int]]:
+        self.original = self.original.rstrip()
+        self.buffer = self.original.translate(NORMALIZATION_TABLE)
+        yield from self._scan(final=True)
+        end = self.offset + len(self.original)
+        if self.side == 1:
+            raise PolynomialSyntaxError(
+                f"Invalid polynomial string to parse: '=' should be present exactly once at position {end}.", end
+            )
+        if not self.side_terms:
+            raise PolynomialSyntaxError(
+                f"Invalid polynomial string to parse: both sides of '=' should contain terms at position {end}.",
+                end,
+            )
+
+    def _scan(self, final: bool) -> Iterator[Tuple[int, int, int]]:
+        buffer = self.buffer
+        end = len(buffer)
+        position = 0
+        while position < end:
+            if buffer[position] == "=":
+                if self.side == -1:
+                    raise self._error("'=' should be present exactly once", position)
+                if not self.side_terms:
+                    raise self._error("both sides of '=' should contain terms", position)
+                self.side, self.side_terms = -1, 0
+                position += 1
+                continue
+            separator = SEPARATOR_PATTERN.search(buffer, position + 1)
+            if separator is None:
+                if not final:
+                    # the term might continue in the next chunk
+                    break
+                term_end = end
+            else:
+                term_end = separator.start()
+            term = TERM_PATTERN.match(buffer, position, term_end)
+            if term is None or term.end() != term_end:
+                raise self._term_error(position, term_end)
+            yield self._parse_term(term)
+            self.side_terms += 1
+            position = term_end
+        self._consume(position)
+
+    def _parse_term(self, term) -> Tuple[int, int, int]:
+        sign, coefficient, variable, degree, power = term.groups()
+        scale = 0
+        if coefficient is None:
+            value, degree = 1, int(power) if power else 1
+        else:
+            if "." in coefficient:
+                whole, _, fraction = coefficient.partition(".")
+                fraction = fraction.rstrip("0")
+                value, scale = int(whole + fraction), len(fraction)
+            else:
+                value = int(coefficient)
+            degree = (int(degree) if degree else 1) if variable else 0
+        return (-value * self.side if sign == "-" else value * self.side), degree, scale
+
+    def _consume(self, position: int):
+        """Drop the first ``position`` normalized characters and the input they came from."""
+        pending = len(self.buffer) - position
+        index, length = len(self.original), 0
+        while length < pending:
+            index -= 1
+            length += len(self.original[index].translate(NORMALIZATION_TABLE))
+        self.offset += index
+        self.original = self.original[index:]
+        self.buffer = self.buffer[position:]
+
+    def _positions(self) -> List[int]:
+        """Offset in the whole input of every normalized character of the buffer."""
+        positions = []
+        for index, char in enumerate(self.original, start=self.offset):
+            positions.extend([index] * len(char.translate(NORMALIZATION_TABLE)))
+        return positions
+
+    def _error(self, reason: str, index: int) -> PolynomialSyntaxError:
+        position = self._positions()[index]
+        return PolynomialSyntaxError(f"Invalid polynomial string to parse: {reason} at position {position}.", position)
+
+    def _term_error(self, start: int, end: int) -> PolynomialSyntaxError:
+        positions = self._positions()
+        first, last = positions[start] - self.offset, positions[end - 1] - self.offset
+        # explain the term on its own, it is complete since it is followed by a separator
+        return diagnose(self.original[first : last + 1] + "=0", offset=positions[start])
+
+
+def diagnose(polynom_str: str, offset: int = 0) -> PolynomialSyntaxError:
+    """Explain why an equation is invalid.
+
+    Errors concerning the whole equation (characters, ``=``, power notation,
+    sign sequences) are reported as an invalid polynomial string, errors
+    inside a single term as an invalid term.
+
+    :param offset: Position of ``polynom_str`` in a longer input, added to the
+        reported positions.
+    """
+    code, position, term = _locate(polynom_str, offset)
+    if code is ErrorCode.INVALID_TERM:
+        term, unexpected = term
+        return PolynomialSyntaxError(
+            f'Invalid term - "{term}": unexpected "{unexpected}" at position {position}.', position
+        )
+    return PolynomialSyntaxError(f"Invalid polynomial string to parse: {REASONS[code]} at position {position}.", position)
+
+
+def _locate(
+    polynom_str: str, offset: int = 0, text: Optional[str] = None
+) -> Tuple[ErrorCode, int, Optional[Tuple[str, str]]]:
+    """Find the first error of an invalid equation, without formatting any message.
+
+    :param text: The normalized equation, when it is already known.
+    :return: The error code, its position in the original string plus ``offset``
+        and, for invalid terms, the normalized term and its unexpected character.
+    """
+    stripped = polynom_str.strip()
+    if text is None:
+        text = stripped.translate(NORMALIZATION_TABLE)
+    code, index, term = _find_error(text)
+    if index >= len(text):
+        return code, len(polynom_str) + offset, term
+    leading = len(polynom_str) - len(polynom_str.lstrip())
+    return code, leading + _original_index(stripped, index) + offset, term
+
+
+def _find_error(text: str) -> Tuple[ErrorCode, int, Optional[Tuple[str, str]]]:
+    """Error code and index in the normalized ``text`` of its first error, see ``_locate``."""
+    invalid = INVALID_CHARACTER_PATTERN.search(text)
+    if invalid is not None:
+        return ErrorCode.INVALID_CHARACTERS, invalid.start(), None
+
+    equal_sign = text.find("=")
+    if equal_sign == -1:
+        return ErrorCode.EQUAL_SIGN, len(text), None
+    second_equal_sign = text.find("=", equal_sign + 1)
+    if second_equal_sign != -1:
+        return ErrorCode.EQUAL_SIGN, second_equal_sign, None
+
+    power = INVALID_POWER_PATTERN.search(text)
+    if power is not None:
+        return ErrorCode.POWER_NOTATION, power.start(power.lastindex), None
+
+    sides = ((0, equal_sign), (equal_sign + 1, len(text)))
+    for start, end in sides:
+        if start == end:
+            return ErrorCode.EMPTY_SIDE, start, None
+        sequence = OPERATOR_SEQUENCE_PATTERN.search(text, start, end)
+        if sequence is not None:
+            return ErrorCode.OPERATOR_SEQUENCE, sequence.start(), None
+
+    for start, end in sides:
+        term_start = start
+        # every sign but the one starting a term ends the term before it
+        for separator in SIGN_PATTERN.finditer(text, start + 1, end):
+            error = _term_error(text, term_start, separator.start())
+            if error is not None:
+                return error
+            term_start = separator.start()
+        error = _term_error(text, term_start, end)
+        if error is not None:
+            return error
+
+    return ErrorCode.UNPARSABLE, 0, None
+
+
+def _term_error(text: str, start: int, end: int) -> Optional[Tuple[ErrorCode, int, Tuple[str, str]]]:
+    term = TERM_PATTERN.match(text, start, end)
+    if term is not None and term.end() == end:
+        return None
+    if term is not None:
+        unexpected = term.end()
+    else:
+        unexpected = start + (text[start] in SIGNS)
+    return ErrorCode.INVALID_TERM, unexpected, (text[start:end], text[unexpected])
+
+
+def _original_index(stripped: str, index: int) -> int:
+    """Index in ``stripped`` of the character normalized into the character ``index`` of the equation."""
+    if RESIZED_PATTERN.search(stripped) is None:
+        return index
+    count = stripped.count
+    if "²" not in stripped:
+        # characters are only deleted: index plus the deleted ones before it, until that is stable
+        position = index
+        while True:
+            end = position + 1
+            following = index + count(" ", 0, end) + count("\t", 0, end) + count("\n", 0, end)
+            if following == position:
+                return position
+            position = following
+    # the first character whose normalized prefix is longer than index
+    low, high = max(index - count("²"), 0), len(stripped) - 1
+    while low < high:
+        middle = (low + high) // 2
+        end = middle + 1
+        length = end - count(" ", 0, end) - count("\t", 0, end) - count("\n", 0, end) + count("²", 0, end)
+        if length > index:
+            high = middle
+        else:
+            low = end
+    return low
@@ -0,0 +1,158 @@
+"""Batch solving on a pool of worker processes or threads.
+
+Solving is pure Python and bound to one core by the GIL, so large batches are
+split into chunks solved by separate processes. Every worker keeps its own
+long-lived ``PolynomialFactory`` (and cache), and results come back in input
+order.
+
+On a free-threaded CPython build (3.13t and later) threads run in parallel
+too: ``solve_threaded`` shares one factory, its cache and the polynomials,
+which are immutable, between the threads of a pool, without pickling
+equations and records between processes.
+"""
+import functools
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from computor import stats
+from computor.batch import RECORD_FIELDS, solve_record
+from computor.cache import LRUCache
+from computor.polynominal import PolynomParser, PolynomialFactory
+from computor.solution import error_message
+
+DEFAULT_CHUNK_SIZE = 256
+
+# factory, record fields and canonical polynomials of the current worker process, set up by _init_worker
+_factory: Optional[PolynomialFactory] = None
+_fields: Sequence[str] = RECORD_FIELDS
+_canonical_cache: Optional[LRUCache] = None
+
+
+def _init_worker(cache_size: int, collect_stats: bool, fields: Sequence[str] = RECORD_FIELDS, dedup_size: int = 0):
+    global _factory, _fields, _canonical_cache
+    _factory = PolynomialFactory(PolynomParser(), cache_size=cache_size)
+    _fields = fields
+    _canonical_cache = LRUCache(dedup_size) if dedup_size else None
+    if collect_stats:
+        stats.enable()
+
+
+def _solve_chunk(chunk: List[Tuple[int, Any]]) -> Tuple[List[Dict[str, Any]], Optional[stats.StatsSnapshot]]:
+    """Solve a chunk in a worker, returning the records and the stats recorded for them."""
+    stats.reset()
+    records = _solve_records(_factory, _fields, _canonical_cache, chunk)
+    return records, stats.snapshot() if stats.is_enabled() else None
+
+
+def _solve_records(
+    factory: PolynomialFactory,
+    fields: Sequence[str],
+    canonical_cache: Optional[LRUCache],
+    chunk: List[Tuple[int, Any]],
+) -> List[Dict[str, Any]]:
+    records = []
+    for line, equation in chunk:
+        try:
+            records.append(solve_record(factory, line, equation, fields, canonical_cache))
+        except Exception as e:
+            # solve_record keeps the errors of an equation, this guards the chunk against anything else
+            record = dict.fromkeys(fields)
+            if "line" in record:
+                record["line"] = line
+            if "equation" in record:
+                record["equation"] = equation.decode(errors="replace") if isinstance(equation, bytes) else equation
+            if "error" in record:
+                record["error"] = error_message(e)
+            records.append(record)
+    return records
+
+
+def chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_parallel(
+    equations: Iterable[Tuple[int, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache_size: int = 0,
+    fields: Sequence[str] = RECORD_FIELDS,
+    dedup_size: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """Solve (line number, equation) pairs on a process pool, yielding records in input order.
+
+    The input is consumed lazily: at most two chunks per worker are in flight,
+    so memory stays bounded for inputs of any length. Stats recorded by the
+    workers are merged into this process when collection is enabled.
+
+    :param workers: Number of worker processes, one per CPU by default.
+    :param chunk_size: Equations sent to a worker at once.
+    :param cache_size: Size of the LRU cache of every worker's factory.
+    :param fields: Record fields computed by the workers, see ``Solution.to_record``.
+    :param dedup_size: Size of the canonical polynomial cache of every worker,
+        see ``computor.batch.deduplicate``. 0 disables the deduplication.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be a positive integer.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(cache_size, stats.is_enabled(), tuple(fields), dedup_size),
+    ) as executor:
+        for records, chunk_stats in _in_order(executor, _solve_chunk, chunks(equations, chunk_size), workers):
+            if chunk_stats is not None:
+                stats.merge(chunk_stats)
+            yield from records
+
+
+def solve_threaded(
+    equations: Iterable[Tuple[int, Any]],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    factory: Optional[PolynomialFactory] = None,
+    fields: Sequence[str] = RECORD_FIELDS,
+    dedup_size: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """Like ``solve_parallel`` on a thread pool sharing one factory and one canonical polynomial cache.
+
+    Scales with the workers on free-threaded builds only, with the GIL the
+    threads take turns. Stats are recorded directly by the threads.
+
+    :param factory: Factory shared by the threads, a new one without cache by default.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be a positive integer.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer.")
+    if factory is None:
+        factory = PolynomialFactory(PolynomParser())
+    canonical_cache = LRUCache(dedup_size) if dedup_size else None
+    solve_chunk = functools.partial(_solve_records, factory, tuple(fields), canonical_cache)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for records in _in_order(executor, solve_chunk, chunks(equations, chunk_size), workers):
+            yield from records
+
+
+def _in_order(executor: Executor, function: Callable, chunk_iterator: Iterator[List], workers: int) -> Iterator:
+    """Results of ``function`` for every chunk in input order, with at most two chunks per worker in flight."""
+    pending = deque()
+    for chunk in chunk_iterator:
+        pending.append(executor.submit(function, chunk))
+        if len(pending) >= 2 * workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
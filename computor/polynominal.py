@@ -1,19 +1,98 @@
+import functools
+import math
 import re
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from computor import arithmetic, lexer, stats
+from computor.algebraic import AlgebraicNumber
+from computor.cache import CacheInfo, LRUCache
+from computor.lexer import (
+    ASCII_DELETED,
+    ASCII_NORMALIZATION_TABLE,
+    NORMALIZATION_TABLE,
+    ParseResult,
+    tokenize_bytes,
+    tokenize_scaled,
+    tokenize_stream,
+)
+from computor.str_math import format_decimal
+
+
+def memoized(method):
+    """Remember the result of a method without arguments on the instance.
+
+    Threads calling it at the same time may all compute the result, they all
+    get the first one stored.
+    """
+    attribute = "_memoized_" + method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            return self.__dict__[attribute]
+        except KeyError:
+            return self.__dict__.setdefault(attribute, method(self))
+
+    return wrapper
+
+
+def _measure_reduction(args, coefficients):
+    return {
+        "terms": len(args[0]),
+        "max_degree": max(coefficients, default=0),
+        "coefficient_bits": stats.coefficient_bits(coefficients.values()),
+    }
+
 
-from computor.str_math import sqrt_str, divide_str
+def _measure_polynomial(args, result):
+    return {"degree": args[0].degree}
+
+
+# terms built for these coefficients and degrees are shared, see ``PolynomialTerm``
+INTERNED_COEFFICIENTS = range(-10, 11)
+INTERNED_DEGREES = range(0, 3)
+_interned: Dict[Tuple[int, int], "PolynomialTerm"] = {}
 
 
 class PolynomialTerm:
-    def __init__(self, coefficient, degree):
-        self.coefficient = coefficient
-        self.degree = degree
+    """Immutable term ``coefficient * X^degree``.
+
+    Terms have no instance dictionary, and those with an integer coefficient in
+    ``INTERNED_COEFFICIENTS`` and degree in ``INTERNED_DEGREES`` exist once:
+    building one again, by the constructor or an operator, returns the shared
+    instance. Equal terms have equal hashes.
+    """
+
+    __slots__ = ("coefficient", "degree")
+
+    def __new__(cls, coefficient, degree):
+        if type(coefficient) is int and type(degree) is int and cls is PolynomialTerm:
+            term = _interned.get((coefficient, degree))
+            if term is not None:
+                return term
+        term = object.__new__(cls)
+        _set_coefficient(term, coefficient)
+        _set_degree(term, degree)
+        return term
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # unpickled terms are interned again
+        return type(self), (self.coefficient, self.degree)
 
     def __mul__(self, other):
         if isinstance(other, PolynomialTerm):
             return PolynomialTerm(self.coefficient * other.coefficient, self.degree + other.degree)
         elif isinstance(other, int):
+            if other == 1:
+                return self
             return PolynomialTerm(self.coefficient * other, self.degree)
         else:
             raise ValueError(f"Invalid operand type {type(other)}")
@@ -25,6 +104,8 @@ class PolynomialTerm:
         if isinstance(other, PolynomialTerm):
             return PolynomialTerm(self.coefficient // other.coefficient, self.degree - other.degree)
         elif isinstance(other, int):
+            if other == 1:
+                return self
             return PolynomialTerm(self.coefficient // other, self.degree)
         else:
             raise ValueError(f"Invalid operand type {type(other)}")
@@ -37,6 +118,8 @@ class PolynomialTerm:
         elif isinstance(other, int):
             if self.degree != 0:
                 raise ValueError("Terms must have the same degree to add them.")
+            if other == 0:
+                return self
             return PolynomialTerm(self.coefficient + other, self.degree)
         else:
             raise ValueError(f"Invalid operand type {type(other)}")
@@ -143,32 +226,67 @@ class PolynomialTerm:
         return f"PolynomialTerm({self.coefficient}, {self.degree})"
 
     def __eq__(self, other):
+        if not isinstance(other, PolynomialTerm):
+            return NotImplemented
         return self.degree == other.degree and self.coefficient == other.coefficient
 
+    def __hash__(self):
+        return hash((self.coefficient, self.degree))
+
+
+# the slot setters, __setattr__ is closed
+_set_coefficient = PolynomialTerm.coefficient.__set__
+_set_degree = PolynomialTerm.degree.__set__
+_interned.update(
+    {
+        (coefficient, degree): PolynomialTerm(coefficient, degree)
+        for coefficient in INTERNED_COEFFICIENTS
+        for degree in INTERNED_DEGREES
+    }
+)
+
 
 class Polynomial(ABC):
     """
     Representation of a general polynomial using terms with coefficients and degrees.
+
+    Polynomials are immutable, derived values are computed on first use with
+    ``memoized``, so one polynomial can be shared by any number of threads.
     """
 
-    def __init__(self, terms: List[PolynomialTerm]):
+    def __init__(self, terms: Union[List[PolynomialTerm], Dict[int, int]], scale: int = 0):
         """
         Represents a polynomial equation using a list of polynomial terms.
 
         This class initializes with a list of PolynomialTerm objects, which represent
-        the individual terms of a polynomial. It ensures that terms are sorted by their
-        degree and performs a reduction step to simplify the polynomial by combining
-        like terms if applicable.
+        the individual terms of a polynomial. It performs a reduction step to simplify
+        the polynomial by combining like terms if applicable.
 
-        :param terms: Dictionary of terms in the polynomial.
-        :type terms: List[PolynomialTerm]
+        Internally the polynomial is a sparse mapping of degree to coefficient, the
+        dense list of terms is only built when ``terms`` is accessed.
+
+        :param terms: List of terms in the polynomial, or an already reduced
+            mapping of degree to coefficient.
+        :type terms: Union[List[PolynomialTerm], Dict[int, int]]
+        :param scale: Decimal scale of the coefficients, the real coefficients are
+            the integer ones divided by ``10 ** scale``. Roots do not depend on it.
         """
-        self._degree = None
-        self._solutions_count = None
-        self._terms = None
+        if isinstance(terms, (dict, MappingProxyType)):
+            coefficients = {degree: coefficient for degree, coefficient in terms.items() if coefficient}
+        else:
+            coefficients = self.reduce_coefficients(terms)
+        set_attribute = object.__setattr__
+        set_attribute(self, "scale", scale)
+        set_attribute(self, "_coefficients", coefficients)
+        set_attribute(self, "_coefficients_view", MappingProxyType(coefficients))
+        set_attribute(self, "_degree", max(coefficients, default=0))
 
-        # setting
-        self.terms = terms
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # rebuilt from the coefficients, memoized values are computed again
+        return type(self), (self._coefficients, self.scale)
 
     @property
     @abstractmethod
@@ -189,20 +307,172 @@ class Polynomial(ABC):
     @property
     def degree(self) -> int:
         """Returns the degree of the polynomial."""
-        if self._degree is None:
-            self._degree = self.find_max_degree(self.terms)
         return self._degree
 
+    @property
+    def coefficients(self) -> Mapping[int, int]:
+        """Read-only mapping of degree to integer coefficient of the reduced polynomial, see ``scale``."""
+        return self._coefficients_view
+
+    def coefficient(self, degree: int) -> int:
+        """Returns the coefficient of the given degree, 0 for missing terms."""
+        return self._coefficients.get(degree, 0)
+
     @property
     def terms(self) -> List[PolynomialTerm]:
-        return self._terms
+        """Dense list of reduced terms sorted by degree, missing degrees filled with 0."""
+        return list(self._dense_terms())
 
-    @terms.setter
-    def terms(self, terms: List[PolynomialTerm]):
-        if self._terms is not None:
-            raise ValueError("Terms cannot be set after initialization.")
-        self._terms = self.reduce_terms(terms)
+    @memoized
+    def _dense_terms(self) -> Tuple[PolynomialTerm, ...]:
+        return tuple(self.expand_coefficients(self._coefficients))
 
+    @staticmethod
+    def from_coefficients(coefficients: Dict[int, int], scale: int = 0) -> "Polynomial":
+        """Build the polynomial of the class matching its degree, see ``POLYNOMIAL_CLASSES``.
+
+        Unlike ``PolynomialFactory``, there is no degree limit. Zero coefficients
+        are ignored.
+        """
+        degree = max((degree for degree, coefficient in coefficients.items() if coefficient), default=0)
+        return POLYNOMIAL_CLASSES.get(degree, PolynomialHigherDegree)(coefficients, scale)
+
+    def _operand(self, other) -> Optional[Tuple[Dict[int, int], int]]:
+        """Coefficients and scale of the other operand of an operator, None if unsupported."""
+        if isinstance(other, Polynomial):
+            return other.coefficients, other.scale
+        if isinstance(other, int):
+            return {0: other}, 0
+        return None
+
+    def _with_coefficients(self, coefficients: Dict[int, int], scale: int) -> "Polynomial":
+        # the smallest scale representing the coefficients, like the parser's
+        while scale and all(coefficient % 10 == 0 for coefficient in coefficients.values()):
+            coefficients = {degree: coefficient // 10 for degree, coefficient in coefficients.items()}
+            scale -= 1
+        return self.from_coefficients(coefficients, scale)
+
+    def __add__(self, other: Union["Polynomial", int]) -> "Polynomial":
+        """Sum of the left sides: (P = 0) + (Q = 0) gives (P + Q = 0)."""
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        coefficients, scale = operand
+        result = {degree: coefficient for degree, coefficient in self.coefficients.items() if coefficient}
+        if scale > self.scale:
+            factor = 10 ** (scale - self.scale)
+            result = {degree: coefficient * factor for degree, coefficient in result.items()}
+        factor = 10 ** max(self.scale - scale, 0)
+        for degree, coefficient in coefficients.items():
+            coefficient = result.get(degree, 0) + coefficient * factor
+            if coefficient:
+                result[degree] = coefficient
+            else:
+                result.pop(degree, None)
+        return self._with_coefficients(result, max(scale, self.scale))
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Polynomial":
+        return self.from_coefficients(
+            {degree: -coefficient for degree, coefficient in self.coefficients.items() if coefficient}, self.scale
+        )
+
+    def __sub__(self, other: Union["Polynomial", int]) -> "Polynomial":
+        if self._operand(other) is None:
+            return NotImplemented
+        return self + -other
+
+    def __rsub__(self, other: int) -> "Polynomial":
+        return -self + other
+
+    def __mul__(self, other: Union["Polynomial", int]) -> "Polynomial":
+        """Product of the left sides, see ``computor.arithmetic`` for the strategies."""
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        coefficients, scale = operand
+        return self._with_coefficients(
+            arithmetic.multiply_mappings(self.coefficients, coefficients), self.scale + scale
+        )
+
+    __rmul__ = __mul__
+
+    def __pow__(self, exponent: int) -> "Polynomial":
+        if not isinstance(exponent, int):
+            return NotImplemented
+        return self._with_coefficients(
+            arithmetic.power_mapping(self.coefficients, exponent), self.scale * exponent
+        )
+
+    @memoized
+    def canonical_key(self) -> Tuple[Tuple[int, int], ...]:
+        """Hashable key shared by the equations with the same roots up to a constant factor.
+
+        The coefficients are divided by their gcd and negated when the highest
+        nonzero one is negative, the decimal scale is left out: ``2X^2 - 4 = 0``,
+        ``X^2 = 2`` and ``-0.5X^2 + 1 = 0`` all give ``((0, -2), (2, 1))``.
+        """
+        coefficients = self._coefficients
+        divisor = math.gcd(*coefficients.values())
+        if not divisor:
+            # no coefficient, or only zero ones
+            return tuple(sorted(coefficients.items()))
+        leading = next(coefficients[degree] for degree in sorted(coefficients, reverse=True) if coefficients[degree])
+        if leading < 0:
+            divisor = -divisor
+        return tuple(sorted((degree, coefficient // divisor) for degree, coefficient in coefficients.items()))
+
+    def canonical(self) -> "Polynomial":
+        """Polynomial of the same class with the coefficients of ``canonical_key``, and the same roots."""
+        return type(self)(dict(self.canonical_key()))
+
+    @memoized
+    def _horner_coefficients(self):
+        """Nonzero real coefficients from the highest degree down, and the degree gap after each of them."""
+        import numpy as np
+
+        degrees = sorted((degree for degree, coefficient in self.coefficients.items() if coefficient), reverse=True)
+        divisor = 10**self.scale
+        values = np.array([self.coefficients[degree] / divisor for degree in degrees], dtype=np.float64)
+        gaps = tuple(degree - lower for degree, lower in zip(degrees, degrees[1:] + [0]))
+        return values, gaps
+
+    def evaluate(self, xs):
+        """Value of the reduced left side at ``xs``, a scalar or array-like, real or complex.
+
+        Uses Horner's scheme on a float coefficient array cached on the
+        polynomial; gaps between sparse degrees are bridged with a power, so
+        ``X^1000 + 1`` costs two steps. Scalars give a NumPy scalar, arrays an
+        array of the same shape.
+        """
+        import numpy as np
+
+        x = np.asarray(xs)
+        x = x.astype(np.result_type(x.dtype, np.float64), copy=False)
+        values, gaps = self._horner_coefficients()
+        if not len(values):
+            return np.zeros_like(x)[()]
+        result = np.full(x.shape, values[0], dtype=x.dtype)
+        for value, gap in zip(values[1:], gaps):
+            result *= x if gap == 1 else x**gap
+            result += value
+        if gaps[-1]:
+            result *= x if gaps[-1] == 1 else x ** gaps[-1]
+        return result[()]
+
+    def residuals(self):
+        """Absolute values of the polynomial at the roots of ``get_solutions()``, as an array.
+
+        Values near 0 (relative to the size of the coefficients) confirm the roots.
+        """
+        import numpy as np
+
+        roots = np.array(self.get_solutions(), dtype=np.complex128)
+        return np.abs(self.evaluate(roots))
+
+    @memoized
+    @stats.stage("polynomial.reduced_form", _measure_polynomial)
     def get_reduced_form(self) -> str:
         """Returns the reduced form of the polynomial."""
         reduced_form = ""
@@ -210,7 +480,10 @@ class Polynomial(ABC):
         if not self.terms:
             return "0 * X^0 = 0"
         for term in reversed(self.terms):
-            term_str = str(term)
+            if self.scale:
+                term_str = f"{format_decimal(term.coefficient, self.scale)}*X^{term.degree}"
+            else:
+                term_str = str(term)
             if term.coefficient >= 0:
                 term_str = "+" + term_str
             reduced_form += f"{term_str}"
@@ -226,44 +499,89 @@ class Polynomial(ABC):
         return reduced_form + " = 0"
 
     @staticmethod
-    def reduce_terms(terms: List[PolynomialTerm]) -> List[PolynomialTerm]:
+    @stats.stage("polynomial.reduce", _measure_reduction)
+    def reduce_coefficients(terms: List[PolynomialTerm]) -> Dict[int, int]:
         """
-        Sets the terms of the polynomial while reducing terms to the same degree by
-        combining their coefficients.
+        Reduces terms to the same degree by combining their coefficients.
 
-        This setter method processes the list of polynomial terms and consolidates duplicate
-        terms by degree, ensuring that each degree has a single term with a summed coefficient.
+        The result is a sparse mapping of degree to coefficient, so its size depends
+        on the number of distinct degrees only. Zero terms and degrees whose
+        coefficients cancel out are dropped, so the highest degree is the real one.
 
-        :param terms: A list of polynomial terms to be set in the polynomial. Each term
-            is an instance of the PolynomialTerm class and contains a degree and
-            coefficient.
+        :param terms: A list of polynomial terms. Each term is an instance of the
+            PolynomialTerm class and contains a degree and coefficient.
         :type terms: List[PolynomialTerm]
-        :return: None
+        :return: Mapping of degree to coefficient.
         """
         if not isinstance(terms, list):
             raise ValueError("Value of terms must be a list of PolynomialTerm objects.")
-        reduced_terms = {}
+        coefficients = {}
         for term in terms:
             if not isinstance(term, PolynomialTerm):
                 raise ValueError(
                     "Value of terms must be a list of PolynomialTerm objects."
                 )
-            if term.degree not in reduced_terms.keys():
-                reduced_terms[term.degree] = term
+            coefficient = coefficients.get(term.degree, 0) + term.coefficient
+            # We're reducing on the go here
+            if coefficient == 0:
+                coefficients.pop(term.degree, None)
             else:
-                reduced_terms[term.degree] += term
-                # We're reducing on the go here
-                if reduced_terms[term.degree].coefficient == 0:
-                    del reduced_terms[term.degree]
+                coefficients[term.degree] = coefficient
+        return coefficients
 
-        if not reduced_terms:
+    @staticmethod
+    @stats.stage("polynomial.reduce_stream", lambda args, result: {"max_degree": max(result[0], default=0)})
+    def reduce_stream(terms: Iterable[Tuple[int, int, int]]) -> Tuple[Dict[int, int], int]:
+        """
+        Reduces (coefficient, degree, scale) triples, as produced by
+        ``computor.lexer.tokenize_stream``, without keeping the terms.
+
+        Coefficients are combined like in ``reduce_coefficients``; when a term
+        with more decimals arrives, the coefficients seen so far are rescaled.
+
+        :param terms: Any iterable of terms, consumed once.
+        :return: Mapping of degree to scaled coefficient, and the scale.
+        """
+        coefficients = {}
+        scale = 0
+        for coefficient, degree, term_scale in terms:
+            if term_scale > scale:
+                factor = 10 ** (term_scale - scale)
+                coefficients = {key: value * factor for key, value in coefficients.items()}
+                scale = term_scale
+            elif term_scale < scale:
+                coefficient *= 10 ** (scale - term_scale)
+            coefficient += coefficients.get(degree, 0)
+            if coefficient == 0:
+                coefficients.pop(degree, None)
+            else:
+                coefficients[degree] = coefficient
+        return coefficients, scale
+
+    @staticmethod
+    def expand_coefficients(coefficients: Dict[int, int]) -> List[PolynomialTerm]:
+        """Builds the dense list of terms from 0 to the highest degree, sorted by degree."""
+        if not coefficients:
             return []
-        # if a term is missing, we're adding it with a 0 coefficient
-        for degree in range(max(reduced_terms.keys()) + 1):
-            if degree not in reduced_terms:
-                reduced_terms[degree] = PolynomialTerm(0, degree)
+        return [
+            PolynomialTerm(coefficients.get(degree, 0), degree)
+            for degree in range(max(coefficients) + 1)
+        ]
 
-        return sorted(reduced_terms.values(), key=lambda x: x.degree)
+    @classmethod
+    def reduce_terms(cls, terms: List[PolynomialTerm]) -> List[PolynomialTerm]:
+        """
+        Reduces terms to the same degree by combining their coefficients.
+
+        Returns the dense list of terms sorted by degree, where missing degrees are
+        added with a 0 coefficient. Prefer ``reduce_coefficients`` when the degrees
+        can be large.
+
+        :param terms: A list of polynomial terms.
+        :type terms: List[PolynomialTerm]
+        :return: List of reduced terms.
+        """
+        return cls.expand_coefficients(cls.reduce_coefficients(terms))
 
     @staticmethod
     def find_max_degree(terms: List[PolynomialTerm]) -> int:
@@ -279,32 +597,97 @@ class Polynomial(ABC):
 
 
 class PolynomialFactory:
-    """Factory class for creating polynomials of different degrees."""
+    """Factory class for creating polynomials of different degrees.
+
+    A factory can be shared by threads: its class mapping is read-only, the
+    cache is locked and the polynomials it returns are immutable.
+    """
 
-    def __init__(self, parser):
+    def __init__(
+        self,
+        parser,
+        cache_size: int = 0,
+        max_degree: int = 1000,
+        polynomials: Optional[Mapping[int, type]] = None,
+    ):
+        """
+        :param parser: Parser turning a polynomial string into a list of terms.
+        :param cache_size: Number of polynomials to keep in an LRU cache keyed on
+            the normalized polynomial string. 0 disables the cache.
+        :param max_degree: Highest degree solved numerically by ``general_polynomial``
+            when ``polynomials`` has no class for the degree.
+        :param polynomials: Polynomial class by degree, ``POLYNOMIAL_CLASSES`` by default.
+        """
         self.parser = parser
-        self.polynomials = {
-            0: PolynomialZeroDegree,
-            1: PolynomialFirstDegree,
-            2: PolynomialSecondDegree,
-        }
+        self.polynomials = MappingProxyType(dict(POLYNOMIAL_CLASSES if polynomials is None else polynomials))
+        self.general_polynomial = PolynomialHigherDegree
+        self.max_degree = max_degree
+        self.cache: Optional[LRUCache] = LRUCache(cache_size) if cache_size else None
 
     def create(self, polynom_str):
-        """Create a polynomial object based on the polynomial string."""
-        polynom_terms = self.parser.parse(polynom_str)
-        reduced_terms = Polynomial.reduce_terms(polynom_terms)
-        degree = Polynomial.find_max_degree(reduced_terms)
-        if degree not in self.polynomials.keys():
-            raise ValueError(f"Polynomial of degree {degree} is not supported.")
-        return self.polynomials[degree](polynom_terms)
+        """Create a polynomial object based on the polynomial string.
+
+        With the cache enabled, equations differing only in whitespace or ``x``/``X``
+        casing share one polynomial object, so its reduced form and solutions are
+        computed once. ``polynom_str`` can also be UTF-8 encoded bytes.
+        """
+        if self.cache is None:
+            return self._create(polynom_str)
+        if isinstance(polynom_str, bytes):
+            # lines of a file, normalized like the lexer does; only valid ones reach the cache
+            key = polynom_str.strip().translate(ASCII_NORMALIZATION_TABLE, ASCII_DELETED)
+        else:
+            try:
+                key = self.parser.normalize(polynom_str)
+            except ValueError:
+                # invalid strings are not cached, let the parser report the error
+                return self._create(polynom_str)
+        polynomial = self.cache.get(key)
+        if polynomial is None:
+            polynomial = self._create(polynom_str)
+            self.cache.put(key, polynomial)
+        return polynomial
+
+    def create_from_chunks(self, chunks: Iterable[str]):
+        """Create a polynomial from an equation given in pieces of any size.
+
+        Terms are reduced while they are read, so memory depends on the chunk
+        size and the number of distinct degrees rather than on the length of
+        the equation. A file can be read with
+        ``factory.create_from_chunks(iter(lambda: file.read(1 << 16), ""))``.
+        Results are not cached.
+        """
+        coefficients, scale = Polynomial.reduce_stream(tokenize_stream(chunks))
+        return self._from_coefficients(coefficients, scale)
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Returns hit, miss and eviction counters of the cache, None if caching is disabled."""
+        return self.cache.info() if self.cache is not None else None
+
+    @stats.stage("factory.create")
+    def _create(self, polynom_str):
+        polynom_terms, scale = self.parser.parse_scaled(polynom_str)
+        return self._from_coefficients(Polynomial.reduce_coefficients(polynom_terms), scale)
+
+    def _from_coefficients(self, coefficients: Dict[int, int], scale: int):
+        degree = max(coefficients, default=0)
+        polynomial_class = self.polynomials.get(degree)
+        if polynomial_class is None:
+            if degree > self.max_degree:
+                raise ValueError(f"Polynomial of degree {degree} is not supported.")
+            polynomial_class = self.general_polynomial
+        return polynomial_class(coefficients, scale)
 
 
 class PolynomialZeroDegree(Polynomial):
     """Represents a zero degree polynomial."""
 
+    @stats.stage("polynomial.solve", _measure_polynomial)
     def get_solutions(self) -> Tuple[float]:
         return ()
 
+    @memoized
+    @stats.stage("polynomial.solution_string", _measure_polynomial)
     def get_solution_string(self) -> str:
         if self.solutions_count == -1:
             return "The sides of equation are not equal. Cannot solve."
@@ -313,13 +696,13 @@ class PolynomialZeroDegree(Polynomial):
 
     @property
     def solutions_count(self) -> int:
-        if self.terms:
+        if self.coefficients:
             return -1
         else:
             return float("inf")
 
-    def __init__(self, terms):
-        super().__init__(terms)
+    def __init__(self, terms, scale: int = 0):
+        super().__init__(terms, scale)
 
 
 class PolynomialFirstDegree(Polynomial):
@@ -327,24 +710,34 @@ class PolynomialFirstDegree(Polynomial):
 
     @property
     def a(self):
-        return self.terms[-1].coefficient
+        return self.coefficient(1)
 
     @property
     def b(self):
-        return self.terms[-2].coefficient
+        return self.coefficient(0)
 
+    @stats.stage("polynomial.solve", _measure_polynomial)
     def get_solutions(self) -> Tuple[float]:
         if self.solutions_count != 1:
             return tuple()
         return (-1 * self.b / self.a,)
 
+    @memoized
+    def get_exact_solutions(self) -> Tuple[AlgebraicNumber]:
+        """Returns the solution as an exact fraction, empty without a single solution."""
+        if self.solutions_count != 1:
+            return ()
+        return (AlgebraicNumber(-self.b, self.a),)
+
+    @memoized
+    @stats.stage("polynomial.solution_string", _measure_polynomial)
     def get_solution_string(self) -> str:
         if self.solutions_count == 0:
             return "No solutions"
         elif self.solutions_count == float("inf"):
             return "Any x is solution"
         else:
-            return "x = " + divide_str(-self.b, self.a)
+            return "x = " + str(self.get_exact_solutions()[0])
 
     @property
     def solutions_count(self) -> int:
@@ -355,89 +748,217 @@ class PolynomialFirstDegree(Polynomial):
                 return 0
         return 1
 
-    def __init__(self, terms):
-        super().__init__(terms)
+    def __init__(self, terms, scale: int = 0):
+        super().__init__(terms, scale)
+
+
+class QuadraticRoots(NamedTuple):
+    """Float roots of a second degree equation.
+
+    Real roots are ``x1`` and ``x2`` with ``imag`` 0. Complex roots are
+    ``x1 + imag*I`` and ``x2 - imag*I``, ``x1 == x2`` being the real part.
+    A double root has ``count`` 1. ``x1`` is the root of ``(-b + sqrt(D)) / 2a``.
+    """
+
+    x1: float
+    x2: float
+    imag: float
+    count: int
+
+    @property
+    def roots(self) -> Tuple[Union[float, complex], ...]:
+        """The distinct roots, floats for real ones, as returned by ``get_solutions``."""
+        if self.imag:
+            return complex(self.x1, self.imag), complex(self.x2, -self.imag)
+        return (self.x1,) if self.count == 1 else (self.x1, self.x2)
 
 
 class PolynomialSecondDegree(Polynomial):
     @property
     def solutions_count(self) -> int:
-        if self.discriminant == 0:
+        if self.integer_discriminant == 0:
             return 1
         else:
             return 2
 
     @property
     def discriminant(self):
-        if self._discriminant is None:
-            self._discriminant = self.b**2 - 4 * self.a * self.c
-        return self._discriminant
+        """Discriminant of the equation, a Decimal for decimal coefficients."""
+        if not self.scale:
+            return self.integer_discriminant
+        from decimal import Decimal
+
+        return Decimal(format_decimal(self.integer_discriminant, 2 * self.scale))
+
+    @property
+    def integer_discriminant(self) -> int:
+        """Discriminant of the integer coefficients, 10^(2*scale) times the real one."""
+        return self._compute_discriminant()
+
+    @memoized
+    @stats.stage("polynomial.discriminant", lambda args, result: {"bits": abs(result).bit_length()})
+    def _compute_discriminant(self):
+        return self.b**2 - 4 * self.a * self.c
 
     @property
     def a(self):
-        return self.terms[-1].coefficient
+        return self.coefficient(2)
 
     @property
     def b(self):
-        return self.terms[-2].coefficient
+        return self.coefficient(1)
 
     @property
     def c(self):
-        return self.terms[-3].coefficient
+        return self.coefficient(0)
 
-    def __init__(self, terms):
-        super().__init__(terms)
-        self._discriminant = None
+    def __init__(self, terms, scale: int = 0):
+        super().__init__(terms, scale)
 
+    @stats.stage("polynomial.solve", _measure_polynomial)
     def get_solutions(self) -> Tuple[float]:
-        if self.discriminant != 0:
-            x1 = (-self.b + self.discriminant**0.5) / (2 * self.a)
-            x2 = (-self.b - self.discriminant**0.5) / (2 * self.a)
-            return x1, x2
-        else:
-            return (-self.b / (2 * self.a),)
+        x1, x2, imag, count = self._float_roots()
+        if imag:
+            return complex(x1, imag), complex(x2, -imag)
+        return (x1,) if count == 1 else (x1, x2)
 
+    def solve_float(self) -> QuadraticRoots:
+        """Float roots, computed on a real or a complex branch without complex arithmetic.
+
+        Real roots use ``q = -(b + sign(b)*sqrt(D)) / 2`` and ``q/a``, ``c/q``:
+        unlike ``(-b ± sqrt(D)) / 2a``, no root subtracts two close numbers, so
+        both keep full precision when ``b*b`` is much larger than ``4ac``.
+        """
+        return QuadraticRoots(*self._float_roots())
+
+    def _float_roots(self) -> Tuple[float, float, float, int]:
+        self._check_leading_coefficient()
+        a, b, c = self.a, self.b, self.c
+        discriminant = self.integer_discriminant
+        # + 0.0 turns the -0.0 of a zero numerator over a negative denominator into 0.0
+        if discriminant == 0:
+            root = -b / (2 * a) + 0.0
+            return root, root, 0.0, 1
+        if discriminant < 0:
+            real = -b / (2 * a) + 0.0
+            return real, real, math.sqrt(-discriminant) / (2 * a), 2
+        sqrt_discriminant = math.sqrt(discriminant)
+        if b >= 0:
+            # q/a is (-b - sqrt(D)) / 2a
+            q = -(b + sqrt_discriminant) / 2
+            return c / q + 0.0, q / a, 0.0, 2
+        q = (sqrt_discriminant - b) / 2
+        return q / a, c / q + 0.0, 0.0, 2
+
+    @memoized
+    def get_exact_solutions(self) -> Tuple[AlgebraicNumber, ...]:
+        """Returns the solutions as exact numbers, (-b + sqrt(D)) / 2a first."""
+        self._check_leading_coefficient()
+        discriminant, b, double_a = self.integer_discriminant, self.b, 2 * self.a
+        if discriminant == 0:
+            return (AlgebraicNumber(-b, double_a),)
+        return AlgebraicNumber.quadratic_roots(-b, discriminant, double_a)
+
+    @memoized
+    @stats.stage("polynomial.solution_string", _measure_polynomial)
     def get_solution_string(self) -> str:
-        if self.discriminant == 0:
-            return "x = " + divide_str(-self.b, 2 * self.a)
-        else:
-            discriminant_sqrt = sqrt_str(self.discriminant)
-            try:
-                discriminant_sqrt = int(discriminant_sqrt)
-                x1 = divide_str(-self.b + discriminant_sqrt, 2 * self.a)
-                x2 = divide_str(-self.b - discriminant_sqrt, 2 * self.a)
-            except ValueError:
-                left, right = divide_str(-self.b, 2 * self.a), divide_str(
-                    discriminant_sqrt, 2 * self.a
-                )
-                if left == "0":
-                    x1 = right
-                    if right.startswith("-"):
-                        x2 = right[1:]
-                    else:
-                        x2 = "-" + right
-                else:
-                    x1 = left + " + " + right
-                    x2 = left + " - " + right
-            return f"x = {x1}, x = {x2}"
+        return ", ".join("x = " + str(solution) for solution in self.get_exact_solutions())
+
+    def _check_leading_coefficient(self):
+        # the factory builds a first degree polynomial instead, this guards direct construction
+        if self.a == 0:
+            raise ValueError("Division by zero")
+
+
+class PolynomialHigherDegree(Polynomial):
+    """Represents a polynomial of degree three or higher, solved numerically.
+
+    The polynomial is first split into square-free factors with exact
+    arithmetic (``arithmetic.square_free_factors``), so repeated roots are
+    known exactly and the numeric solver only sees simple roots. Roots come
+    from ``computor.roots``: closed forms for cubic and quartic factors, the
+    Aberth-Ehrlich iteration for higher degrees. Like degree two, distinct
+    roots are counted and printed, ``get_roots_with_multiplicity()`` keeps
+    the multiplicities.
+    """
+
+    @property
+    def solutions_count(self) -> int:
+        """Number of distinct complex roots, computed exactly."""
+        return sum(len(factor) - 1 for factor, _ in self._square_free_factors())
+
+    @memoized
+    def _square_free_factors(self) -> Tuple[Tuple[Tuple[int, ...], int], ...]:
+        return tuple(
+            (tuple(factor), multiplicity)
+            for factor, multiplicity in arithmetic.square_free_factors(arithmetic.to_list(self._coefficients))
+        )
+
+    @memoized
+    @stats.stage("polynomial.solve", _measure_polynomial)
+    def get_roots_with_multiplicity(self) -> Tuple[Tuple[complex, int], ...]:
+        """Distinct roots sorted by real then imaginary part, with their multiplicity."""
+        # numpy is only needed for polynomials this large, keep it out of the import
+        from computor.roots import find_roots
+
+        roots = [
+            (root, multiplicity)
+            for factor, multiplicity in self._square_free_factors()
+            for root in find_roots(factor[::-1])
+        ]
+        roots.sort(key=lambda pair: (pair[0].real, pair[0].imag))
+        return tuple((root.real if root.imag == 0 else root, multiplicity) for root, multiplicity in roots)
+
+    def get_solutions(self) -> Tuple[complex]:
+        return tuple(root for root, _ in self.get_roots_with_multiplicity())
+
+    @memoized
+    @stats.stage("polynomial.solution_string", _measure_polynomial)
+    def get_solution_string(self) -> str:
+        return ", ".join("x = " + format_root(root) for root in self.get_solutions())
+
+    def __init__(self, terms, scale: int = 0):
+        super().__init__(terms, scale)
+
+
+# polynomial class by degree, PolynomialHigherDegree above
+POLYNOMIAL_CLASSES = MappingProxyType(
+    {
+        0: PolynomialZeroDegree,
+        1: PolynomialFirstDegree,
+        2: PolynomialSecondDegree,
+    }
+)
+
+
+def format_root(root, precision: int = 6) -> str:
+    """Format a numeric root, using I for the imaginary unit like the exact solutions do."""
+    real, imag = root.real, getattr(root, "imag", 0)
+    # "+ 0" avoids printing negative zero
+    real_str = f"{real + 0:.{precision}g}"
+    if imag == 0:
+        return real_str
+    imag_str = f"{abs(imag):.{precision}g}*I"
+    if real == 0:
+        return imag_str if imag > 0 else "-" + imag_str
+    return f"{real_str} {'+' if imag > 0 else '-'} {imag_str}"
 
 
 class PolynomParser:
-    full_pattern = r"^[\dX\^\-\+\*=]+$"  # Regex pattern to match a polynomial string
-    term_pattern = r'(?=[+\-])'
+    full_pattern = re.compile(r"^[\dX\^\-\+\*=.]+$")  # Regex pattern to match a polynomial string
+    term_pattern = re.compile(r"(?=[+\-])")
+    power_pattern = re.compile(r"\^\D|\d\^|\^\d+\.")
+    edge_operator_pattern = re.compile(r"[\^\-+*=]$|^[*\^=]")
 
     @classmethod
+    @stats.stage("parser.normalize")
     def normalize(cls, polynom_str: str):
         """Normalize and validate a polynomial string."""
         if not isinstance(polynom_str, str):
             raise ValueError("Invalid polynomial string to parse: not a string.")
-        polynom_str = polynom_str.strip()
-        polynom_str = polynom_str.replace("\n", "")
-        polynom_str = polynom_str.replace("\t", "")
-        polynom_str = polynom_str.replace(" ", "")
-        polynom_str = polynom_str.replace("x", "X")
-        polynom_str = polynom_str.replace("²", "^2")
-        if re.match(cls.full_pattern, polynom_str) is None:
+        # drops whitespace, maps x to X and ² to ^2
+        polynom_str = polynom_str.strip().translate(NORMALIZATION_TABLE)
+        if cls.full_pattern.match(polynom_str) is None:
             raise ValueError(
                 "Invalid polynomial string to parse: contains invalid characters."
             )
@@ -445,11 +966,11 @@ class PolynomParser:
             raise ValueError(
                 "Invalid polynomial string to parse: '=' should be present exactly once."
             )
-        if re.search(r"\^\D", polynom_str) or re.search(r"\d\^", polynom_str):
+        if cls.power_pattern.search(polynom_str):
             raise ValueError(
                 "Invalid polynomial string to parse: contains invalid power notation."
             )
-        if re.search(r"[\^\-+*=]$", polynom_str) or re.search(r"^[*\^=]", polynom_str):
+        if cls.edge_operator_pattern.search(polynom_str):
             raise ValueError(
                 "Invalid polynomial string to parse: cannot start or end with an operator."
             )
@@ -459,7 +980,7 @@ class PolynomParser:
     def split_terms(cls, polynomial_str: str) -> List[str]:
         if not polynomial_str.startswith("+") and not polynomial_str.startswith("-"):
             polynomial_str = "+" + polynomial_str
-        terms = re.split(pattern=cls.term_pattern, string=polynomial_str)
+        terms = cls.term_pattern.split(polynomial_str)
         terms = terms[1:]  # the first match will always be empty
         if "-" in terms or "+" in terms:
             raise ValueError("Invalid polynomial string: contains invalid operator sequence.")
@@ -467,19 +988,39 @@ class PolynomParser:
 
     @classmethod
     def parse(cls, polynomial_str: str):
-        """Parse a polynomial string into a list of PolynomialTerm objects."""
-        polynomial_str = cls.normalize(polynomial_str)
-        # Now we need to transfer terms from after equal sign to before with sign change
-        polynomial_left, polynomial_right = polynomial_str.split("=")
-        left_terms = cls.split_terms(polynomial_left)
-        right_terms = cls.split_terms(polynomial_right)
+        """Parse a polynomial string into a list of PolynomialTerm objects.
 
-        terms = []
-        for term in left_terms:
-            terms.append(PolynomialTerm.from_string(term))
+        Terms from the right side of the equation are moved to the left one with
+        the sign changed. The string is scanned once by ``computor.lexer.tokenize_scaled``.
+        Decimal coefficients are scaled to integers, see ``parse_scaled``.
+        """
+        return cls.parse_scaled(polynomial_str)[0]
 
-        for term in right_terms:
-            new_term = PolynomialTerm.from_string(term) * -1
-            terms.append(new_term)
+    @classmethod
+    @stats.stage("parser.parse", lambda args, result: {"terms": len(result[0])})
+    def parse_scaled(cls, polynomial_str: str) -> Tuple[List[PolynomialTerm], int]:
+        """Like ``parse``, also returning the power of ten the coefficients were multiplied by.
 
-        return terms
+        UTF-8 encoded bytes are accepted as well, see ``computor.lexer.tokenize_bytes``.
+        """
+        if isinstance(polynomial_str, bytes):
+            pairs, scale = tokenize_bytes(polynomial_str)
+        else:
+            pairs, scale = tokenize_scaled(polynomial_str)
+        return [PolynomialTerm(coefficient, degree) for coefficient, degree in pairs], scale
+
+    @classmethod
+    def try_parse(cls, polynomial_str) -> ParseResult:
+        """Like ``parse_scaled``, returning the terms or the error code and position in a ParseResult.
+
+        Nothing is raised for invalid equations, see ``computor.lexer.try_tokenize``.
+        """
+        result = lexer.try_tokenize(polynomial_str)
+        if not result.ok:
+            return result
+        return result._replace(terms=[PolynomialTerm(coefficient, degree) for coefficient, degree in result.terms])
+
+    @classmethod
+    def validate(cls, polynomial_str) -> ParseResult:
+        """Check the syntax of an equation without raising, see ``computor.lexer.validate``."""
+        return lexer.validate(polynomial_str)
@@ -0,0 +1,287 @@
+"""Numeric roots of polynomials of any degree.
+
+Cubic and quartic equations are solved with closed forms (Cardano, Ferrari),
+higher degrees with the Aberth-Ehrlich simultaneous iteration vectorized over
+all roots with NumPy. Closed forms are applied to the polynomial in X / s, with
+a power of two s bringing the coefficients near 1 so that they cannot overflow,
+and their roots are polished with Newton steps on the original polynomial.
+Polynomials with integer coefficients of moderate degree are further refined
+with Aberth steps whose P / P' is computed exactly and rounded once, which
+removes the error of evaluating ill-conditioned polynomials in floats. Real
+roots are returned without a spurious imaginary part, non-finite or unconverged
+roots raise a ValueError.
+"""
+import cmath
+import math
+import sys
+from typing import List, Sequence
+
+import numpy as np
+
+# roots whose imaginary part is below this fraction of their magnitude are real
+REAL_TOLERANCE = 1e-10
+ABERTH_MAX_ITERATIONS = 500
+# exact evaluation costs grow with the square of the degree
+EXACT_REFINE_MAX_DEGREE = 100
+EXACT_REFINE_ITERATIONS = 50
+
+
+def find_roots(coefficients: Sequence[float]) -> List[complex]:
+    """Returns all roots, counted with multiplicity, of a polynomial with real coefficients.
+
+    :param coefficients: Coefficients from the highest degree to the constant
+        term. Leading zeros are ignored. When all of them are ints, the roots
+        are refined with exact arithmetic up to EXACT_REFINE_MAX_DEGREE.
+    """
+    exact = list(coefficients)
+    while exact and exact[0] == 0:
+        exact.pop(0)
+    if not exact:
+        raise ValueError("Polynomial has no non-zero coefficient.")
+    # X^k factors give k roots at zero, keep them out of the iteration
+    zeros = 0
+    while len(exact) > 1 and exact[-1] == 0:
+        exact.pop()
+        zeros += 1
+    coefficients = [float(coefficient) for coefficient in exact]
+
+    degree = len(coefficients) - 1
+    if degree == 0:
+        roots = []
+    elif degree == 1:
+        roots = [complex(-coefficients[1] / coefficients[0])]
+    elif degree <= 4:
+        closed_form = (solve_quadratic, solve_cubic, solve_quartic)[degree - 2]
+        exponent = scale_exponent(coefficients)
+        scaled = [math.ldexp(coefficient, -power * exponent) for power, coefficient in enumerate(coefficients)]
+        roots = [polish(coefficients, math.ldexp(1.0, exponent) * root) for root in closed_form(*scaled)]
+        if not all(cmath.isfinite(root) for root in roots):
+            roots = list(aberth(np.array(coefficients)))
+    else:
+        # Aberth already iterates to full precision, no polishing needed
+        roots = list(aberth(np.array(coefficients)))
+    if not all(cmath.isfinite(root) for root in roots):
+        raise ValueError("Roots of the polynomial are beyond the float range.")
+    if 1 < degree <= EXACT_REFINE_MAX_DEGREE and all(type(coefficient) is int for coefficient in exact):
+        roots = refine(exact, roots)
+    return [0j] * zeros + [snap_real(complex(root)) for root in roots]
+
+
+def scale_exponent(coefficients: Sequence[float]) -> int:
+    """Exponent e such that the roots of the polynomial in X / 2^e have magnitudes near 1.
+
+    2^e approximates max |c_k / c_0| ^ (1 / k), a bound of the root magnitudes.
+    Scaling by a power of two is exact.
+    """
+    leading = coefficients[0]
+    exponents = [
+        math.frexp(abs(coefficient / leading))[1] / power
+        for power, coefficient in enumerate(coefficients)
+        if power and coefficient
+    ]
+    return round(max(exponents, default=0))
+
+
+def solve_quadratic(a: float, b: float, c: float) -> List[complex]:
+    sqrt_discriminant = cmath.sqrt(b * b - 4 * a * c)
+    # avoid cancellation between b and the root of the discriminant
+    q = -(b + sqrt_discriminant) / 2 if b.real >= 0 else -(b - sqrt_discriminant) / 2
+    if q == 0:
+        return [0j, 0j]
+    return [q / a, c / q]
+
+
+def solve_cubic(a: float, b: float, c: float, d: float) -> List[complex]:
+    """Cardano's formula in complex arithmetic."""
+    delta0 = b * b - 3 * a * c
+    delta1 = 2 * b**3 - 9 * a * b * c + 27 * a * a * d
+    if delta0 == 0 and delta1 == 0:
+        return [complex(-b / (3 * a))] * 3
+    sqrt_term = cmath.sqrt(delta1 * delta1 - 4 * delta0**3)
+    # pick the sign that keeps C away from zero
+    if abs(delta1 + sqrt_term) >= abs(delta1 - sqrt_term):
+        inner = (delta1 + sqrt_term) / 2
+    else:
+        inner = (delta1 - sqrt_term) / 2
+    cube_root_of_unity = complex(-0.5, 3**0.5 / 2)
+    roots = []
+    big_c = inner ** (1 / 3)
+    for _ in range(3):
+        roots.append(-(b + big_c + delta0 / big_c) / (3 * a))
+        big_c *= cube_root_of_unity
+    return roots
+
+
+def solve_quartic(a: float, b: float, c: float, d: float, e: float) -> List[complex]:
+    """Ferrari's method through the depressed quartic y^4 + p*y^2 + q*y + r = 0."""
+    b, c, d, e = b / a, c / a, d / a, e / a
+    shift = -b / 4
+    p = c - 3 * b * b / 8
+    q = d - b * c / 2 + b**3 / 8
+    r = e - b * d / 4 + b * b * c / 16 - 3 * b**4 / 256
+    if abs(q) <= 1e-14 * max(1.0, abs(p), abs(r)):
+        # biquadratic, y^2 solves a quadratic
+        squares = solve_quadratic(1.0, p, r)
+        roots = []
+        for square in squares:
+            root = cmath.sqrt(square)
+            roots.extend((root, -root))
+        return [root + shift for root in roots]
+    # any non-zero root of the resolvent cubic will do, take the largest
+    resolvent = solve_cubic(8.0, 8 * p, 2 * p * p - 8 * r, -q * q)
+    m = max(resolvent, key=abs)
+    sqrt_2m = cmath.sqrt(2 * m)
+    roots = []
+    for sign in (1, -1):
+        inner = cmath.sqrt(-(2 * p + 2 * m + sign * 2 * q / sqrt_2m))
+        roots.append((sign * sqrt_2m + inner) / 2 + shift)
+        roots.append((sign * sqrt_2m - inner) / 2 + shift)
+    return roots
+
+
+def aberth(coefficients: np.ndarray, tolerance: float = 1e-14) -> np.ndarray:
+    """Aberth-Ehrlich iteration improving all roots at once.
+
+    A root stops moving once its step is below ``tolerance`` relative to its
+    magnitude, once |P(z)| is within the rounding error of evaluating P
+    (``degree * eps * sum(|c_k| |z|^k)``), or once its step stops shrinking
+    after reaching about ``sqrt(eps)``. Multiple roots only reach an accuracy
+    of about ``eps ** (1 / multiplicity)``, split them off first, see
+    ``computor.arithmetic.square_free_factors``.
+
+    Raises a ValueError when some roots have not converged after ABERTH_MAX_ITERATIONS.
+    """
+    coefficients = coefficients / coefficients[0]
+    degree = len(coefficients) - 1
+    derivative = coefficients[:-1] * np.arange(degree, 0, -1)
+    # outside the unit circle p/p' is evaluated on the reversed polynomial in 1/z,
+    # so that z^degree never overflows
+    reversed_coefficients = coefficients[::-1]
+    reversed_derivative = reversed_coefficients[:-1] * np.arange(degree, 0, -1)
+    # |P(z)| below this times sum(|c_k| |z|^k) is rounding noise
+    rounding = degree * np.finfo(float).eps
+    stalled_step = np.sqrt(np.finfo(float).eps)
+    absolute, reversed_absolute = np.abs(coefficients), np.abs(reversed_coefficients)
+
+    # start on a circle with the geometric mean of the root moduli, rotated off the real axis
+    radius = abs(coefficients[-1]) ** (1 / degree)
+    angles = 2 * np.pi * np.arange(degree) / degree + 0.4
+    roots = radius * np.exp(1j * angles)
+
+    active = np.ones(degree, dtype=bool)
+    previous_step = np.full(degree, np.inf)
+    with np.errstate(all="ignore"):
+        for _ in range(ABERTH_MAX_ITERATIONS):
+            z = roots[active]
+            ratio = np.empty_like(z)
+            noise = np.empty(len(z), dtype=bool)
+            inside = np.abs(z) <= 1
+            z_in = z[inside]
+            value = np.polyval(coefficients, z_in)
+            ratio[inside] = value / np.polyval(derivative, z_in)
+            noise[inside] = np.abs(value) <= rounding * np.polyval(absolute, np.abs(z_in))
+            w = 1 / z[~inside]
+            value = np.polyval(reversed_coefficients, w)
+            ratio[~inside] = 1 / (w * (degree - w * np.polyval(reversed_derivative, w) / value))
+            noise[~inside] = np.abs(value) <= rounding * np.polyval(reversed_absolute, np.abs(w))
+            differences = z[:, None] - roots[None, :]
+            differences[np.arange(len(z)), np.flatnonzero(active)] = np.inf
+            repulsion = np.sum(1 / differences, axis=1)
+            step = ratio / (1 - ratio * repulsion)
+            step[~np.isfinite(step)] = 0
+            roots[active] = z - step
+            size = np.abs(step)
+            scale = np.maximum(np.abs(z), 1)
+            last = previous_step[active]
+            stalled = (size >= last) & (last <= stalled_step * scale)
+            converged = (size <= tolerance * scale) | noise | stalled
+            previous_step[active] = size
+            active[np.flatnonzero(active)[converged]] = False
+            if not active.any():
+                break
+    if active.any():
+        raise ValueError(f"Roots did not converge in {ABERTH_MAX_ITERATIONS} iterations.")
+    return roots
+
+
+def exact_ratio(coefficients: Sequence[int], root: complex) -> complex:
+    """P(root) / P'(root) of a polynomial with int coefficients, rounded once.
+
+    The parts of the root are binary fractions x / D and y / D, Horner's scheme
+    runs on the Gaussian integers D^t * (partial value) so that nothing is rounded
+    before the final division.
+    """
+    real_numerator, real_denominator = root.real.as_integer_ratio()
+    imag_numerator, imag_denominator = root.imag.as_integer_ratio()
+    denominator = max(real_denominator, imag_denominator)
+    x = real_numerator * (denominator // real_denominator)
+    y = imag_numerator * (denominator // imag_denominator)
+    value_real, value_imag = coefficients[0], 0
+    slope_real, slope_imag = 0, 0
+    power = 1
+    for coefficient in coefficients[1:]:
+        power *= denominator
+        slope_real, slope_imag = (
+            slope_real * x - slope_imag * y + denominator * value_real,
+            slope_real * y + slope_imag * x + denominator * value_imag,
+        )
+        value_real, value_imag = (
+            value_real * x - value_imag * y + coefficient * power,
+            value_real * y + value_imag * x,
+        )
+    norm = slope_real * slope_real + slope_imag * slope_imag
+    if norm == 0:
+        return complex(math.nan, math.nan)
+    # int / int rounds correctly, however large both sides are
+    return complex(
+        (value_real * slope_real + value_imag * slope_imag) / norm,
+        (value_imag * slope_real - value_real * slope_imag) / norm,
+    )
+
+
+def refine(coefficients: Sequence[int], roots: Sequence[complex]) -> List[complex]:
+    """Aberth steps with exact ratios until no root moves, see ``exact_ratio``.
+
+    The repulsion between roots keeps them from collapsing on the same root,
+    which plain Newton steps from float estimates do not guarantee.
+    """
+    roots = list(roots)
+    for _ in range(EXACT_REFINE_ITERATIONS):
+        moved = False
+        for index, root in enumerate(roots):
+            ratio = exact_ratio(coefficients, root)
+            repulsion = sum(1 / (root - other) for other in roots if other != root)
+            step = ratio / (1 - ratio * repulsion)
+            if not cmath.isfinite(step):
+                continue
+            roots[index] = root - step
+            # the last bit may flip back and forth, only larger steps call for another pass
+            moved = moved or abs(step) > 2 * sys.float_info.epsilon * abs(root)
+        if not moved:
+            break
+    return roots
+
+
+def polish(coefficients: Sequence[float], root: complex, steps: int = 2) -> complex:
+    """Improve a root with a few Newton steps, keeping it if a step makes it worse."""
+    for _ in range(steps):
+        value, slope = 0j, 0j
+        for coefficient in coefficients:
+            slope = slope * root + value
+            value = value * root + coefficient
+        if slope == 0:
+            break
+        candidate = root - value / slope
+        candidate_value = 0j
+        for coefficient in coefficients:
+            candidate_value = candidate_value * candidate + coefficient
+        if abs(candidate_value) >= abs(value):
+            break
+        root = candidate
+    return root
+
+
+def snap_real(root: complex) -> complex:
+    if abs(root.imag) <= REAL_TOLERANCE * max(1.0, abs(root)):
+        return complex(root.real, 0.0)
+    return root
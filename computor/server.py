@@ -0,0 +1,281 @@
+"""Long-running solver service speaking line-delimited JSON over TCP or a Unix socket.
+
+Every request line is a JSON object ``{"id": ..., "equation": "..."}`` and
+gets one response line: the batch record of the equation (see
+``computor.batch.RECORD_FIELDS``, without ``line``) with the request ``id``.
+``{"command": "stats"}`` returns the service counters instead.
+
+Requests from all connections go through one bounded queue and are solved in
+small batches by a single solver task, which keeps the factory warm and
+amortizes the event loop overhead. Batches are solved on a worker thread, so
+a slow equation delays the requests queued behind it but not the reading and
+writing of the connections. A full queue stops reading from the sockets, so
+clients are slowed down instead of the server running out of memory.
+Responses are sent in the request order of their connection. Request lines
+longer than ``line_limit`` bytes are skipped and answered with an error.
+"""
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from computor.batch import RECORD_FIELDS, solve_record
+from computor.polynominal import PolynomParser, PolynomialFactory
+from computor.solution import error_message
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BATCH_DELAY = 0.001
+DEFAULT_QUEUE_SIZE = 1024
+DEFAULT_LINE_LIMIT = 2**16
+LATENCY_SAMPLES = 10000
+
+
+class SolverServer:
+    """Solver service, started with ``start_tcp`` or ``start_unix`` and stopped with ``close``."""
+
+    def __init__(
+        self,
+        factory: Optional[PolynomialFactory] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_delay: float = DEFAULT_BATCH_DELAY,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        line_limit: int = DEFAULT_LINE_LIMIT,
+    ):
+        """
+        :param factory: Factory shared by all requests, a new one by default.
+        :param batch_size: Largest number of requests solved in one batch.
+        :param batch_delay: Seconds to wait for more requests before solving a
+            batch that is not full.
+        :param queue_size: Requests waiting to be solved, and responses waiting
+            to be sent per connection, before reading from clients pauses.
+        :param line_limit: Longest request line in bytes, also the size of the
+            read buffer of each connection.
+        """
+        if batch_size < 1 or queue_size < 1 or line_limit < 1:
+            raise ValueError("Batch and queue sizes and the line limit must be positive integers.")
+        self.factory = factory or PolynomialFactory(PolynomParser())
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.queue_size = queue_size
+        self.line_limit = line_limit
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.connections = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._started = time.monotonic()
+        self._queue: Optional[asyncio.Queue] = None
+        self._solver: Optional[asyncio.Task] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Listen on a TCP address, port 0 picks a free port (see ``address``)."""
+        self._start_solver()
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=self.line_limit)
+        return self._server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._start_solver()
+        self._server = await asyncio.start_unix_server(self._handle_connection, path, limit=self.line_limit)
+        return self._server
+
+    @property
+    def address(self):
+        """Address of the listening socket, (host, port) for TCP."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._solver is not None:
+            self._solver.cancel()
+            try:
+                await self._solver
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            # a batch being solved finishes on its own, its results are dropped
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def counters(self) -> Dict[str, Any]:
+        """Request, error and batch counts, throughput and latency percentiles in milliseconds."""
+        latencies = sorted(self._latencies)
+
+        def percentile(percent):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(percent / 100 * len(latencies)))] * 1e3
+
+        uptime = time.monotonic() - self._started
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "connections": self.connections,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "uptime_s": uptime,
+            "throughput_per_s": self.requests / uptime if uptime else 0.0,
+            "latency_p50_ms": percentile(50),
+            "latency_p99_ms": percentile(99),
+        }
+
+    def _start_solver(self):
+        if self._solver is None:
+            self._queue = asyncio.Queue(self.queue_size)
+            # one thread, batches are solved one after the other
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="computor-solver")
+            self._solver = asyncio.create_task(self._solve_batches())
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        responses = asyncio.Queue(self.queue_size)
+        sender = asyncio.create_task(self._send_responses(responses, writer))
+        try:
+            while True:
+                line = await self._read_line(reader)
+                if line is None:
+                    self.errors += 1
+                    future = asyncio.get_running_loop().create_future()
+                    future.set_result(
+                        {"id": None, "error": f"Invalid request: longer than {self.line_limit} bytes."}
+                    )
+                    await responses.put(future)
+                    continue
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await responses.put(await self._submit(line))
+        except ConnectionError:
+            pass
+        finally:
+            await responses.put(None)
+            await sender
+            self.connections -= 1
+
+    @staticmethod
+    async def _read_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+        """Next line, empty at the end of the stream, None for a line over the limit, which is skipped."""
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            # the last line may have no newline
+            return e.partial
+        except asyncio.LimitOverrunError as e:
+            overrun = e
+        # drop the line from the buffer part by part, up to its newline or the end of the stream
+        while True:
+            try:
+                await reader.readexactly(overrun.consumed)
+                await reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as e:
+                overrun = e
+
+    async def _submit(self, line: bytes) -> "asyncio.Future":
+        """Turn a request line into a future of its response."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            request = None
+        if not isinstance(request, dict):
+            self.errors += 1
+            future.set_result({"id": None, "error": "Invalid request: expected a JSON object."})
+        else:
+            # waits while the queue is full, which stops reading from this client
+            await self._queue.put((request, future, time.monotonic()))
+        return future
+
+    async def _send_responses(self, responses: asyncio.Queue, writer: asyncio.StreamWriter):
+        connected = True
+        while True:
+            future = await responses.get()
+            if future is None:
+                break
+            response = await future
+            if not connected:
+                # keep consuming, so the reading side never blocks on a full queue
+                continue
+            try:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+        writer.close()
+
+    async def _solve_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.batches += 1
+            # solved on the solver thread, the event loop keeps serving the connections meanwhile
+            records = await loop.run_in_executor(self._executor, self._solve_batch, [item[0] for item in batch])
+            solved = time.monotonic()
+            for (request, future, received), record in zip(batch, records):
+                if record is None:
+                    # answered in turn, so the counters include the requests sent before
+                    response = {"id": request.get("id"), "stats": self.counters()}
+                else:
+                    response = self._respond(request, record)
+                    self._latencies.append(solved - received)
+                if not future.done():
+                    future.set_result(response)
+
+    def _solve_batch(self, requests: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Records of the equations of a batch, None for commands. Runs on the solver thread."""
+        return [None if request.get("command") == "stats" else self._solve(request) for request in requests]
+
+    def _solve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return solve_record(self.factory, None, request.get("equation"))
+        except Exception as e:
+            record = dict.fromkeys(RECORD_FIELDS)
+            record["equation"] = request.get("equation")
+            record["error"] = error_message(e)
+            return record
+
+    def _respond(self, request: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+        self.requests += 1
+        if record["error"] is not None:
+            self.errors += 1
+        del record["line"]
+        return {"id": request.get("id"), **record}
+
+
+async def serve(address: str, **options):
+    """Run a SolverServer until cancelled.
+
+    :param address: ``HOST:PORT`` for TCP or ``unix:PATH`` for a Unix socket.
+    """
+    server = SolverServer(**options)
+    if address.startswith("unix:"):
+        await server.start_unix(address[len("unix:"):])
+    else:
+        host, _, port = address.rpartition(":")
+        if not port.isdigit():
+            raise ValueError(f'Invalid address "{address}", expected HOST:PORT or unix:PATH.')
+        await server.start_tcp(host or "127.0.0.1", int(port))
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
@@ -0,0 +1,244 @@
+"""Structured result of solving one equation.
+
+A ``Solution`` keeps the polynomial and computes its fields when they are
+read: consumers that only need the degree, the root count or the numeric
+roots never build the reduced form or the solution string. ``to_record``
+turns a solution into the flat batch record, for the requested fields only,
+and ``to_array`` packs many solutions into a NumPy structured array.
+
+Equations equal up to a constant factor have the same roots: a solution can
+take them from a ``solved`` polynomial shared with its duplicates, see
+``Polynomial.canonical``, while the reduced form, degree and discriminant
+still come from its own polynomial. Numeric roots of the shared polynomial
+may differ from the polynomial's own in the last digits.
+"""
+import math
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+from computor.algebraic import AlgebraicNumber
+
+RECORD_FIELDS = (
+    "line",
+    "equation",
+    "reduced_form",
+    "degree",
+    "discriminant",
+    "solutions_count",
+    "solutions",
+    "error",
+)
+# fields available to ``Solution.to_record`` besides the record ones
+EXTRA_FIELDS = ("roots",)
+DEFAULT_MAX_ROOTS = 2
+
+
+class Solution:
+    """Outcome of solving an equation: a polynomial, or the error it could not be built with."""
+
+    __slots__ = ("line", "equation", "polynomial", "error", "solved")
+
+    def __init__(
+        self, line: Optional[int], equation: Any, polynomial=None, error: Optional[str] = None, solved=None
+    ):
+        """
+        :param line: Position of the equation in its input, None outside a batch.
+        :param equation: The equation as given, a string, bytes or any invalid value.
+        :param polynomial: The polynomial built from the equation, None on error.
+        :param error: Message of the error raised while building it.
+        :param solved: Constant multiple of ``polynomial`` the roots are read
+            from, ``polynomial`` when None.
+        """
+        self.line = line
+        self.equation = equation
+        self.polynomial = polynomial
+        self.error = error
+        self.solved = solved if solved is not None else polynomial
+
+    @property
+    def ok(self) -> bool:
+        return self.polynomial is not None
+
+    @property
+    def degree(self) -> Optional[int]:
+        return self.polynomial.degree if self.polynomial is not None else None
+
+    @property
+    def discriminant(self):
+        """Discriminant of a second degree equation, None otherwise."""
+        if self.polynomial is None or self.polynomial.degree != 2:
+            return None
+        return self.polynomial.discriminant
+
+    @property
+    def solutions_count(self):
+        """Same as ``Polynomial.solutions_count``: -1 and ``inf`` for zero degree equations."""
+        return self.solved.solutions_count if self.polynomial is not None else None
+
+    @property
+    def exact_roots(self) -> Optional[Tuple[AlgebraicNumber, ...]]:
+        """Roots of equations up to degree 2 as exact numbers, None above and on error."""
+        if self.polynomial is None or self.polynomial.degree > 2:
+            return None
+        if self.polynomial.degree == 0:
+            return ()
+        return self._ordered(self.solved.get_exact_solutions())
+
+    @property
+    def roots(self) -> Tuple[complex, ...]:
+        """Numeric roots, floats for real ones, empty on error."""
+        return self._ordered(tuple(self.solved.get_solutions())) if self.polynomial is not None else ()
+
+    @property
+    def reduced_form(self) -> Optional[str]:
+        return self.polynomial.get_reduced_form() if self.polynomial is not None else None
+
+    @property
+    def solution_string(self) -> Optional[str]:
+        if self.polynomial is None:
+            return None
+        if self._reversed:
+            return ", ".join("x = " + str(root) for root in self.exact_roots)
+        return self.solved.get_solution_string()
+
+    @property
+    def _reversed(self) -> bool:
+        # quadratic roots come as (-b + sqrt(D)) / 2a first, the order flips with the sign of a
+        solved, polynomial = self.solved, self.polynomial
+        if solved is polynomial or polynomial.degree != 2:
+            return False
+        return (polynomial.coefficient(2) < 0) != (solved.coefficient(2) < 0)
+
+    def _ordered(self, roots: tuple) -> tuple:
+        """Roots of ``solved`` in the order of the polynomial's own."""
+        return roots[::-1] if self._reversed else roots
+
+    def to_record(self, fields: Sequence[str] = RECORD_FIELDS) -> Dict[str, Any]:
+        """Flat, JSON serializable description of the solution, see ``RECORD_FIELDS``.
+
+        Only the requested fields are computed, leave out ``reduced_form`` and
+        ``solutions`` to skip string formatting. An error raised while computing
+        a field is stored in ``error`` (when requested) and leaves the
+        remaining fields empty, see ``error_message``.
+        """
+        unknown = [field for field in fields if field not in RECORD_FIELDS and field not in EXTRA_FIELDS]
+        if unknown:
+            raise KeyError(f"Unknown record fields: {', '.join(unknown)}")
+        record = dict.fromkeys(fields)
+        try:
+            for field in fields:
+                if field != "error":
+                    record[field] = self._record_value(field)
+        except Exception as e:
+            if "error" in record:
+                record["error"] = error_message(e)
+        else:
+            if "error" in record:
+                record["error"] = self.error
+        return record
+
+    def _record_value(self, field: str):
+        if field == "line":
+            return self.line
+        if field == "equation":
+            if isinstance(self.equation, bytes):
+                return self.equation.decode(errors="replace").strip()
+            return self.equation.strip() if isinstance(self.equation, str) else self.equation
+        if self.polynomial is None:
+            return None
+        if field == "reduced_form":
+            return self.reduced_form
+        if field == "degree":
+            return self.degree
+        if field == "discriminant":
+            discriminant = self.discriminant
+            # the Decimal discriminant of decimal coefficients is not JSON serializable
+            return discriminant if discriminant is None or isinstance(discriminant, int) else float(discriminant)
+        if field == "solutions_count":
+            solutions_count = self.solutions_count
+            # JSON has no infinity, keep the record portable
+            return "inf" if solutions_count == float("inf") else solutions_count
+        if field == "solutions":
+            return self.solution_string
+        # roots, as [real, imaginary] pairs
+        return [[root.real, getattr(root, "imag", 0.0)] for root in self.roots]
+
+    def __repr__(self):
+        if self.polynomial is None:
+            return f"Solution(line={self.line!r}, equation={self.equation!r}, error={self.error!r})"
+        return f"Solution(line={self.line!r}, equation={self.equation!r}, degree={self.degree})"
+
+
+def error_message(error: Exception) -> str:
+    """Message stored for an error: the text of a ValueError, prefixed by the type name for any other."""
+    if isinstance(error, ValueError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+def solve(factory, equation: Any, line: Optional[int] = None) -> Solution:
+    """Build the polynomial of an equation, keeping any error raised as the solution error."""
+    try:
+        return Solution(line, equation, factory.create(equation))
+    except Exception as e:
+        # an overflow or a bug on one equation must not take down a whole batch
+        return Solution(line, equation, error=error_message(e))
+
+
+def array_dtype(max_roots: int = DEFAULT_MAX_ROOTS):
+    """NumPy dtype of the rows of ``to_array``.
+
+    ``degree`` is -1 and ``solutions_count`` is nan for errors, ``discriminant``
+    is nan below degree 2, and ``roots`` is padded with nan.
+    """
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("line", np.int64),
+            ("degree", np.int64),
+            ("discriminant", np.float64),
+            ("solutions_count", np.float64),
+            ("roots", np.complex128, (max_roots,)),
+            ("error", np.bool_),
+        ]
+    )
+
+
+def to_array(solutions: Iterable[Solution], max_roots: int = DEFAULT_MAX_ROOTS):
+    """Pack solutions into a structured array of ``array_dtype(max_roots)``.
+
+    Roots beyond ``max_roots`` are dropped, a line of None is stored as -1.
+    Any error raised while solving marks the row as an error.
+    """
+    import numpy as np
+
+    return np.array([_array_row(solution, max_roots) for solution in solutions], dtype=array_dtype(max_roots))
+
+
+def _array_row(solution: Solution, max_roots: int) -> tuple:
+    line = solution.line if solution.line is not None else -1
+    failed = (line, -1, math.nan, math.nan, (complex(math.nan, math.nan),) * max_roots, True)
+    if solution.polynomial is None:
+        return failed
+    try:
+        discriminant = solution.discriminant
+        roots = solution.roots[:max_roots]
+        return (
+            line,
+            solution.degree,
+            math.nan if discriminant is None else _to_float(discriminant),
+            float(solution.solutions_count),
+            tuple(roots) + (complex(math.nan, math.nan),) * (max_roots - len(roots)),
+            False,
+        )
+    except Exception:
+        # the same errors to_record keeps in the record, e.g. roots beyond the float range
+        return failed
+
+
+def _to_float(value) -> float:
+    try:
+        return float(value)
+    except OverflowError:
+        # integers beyond the float range
+        return math.copysign(math.inf, value)
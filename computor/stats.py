@@ -0,0 +1,198 @@
+"""Opt-in instrumentation of the solving stages.
+
+Functions decorated with ``stage`` record their call count, wall time and,
+optionally, the size of their input. Collection is disabled by default, and
+a disabled stage only adds a wrapper call and a flag check. Counters
+(``count``) cover events that are not function calls, like batch errors.
+
+    from computor import stats
+    stats.enable()
+    ...
+    print(stats.format_summary())
+
+Stage times are inclusive: a stage calling another one, like
+``polynomial.solution_string`` calling ``algebraic.quadratic_roots``, includes its time.
+Measurements of concurrent threads are added under a lock.
+"""
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
+
+_enabled = False
+_stages: Dict[str, "StageRecord"] = {}
+_counters: Dict[str, int] = {}
+# guards _stages and _counters while collection is enabled
+_lock = threading.Lock()
+
+
+class StageStats(NamedTuple):
+    """Snapshot of the measurements of one stage."""
+
+    calls: int
+    total_ns: int
+    max_ns: int
+    # size name -> (sum over all calls, largest value seen)
+    sizes: Mapping[str, Tuple[int, int]]
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+class StatsSnapshot(NamedTuple):
+    stages: Mapping[str, StageStats]
+    counters: Mapping[str, int]
+
+
+class StageRecord:
+    """Mutable accumulator behind a StageStats snapshot."""
+
+    __slots__ = ("calls", "total_ns", "max_ns", "sizes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.sizes: Dict[str, list] = {}
+
+    def add(self, elapsed_ns: int, sizes: Optional[Mapping[str, int]]):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        if sizes:
+            for name, value in sizes.items():
+                size = self.sizes.get(name)
+                if size is None:
+                    self.sizes[name] = [value, value]
+                else:
+                    size[0] += value
+                    if value > size[1]:
+                        size[1] = value
+
+    def snapshot(self) -> StageStats:
+        sizes = {name: (total, largest) for name, (total, largest) in self.sizes.items()}
+        return StageStats(self.calls, self.total_ns, self.max_ns, sizes)
+
+
+def stage(name: str, measure: Optional[Callable[[tuple, Any], Mapping[str, int]]] = None):
+    """Decorator timing every call of a function as the stage ``name``.
+
+    :param name: Stage name, dotted by component, e.g. ``"parser.parse"``.
+    :param measure: Optional callable receiving the positional arguments and
+        the result of a call and returning input sizes to record, e.g.
+        ``{"terms": 3}``. It only runs while collection is enabled.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            clock = time.perf_counter_ns
+            start = clock()
+            result = func(*args, **kwargs)
+            elapsed = clock() - start
+            sizes = measure(args, result) if measure is not None else None
+            with _lock:
+                record = _stages.get(name)
+                if record is None:
+                    record = _stages[name] = StageRecord()
+                record.add(elapsed, sizes)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, amount: int = 1):
+    """Increase the counter ``name`` while collection is enabled."""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Forget everything recorded so far."""
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+
+
+def snapshot() -> StatsSnapshot:
+    """Returns a copy of the measurements, unaffected by later calls."""
+    with _lock:
+        return StatsSnapshot(
+            {name: record.snapshot() for name, record in _stages.items()}, dict(_counters)
+        )
+
+
+def merge(stats: StatsSnapshot):
+    """Add a snapshot taken elsewhere, e.g. in a worker process, to the current measurements."""
+    with _lock:
+        for name, stage_stats in stats.stages.items():
+            record = _stages.get(name)
+            if record is None:
+                record = _stages[name] = StageRecord()
+            record.calls += stage_stats.calls
+            record.total_ns += stage_stats.total_ns
+            record.max_ns = max(record.max_ns, stage_stats.max_ns)
+            for size, (total, largest) in stage_stats.sizes.items():
+                current = record.sizes.setdefault(size, [0, largest])
+                current[0] += total
+                current[1] = max(current[1], largest)
+        for name, value in stats.counters.items():
+            _counters[name] = _counters.get(name, 0) + value
+
+
+def coefficient_bits(coefficients) -> int:
+    """Bit length of the largest coefficient, the size that drives the integer arithmetic."""
+    return max((abs(coefficient).bit_length() for coefficient in coefficients), default=0)
+
+
+def dedup_ratio(stats: Optional[StatsSnapshot] = None) -> Optional[float]:
+    """Share of the deduplicated batch equations whose roots were shared, None without deduplication.
+
+    See ``computor.batch.deduplicate`` for the ``batch.canonical`` and ``batch.duplicates`` counters.
+    """
+    counters = (stats if stats is not None else snapshot()).counters
+    duplicates = counters.get("batch.duplicates", 0)
+    total = duplicates + counters.get("batch.canonical", 0)
+    return duplicates / total if total else None
+
+
+def format_summary(stats: Optional[StatsSnapshot] = None) -> str:
+    """Render a snapshot (the current one by default) as a plain text table."""
+    stats = stats if stats is not None else snapshot()
+    lines = [f"{'stage':<28} {'calls':>9} {'total ms':>10} {'mean us':>10} {'max us':>10}  sizes (mean/max)"]
+    for name, stage_stats in sorted(stats.stages.items()):
+        sizes = " ".join(
+            f"{size}={total / stage_stats.calls:.1f}/{largest}"
+            for size, (total, largest) in sorted(stage_stats.sizes.items())
+        )
+        lines.append(
+            f"{name:<28} {stage_stats.calls:>9} {stage_stats.total_ns / 1e6:>10.3f} "
+            f"{stage_stats.mean_ns / 1e3:>10.2f} {stage_stats.max_ns / 1e3:>10.2f}  {sizes}".rstrip()
+        )
+    for name, value in sorted(stats.counters.items()):
+        lines.append(f"{name:<28} {value:>9}")
+    ratio = dedup_ratio(stats)
+    if ratio is not None:
+        lines.append(f"{'batch.dedup_ratio':<28} {ratio:>9.3f}")
+    return "\n".join(lines)
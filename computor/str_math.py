@@ -1,53 +1,32 @@
+import math
 from typing import Set, Iterable, Tuple
 
-SMALLEST_PRIME = 2
+from computor import stats
+from computor.factorization import prime_factors, square_free_decomposition
 
 
+@stats.stage("str_math.sqrt_str", lambda args, result: {"bits": abs(args[0]).bit_length()})
 def sqrt_str(x):
-    is_complex = False
-    if x < 0:
-        is_complex = True
-        x *= -1
-
-    # Find the largest perfect square factor
-    i = int(x ** 0.5)
-    while i > 1:
-        if x % (i * i) == 0:
-            outside = str(i)
-            inside = str(int(x // (i * i)))
-            result = outside + "*sqrt(" + inside + ")" if inside != "1" else outside
-            if is_complex:
-                result += "*I"
-            return result
-        i -= 1
-
-    # If no perfect square factors found, return the original format
-    res = x ** 0.5
-    if res % 1 != 0:
-        res = "sqrt(" + str(x) + ")"
+    """Square root of an integer in the simplest radical form, e.g. "2*sqrt(5)", "3*I"."""
+    is_complex = x < 0
+    outside, inside = square_free_decomposition(-x if is_complex else x)
+    if inside == 1:
+        result = str(outside)
+    elif outside == 1:
+        result = "sqrt(" + str(inside) + ")"
     else:
-        res = str(int(res))
+        result = str(outside) + "*sqrt(" + str(inside) + ")"
     if is_complex:
-        res += "*I"
-    return res
+        result += "*I"
+    return result
 
 
 def get_prime_factors(number: int) -> Set[int]:
-    """Recursively decompose a number into its prime factors."""
-    # Base cases
-    if number <= 1:
-        return set()
-
-    divisor = SMALLEST_PRIME
-    while divisor * divisor <= number:
-        if number % divisor == 0:
-            return {divisor} | get_prime_factors(number // divisor)
-
-        divisor += 1
-
-    return {number}
+    """Decompose a number into its distinct prime factors."""
+    return prime_factors(number) if number > 1 else set()
 
 
+@stats.stage("str_math.divide_str")
 def divide_str(x, y):
     """Divide two numbers and return the result as a string."""
     if isinstance(y, str):
@@ -92,6 +71,16 @@ def divide_str(x, y):
     return result
 
 
+def format_decimal(value: int, scale: int) -> str:
+    """Render value / 10^scale exactly, without trailing zeros, e.g. (125, 2) -> "1.25"."""
+    if scale <= 0:
+        return str(value * 10**-scale)
+    sign = "-" if value < 0 else ""
+    whole, fraction = divmod(abs(value), 10**scale)
+    fraction_str = str(fraction).rjust(scale, "0").rstrip("0")
+    return f"{sign}{whole}.{fraction_str}" if fraction_str else f"{sign}{whole}"
+
+
 def prod(factors: Iterable[int]):
     """Calculate the product of the iterable with integers."""
     result = 1
@@ -100,26 +89,17 @@ def prod(factors: Iterable[int]):
     return result
 
 
+@stats.stage(
+    "str_math.simplify_fraction",
+    lambda args, result: {"bits": max(abs(args[0]).bit_length(), abs(args[1]).bit_length())},
+)
 def simplify_fraction(x, y) -> Tuple[int, int]:
     """Simplify a fraction x/y into its simplest form. Returns a tuple (numerator, denominator)."""
     if y == 0:
         raise ZeroDivisionError("Division by zero")
     if x == 0:
         return 0, 1
-    if x % y == 0:
-        return x // y, 1
-    sign = -1 if x / y < 0 else 1
-    x, y = abs(x), abs(y)
-    x_primes = get_prime_factors(x)
-    y_primes = get_prime_factors(y)
-    common_primes = set.intersection(x_primes, y_primes)
-    common_multiplier = 1
-    for prime in common_primes:
-        x_reduced = x
-        y_reduced = y
-        while x_reduced % prime == 0 and y_reduced % prime == 0:
-            common_multiplier *= prime
-            x_reduced //= prime
-            y_reduced //= prime
-    x, y = x // common_multiplier, y // common_multiplier
-    return sign * x, y
+    if y < 0:
+        x, y = -x, -y
+    common_divisor = math.gcd(x, y)
+    return x // common_divisor, y // common_divisor
@@ -0,0 +1,81 @@
+from typing import NamedTuple
+
+import numpy as np
+
+
+class QuadraticSolutions(NamedTuple):
+    """Solutions of many equations ``a*X^2 + b*X + c = 0`` stored column-wise.
+
+    Every field is an array with one entry per equation:
+
+    - ``degree``: degree of the reduced polynomial (0, 1 or 2).
+    - ``discriminant``: ``b^2 - 4ac`` in the common dtype of the inputs. Only
+      meaningful where ``degree == 2``.
+    - ``solutions_count``: same values as ``Polynomial.solutions_count``:
+      ``-1`` when the sides are not equal, ``inf`` when any X is a solution,
+      otherwise the number of distinct roots.
+    - ``x1``, ``x2``: complex roots, ``nan`` where the equation has fewer roots.
+    """
+
+    degree: np.ndarray
+    discriminant: np.ndarray
+    solutions_count: np.ndarray
+    x1: np.ndarray
+    x2: np.ndarray
+
+
+def solve_quadratics(a, b, c) -> QuadraticSolutions:
+    """Solve ``a*X^2 + b*X + c = 0`` for whole arrays of coefficients at once.
+
+    Rows with ``a == 0`` are solved as first degree equations and rows with
+    ``a == b == 0`` as zero degree ones, like ``PolynomialFactory`` builds
+    equations written with ``0 * X^2`` or ``0 * X`` terms.
+
+    Integer inputs keep the discriminant exact as long as ``b^2 - 4ac`` fits
+    into the integer dtype; pass float arrays for larger coefficients.
+
+    :param a: Coefficients of X^2, scalar or array-like.
+    :param b: Coefficients of X^1, broadcastable with ``a``.
+    :param c: Coefficients of X^0, broadcastable with ``a``.
+    :return: Column-wise solutions, see ``QuadraticSolutions``.
+    """
+    a, b, c = np.broadcast_arrays(np.asarray(a), np.asarray(b), np.asarray(c))
+    discriminant = b * b - 4 * a * c
+
+    second = a != 0
+    first = ~second & (b != 0)
+    zero = ~second & ~first
+    double_root = second & (discriminant == 0)
+
+    degree = np.where(second, 2, np.where(first, 1, 0)).astype(np.int8)
+
+    solutions_count = np.full(a.shape, 2.0)
+    solutions_count[double_root | first] = 1
+    solutions_count[zero] = np.where(c[zero] != 0, -1, np.inf)
+
+    a_f = a.astype(np.float64)
+    b_f = b.astype(np.float64)
+    c_f = c.astype(np.float64)
+    d_f = discriminant.astype(np.float64)
+
+    # sqrt(|D|) goes to the real or to the imaginary part, never through complex sqrt
+    sqrt_abs = np.sqrt(np.abs(d_f))
+    real = d_f >= 0
+
+    x1 = np.full(a.shape, np.nan, dtype=np.complex128)
+    x2 = np.full(a.shape, np.nan, dtype=np.complex128)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        two_a = 2 * a_f
+        # real roots from q = -(b + sign(b)*sqrt(D)) / 2, q/a and c/q, free of cancellation
+        positive_b = b_f >= 0
+        q = -(b_f + np.where(positive_b, sqrt_abs, -sqrt_abs)) / 2
+        plus = np.where(positive_b, c_f / q, q / a_f)
+        minus = np.where(positive_b, q / a_f, c_f / q)
+        center = -b_f / two_a
+        imag = sqrt_abs / two_a
+        x1 = np.where(second, np.where(real, plus + 0j, center + 1j * imag), x1)
+        x2 = np.where(second & ~double_root, np.where(real, minus + 0j, center - 1j * imag), x2)
+        x1 = np.where(double_root, -b_f / two_a + 0j, x1)
+        x1 = np.where(first, -c_f / b_f + 0j, x1)
+
+    return QuadraticSolutions(degree, discriminant, solutions_count, x1, x2)
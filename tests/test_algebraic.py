@@ -0,0 +1,78 @@
+import pytest
+
+from computor.algebraic import AlgebraicNumber
+from computor.polynominal import PolynomialFactory, PolynomParser
+
+
+@pytest.mark.parametrize(
+    "number,expected",
+    [
+        (AlgebraicNumber(6, 4), "3/2"),
+        (AlgebraicNumber(3, -6), "-1/2"),
+        (AlgebraicNumber.sqrt(12), "2*sqrt(3)"),
+        (AlgebraicNumber.sqrt(16), "4"),
+        (AlgebraicNumber.sqrt(-4), "2*I"),
+        (AlgebraicNumber.sqrt(-1), "I"),
+        (AlgebraicNumber.sqrt(-12) / 4, "sqrt(3)*I/2"),
+        (AlgebraicNumber.sqrt(8) / -6, "-sqrt(2)/3"),
+        (AlgebraicNumber(1, 2) - AlgebraicNumber.sqrt(20) / 4, "1/2 - sqrt(5)/2"),
+        (AlgebraicNumber(-1, 3) + AlgebraicNumber.sqrt(-18) / 3, "-1/3 + sqrt(2)*I"),
+        (AlgebraicNumber(), "0"),
+    ],
+)
+def test_render(number, expected):
+    assert str(number) == expected
+
+
+def test_normalization_and_equality():
+    assert AlgebraicNumber(radical_numerator=2, radical_denominator=4, radicand=8) == AlgebraicNumber.sqrt(2)
+    # sqrt of a perfect square folds into the rational part
+    assert AlgebraicNumber(1, 2, radical_numerator=1, radical_denominator=2, radicand=9) == 2
+    assert AlgebraicNumber(radical_numerator=1, radicand=-4, imaginary=True) == -2
+    assert hash(AlgebraicNumber(4, 2)) == hash(2)
+    assert {AlgebraicNumber.sqrt(12), AlgebraicNumber.sqrt(3) * 2} == {AlgebraicNumber.sqrt(12)}
+    with pytest.raises(AttributeError):
+        AlgebraicNumber(1).numerator = 2
+
+
+def test_arithmetic():
+    root = AlgebraicNumber(1, 2) + AlgebraicNumber.sqrt(5) / 2
+    assert root + root.conjugate() == 1
+    assert root - root.conjugate() == AlgebraicNumber.sqrt(5)
+    assert 2 * root - 1 == AlgebraicNumber.sqrt(5)
+    assert 1 - root == root.conjugate()
+    with pytest.raises(ValueError):
+        AlgebraicNumber.sqrt(2) + AlgebraicNumber.sqrt(3)
+    with pytest.raises(ZeroDivisionError):
+        root / 0
+
+
+def test_numeric_conversion():
+    assert float(AlgebraicNumber(1, 2) + AlgebraicNumber.sqrt(2)) == pytest.approx(0.5 + 2**0.5)
+    assert complex(AlgebraicNumber(-1, 2) + AlgebraicNumber.sqrt(-3) / 2) == pytest.approx(complex(-0.5, 3**0.5 / 2))
+    with pytest.raises(TypeError):
+        float(AlgebraicNumber.sqrt(-2))
+
+
+@pytest.mark.parametrize(
+    "equation,expected",
+    [
+        ("x^2 - 2 = 0", "x = sqrt(2), x = -sqrt(2)"),
+        ("-x^2 + x + 1 = 0", "x = 1/2 - sqrt(5)/2, x = 1/2 + sqrt(5)/2"),
+        ("-x^2 - 1 = 0", "x = -I, x = I"),
+        ("x^2 + x + 1 = 0", "x = -1/2 + sqrt(3)*I/2, x = -1/2 - sqrt(3)*I/2"),
+        ("4x^2 + 4x + 1 = 0", "x = -1/2"),
+    ],
+)
+def test_exact_solutions_of_polynomials(equation, expected):
+    polynomial = PolynomialFactory(PolynomParser()).create(equation)
+    assert polynomial.get_solution_string() == expected
+    for exact, numeric in zip(polynomial.get_exact_solutions(), polynomial.get_solutions()):
+        assert complex(exact) == pytest.approx(complex(numeric))
+
+
+def test_quadratic_roots():
+    assert AlgebraicNumber.quadratic_roots(39, 81, 36) == (AlgebraicNumber(4, 3), AlgebraicNumber(5, 6))
+    x1, x2 = AlgebraicNumber.quadratic_roots(-1, -3, 2)
+    assert str(x1) == "-1/2 + sqrt(3)*I/2"
+    assert x2 == x1.conjugate()
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+from computor import arithmetic
+
+
+@pytest.mark.parametrize("bits", [8, 100])
+@pytest.mark.parametrize("lengths", [(0, 5), (1, 1), (7, 40), (33, 33), (100, 37), (130, 129)])
+def test_multiply_methods_agree(bits, lengths):
+    rng = random.Random(bits * 1000 + sum(lengths))
+    a = [rng.getrandbits(bits) - (1 << (bits - 1)) for _ in range(lengths[0])]
+    b = [rng.getrandbits(bits) - (1 << (bits - 1)) for _ in range(lengths[1])]
+    expected = arithmetic.multiply_schoolbook(a, b)
+    assert len(expected) == (len(a) + len(b) - 1 if a and b else 0)
+    assert arithmetic.multiply_karatsuba(a, b) == expected
+    assert arithmetic.multiply(a, b) == expected
+    if a and b and bits == 8:
+        assert arithmetic.multiply_numpy(a, b) == expected
+
+
+def test_multiply_numpy_refuses_overflow():
+    with pytest.raises(OverflowError):
+        arithmetic.multiply_numpy([2**40] * 4, [2**30] * 4)
+    assert not arithmetic.fits_int64([2**31] * 8, [2**31] * 8)
+    with pytest.raises(ValueError, match="Unknown multiplication method"):
+        arithmetic.multiply([1], [1], "fft")
+
+
+def test_sparse_mappings():
+    # (X^1000 + 1) * (X^1000 - 1) is multiplied term by term
+    assert arithmetic.multiply_mappings({1000: 1, 0: 1}, {1000: 1, 0: -1}) == {0: -1, 2000: 1}
+    assert arithmetic.multiply_mappings({0: 0, 2: 3}, {}) == {}
+    assert arithmetic.power_mapping({1: 1, 0: 1}, 4) == {0: 1, 1: 4, 2: 6, 3: 4, 4: 1}
+    assert arithmetic.power_mapping({5: 2}, 0) == {0: 1}
+    with pytest.raises(ValueError):
+        arithmetic.power_mapping({1: 1}, -1)
+
+
+@pytest.mark.parametrize(
+    "a,expected",
+    [
+        # (X - 1)^5
+        ([-1, 5, -10, 10, -5, 1], [([-1, 1], 5)]),
+        # (X^3 - 1)^2
+        ([1, 0, 0, -2, 0, 0, 1], [([-1, 0, 0, 1], 2)]),
+        # X^3 (X + 1), content 2 left out
+        ([0, 0, 0, 2, 2], [([1, 1], 1), ([0, 1], 3)]),
+        # (X - 1) (X - 2)^2 (X - 3)^3
+        (
+            arithmetic.multiply([-1, 1], arithmetic.multiply([4, -4, 1], [-27, 27, -9, 1])),
+            [([-1, 1], 1), ([-2, 1], 2), ([-3, 1], 3)],
+        ),
+        ([-6, 11, -6, 1], [([-6, 11, -6, 1], 1)]),
+        ([5], []),
+    ],
+)
+def test_square_free_factors(a, expected):
+    assert arithmetic.square_free_factors(a) == expected
+
+
+def test_square_free_modular_test_is_only_sufficient():
+    assert arithmetic.is_square_free_modular([-6, 11, -6, 1])
+    assert not arithmetic.is_square_free_modular([1, 2, 1])
+    # square-free, but a double root modulo 3
+    assert not arithmetic.is_square_free_modular([3, 0, 1], 3)
+    assert arithmetic.square_free_factors([3, 0, 1]) == [([3, 0, 1], 1)]
+    assert arithmetic.gcd([-1, 0, 1], [2, 2]) == [1, 1]
+    with pytest.raises(ValueError, match="not exact"):
+        arithmetic.divide_exact([1, 0, 1], [1, 1])
@@ -0,0 +1,137 @@
+import io
+import json
+import os
+
+from computor import stats
+from computor.batch import (
+    read_csv,
+    read_jsonl,
+    read_lines,
+    read_mapped_lines,
+    solve_file,
+    solve_solutions,
+    solve_stream,
+    split_valid,
+    write_csv,
+    write_jsonl,
+)
+
+
+def test_batch_lines_keep_order_and_line_numbers():
+    stream = io.StringIO("x = 2\n\n2x^2 - 8 = 0\n")
+    records = list(solve_stream(read_lines(stream)))
+    assert [record["line"] for record in records] == [1, 3]
+    assert records[0]["solutions"] == "x = 2"
+    assert records[1]["degree"] == 2
+    assert records[1]["discriminant"] == 64
+    assert records[1]["solutions"] == "x = 2, x = -2"
+
+
+def test_batch_error_is_reported_per_line():
+    stream = io.StringIO("X=abc\nX^1001=1\nx = 0\n")
+    records = list(solve_stream(read_lines(stream)))
+    assert "Invalid polynomial string" in records[0]["error"]
+    assert "not supported" in records[1]["error"]
+    assert records[2]["error"] is None
+    assert records[2]["solutions"] == "x = 0"
+
+
+def test_batch_unexpected_exception_is_reported_per_line():
+    # 10^400 does not fit a float
+    stream = io.StringIO(f"x = 1\n{10**400} * X^3 + X = 1\n{10**400} * X^5 + X = 1\nx = 2\n")
+    records = list(solve_stream(read_lines(stream)))
+    assert records[0]["solutions"] == "x = 1"
+    assert records[1]["error"].startswith("OverflowError")
+    assert records[2]["error"].startswith("OverflowError")
+    assert records[3]["solutions"] == "x = 2"
+
+
+def test_batch_csv_and_jsonl_input():
+    csv_stream = io.StringIO("ID,Equation\n1,x = 1\n2,1 = 1\n")
+    records = list(solve_stream(read_csv(csv_stream)))
+    assert [record["solutions"] for record in records] == ["x = 1", "Any X is solution"]
+    assert records[1]["solutions_count"] == "inf"
+
+    jsonl_stream = io.StringIO('{"equation": "x = 3"}\nnot json\n')
+    records = list(solve_stream(read_jsonl(jsonl_stream)))
+    assert records[0]["solutions"] == "x = 3"
+    assert records[1]["error"] is not None
+
+
+def test_batch_writers():
+    records = list(solve_stream(read_lines(io.StringIO("x = 1\nX=abc\n"))))
+    output = io.StringIO()
+    assert write_jsonl(records, output) == 2
+    lines = output.getvalue().splitlines()
+    assert json.loads(lines[0])["solutions"] == "x = 1"
+
+    output = io.StringIO()
+    assert write_csv(records, output) == 2
+    assert output.getvalue().splitlines()[0].startswith("line,equation,")
+
+
+def test_batch_mapped_file_matches_text_input(tmp_path):
+    content = "x = 2\n\n2x^2 - 8 = 0\r\nX² = 4\n0.5 * X = 1.25\nX=abc\nX = ²\n  x = 1"
+    path = tmp_path / "equations.txt"
+    path.write_bytes(content.encode())
+    records = list(solve_file(str(path)))
+    expected = list(solve_stream(read_lines(io.StringIO(content, newline=""))))
+    assert records == expected
+    assert [record["line"] for record in records] == [1, 3, 4, 5, 6, 7, 8]
+    assert records[2]["solutions"] == "x = 2, x = -2"
+
+    path.write_bytes(b"x = 1\n\xff = 1\n")
+    records = list(solve_file(str(path)))
+    assert records[0]["solutions"] == "x = 1"
+    assert records[1]["equation"] == "\ufffd = 1"
+    assert records[1]["error"] is not None
+
+    path.write_bytes(b"")
+    assert list(read_mapped_lines(str(path))) == []
+
+
+def test_batch_mapped_lines_read_pipes():
+    read_end, write_end = os.pipe()
+    with os.fdopen(write_end, "wb") as pipe:
+        pipe.write(b"x = 1\n\nX^2 = 4\n")
+    try:
+        assert list(read_mapped_lines(f"/dev/fd/{read_end}")) == [(1, b"x = 1\n"), (3, b"X^2 = 4\n")]
+    finally:
+        os.close(read_end)
+
+
+def test_batch_dedup_matches_plain_solving():
+    content = "2X^2 - 4 = 0\nX^2 = 2\n-X^2 + 2 = 0\n-0.5 * X^2 = -1\nX^2 + X + 1 = 0\n-3X^2 - 3X = 3\nx = 0\nX=abc\n"
+    expected = list(solve_stream(read_lines(io.StringIO(content))))
+    stats.reset()
+    stats.enable()
+    try:
+        records = list(solve_stream(read_lines(io.StringIO(content)), dedup_size=16))
+        counters = stats.snapshot().counters
+    finally:
+        stats.disable()
+    assert records == expected
+    # the roots of a quadratic keep their order when the sign of a is flipped
+    assert records[2]["solutions"] == "x = -sqrt(2), x = sqrt(2)"
+    assert counters["batch.canonical"] == 3
+    assert counters["batch.duplicates"] == 4
+    assert stats.dedup_ratio(stats.snapshot()) == 4 / 7
+    stats.reset()
+
+    solutions = list(solve_solutions(read_lines(io.StringIO(content)), dedup_size=16))
+    assert solutions[0].solved is solutions[1].solved is solutions[2].solved
+    assert [solution.roots for solution in solutions[4:6]] == [
+        (complex(-0.5, 3**0.5 / 2), complex(-0.5, -(3**0.5) / 2)),
+        (complex(-0.5, -(3**0.5) / 2), complex(-0.5, 3**0.5 / 2)),
+    ]
+
+
+def test_batch_split_valid():
+    equations = list(read_lines(io.StringIO("x = 2\nX = abc\n\n2x^2 - 8 = 0\nX ==1\n")))
+    valid, invalid = split_valid(equations)
+    assert valid == [equations[0], equations[2]]
+    assert [(line, result.code.name, result.position) for line, _, result in invalid] == [
+        (2, "INVALID_CHARACTERS", 4),
+        (5, "EQUAL_SIGN", 3),
+    ]
+    assert [record["solutions"] for record in solve_stream(valid)] == ["x = 2", "x = 2, x = -2"]
@@ -309,7 +309,7 @@ data_polynom_first_degree_positive_tuple = [
 
 data_polynom_first_degree_negative_tuple = [
     ("0 * X = 0", float("inf")),
-    ("0 * X = 1", 0),
+    ("0 * X = 1", -1),  # contradiction, the zero term is dropped
     ("2x = x + x", float("inf")),  # identity form
     ("x = x", float("inf")),  # identity
     ("x = x + 1", -1),  # contradiction
@@ -0,0 +1,90 @@
+import pytest
+
+from computor import parallel, stats
+from computor.batch import solve_stream
+from computor.parallel import _solve_chunk, _init_worker, solve_parallel, solve_threaded
+from computor.polynominal import PolynomialFactory, PolynomParser
+
+
+def numbered(equations):
+    return list(enumerate(equations, start=1))
+
+
+def test_parallel_matches_serial_order():
+    equations = numbered([f"{i} * X^2 - {i + 1} * X = 3" for i in range(1, 40)] + ["X=abc", "x = 0"])
+    expected = list(solve_stream(equations))
+    assert list(solve_parallel(equations, workers=2, chunk_size=7)) == expected
+    assert list(solve_parallel(equations, workers=2, chunk_size=7, dedup_size=8)) == expected
+
+
+def test_threaded_matches_serial_order():
+    equations = numbered([f"{i} * X^2 - {i + 1} * X = 3" for i in range(1, 40)] + ["X=abc", "x = 0"])
+    expected = list(solve_stream(equations))
+    assert list(solve_threaded(equations, workers=3, chunk_size=4)) == expected
+    assert list(solve_threaded(equations, workers=3, chunk_size=4, dedup_size=8)) == expected
+    factory = PolynomialFactory(PolynomParser(), cache_size=64)
+    records = list(solve_threaded(equations + equations, workers=3, chunk_size=4, factory=factory))
+    assert records == expected + expected
+    assert factory.cache_info().hits == len(equations) - 1
+
+
+def test_threaded_counts_every_record():
+    stats.reset()
+    stats.enable()
+    try:
+        list(solve_threaded(numbered(["x = 1", "X=abc"] * 200), workers=4, chunk_size=3))
+        snapshot = stats.snapshot()
+    finally:
+        stats.disable()
+        stats.reset()
+    assert snapshot.counters == {"batch.records": 400, "batch.errors": 200}
+    assert snapshot.stages["parser.parse"].calls == 200
+
+
+def test_parallel_errors_stay_in_their_record():
+    records = list(solve_parallel(numbered(["X=abc", "X^1001=1", "x = 1"]), workers=2, chunk_size=1))
+    assert "Invalid polynomial string" in records[0]["error"]
+    assert "not supported" in records[1]["error"]
+    assert records[2]["solutions"] == "x = 1"
+
+
+@pytest.fixture
+def worker_globals(monkeypatch):
+    """Restore the worker process globals _init_worker sets in the test process."""
+    for name in ("_factory", "_fields", "_canonical_cache"):
+        monkeypatch.setattr(parallel, name, getattr(parallel, name))
+
+
+def test_unexpected_exception_does_not_kill_the_chunk(worker_globals):
+    _init_worker(0, False)
+    # 10^400 does not fit a float, the numeric cubic solver overflows
+    records, _ = _solve_chunk(numbered([f"{10**400} * X^3 + X = 1", "x = 2"]))
+    assert records[0]["error"].startswith("OverflowError")
+    assert records[1]["solutions"] == "x = 2"
+
+
+def test_threaded_fields_do_not_depend_on_worker_globals(worker_globals):
+    # threads fill in their own fields, not the ones of the process workers
+    _init_worker(0, False, ("line",))
+    records = list(solve_threaded(numbered([f"{10**400} * X^3 + X = 1"]), workers=2))
+    assert records[0]["error"].startswith("OverflowError")
+
+
+def test_parallel_merges_worker_stats():
+    stats.reset()
+    stats.enable()
+    try:
+        list(solve_parallel(numbered(["x = 1", "x = 2", "X=abc"]), workers=2, chunk_size=2))
+        snapshot = stats.snapshot()
+    finally:
+        stats.disable()
+        stats.reset()
+    assert snapshot.counters == {"batch.records": 3, "batch.errors": 1}
+    assert snapshot.stages["parser.parse"].calls == 2
+
+
+def test_parallel_rejects_invalid_workers():
+    with pytest.raises(ValueError):
+        list(solve_parallel(numbered(["x = 1"]), workers=0))
+    with pytest.raises(ValueError):
+        list(solve_threaded(numbered(["x = 1"]), workers=0))
@@ -1,7 +1,20 @@
+import copy
+import math
+import pickle
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
-from computor.polynominal import PolynomialTerm, PolynomParser, Polynomial, PolynomialFactory
+from computor.batch import solve_record
+from computor.lexer import ErrorCode, PolynomialSyntaxError
+from computor.polynominal import (
+    PolynomialFirstDegree,
+    PolynomialSecondDegree,
+    PolynomialTerm,
+    PolynomParser,
+    Polynomial,
+    PolynomialFactory,
+)
 from test_data import (
     data_polynom_term_positive_tuple,
     data_polynom_parser_positive_string,
@@ -31,6 +44,26 @@ def test_polynomial_term_eq():
     assert term1 != term2
 
 
+def test_polynomial_term_interned():
+    assert PolynomialTerm(-3, 2) is PolynomialTerm(-3, 2)
+    assert PolynomialTerm(2, 1) * PolynomialTerm(3, 1) is PolynomialTerm(6, 2)
+    assert PolynomialTerm(11, 0) is not PolynomialTerm(11, 0)
+    assert PolynomialTerm(11, 0) == PolynomialTerm(11, 0)
+    assert hash(PolynomialTerm(11, 3)) == hash(PolynomialTerm(11, 3))
+    assert len({PolynomialTerm(1, 0), PolynomialTerm(1, 0), PolynomialTerm(1, 1)}) == 2
+    assert PolynomialTerm(1, 0) != (1, 0)
+
+
+def test_polynomial_term_is_immutable():
+    term = PolynomialTerm(1, 2)
+    with pytest.raises(AttributeError):
+        term.coefficient = 5
+    with pytest.raises(AttributeError):
+        term.extra = 1
+    assert PolynomialTerm(1, 2).coefficient == 1
+    assert not hasattr(term, "__dict__")
+
+
 def test_polynomial_term_repr():
     term = PolynomialTerm(1, 2)
     assert repr(term) == "PolynomialTerm(1, 2)"
@@ -179,3 +212,343 @@ def test_polynomial_0_degree():
     assert polynominal.degree == 0, "Wrong degree"
     assert polynominal.solutions_count == -1, "Wrong solutions count"
     assert "The sides of equation are not equal. Cannot solve." == polynominal.get_solution_string(), "Wrong solutions"
+
+
+@pytest.mark.parametrize(
+    "polynom_str,position",
+    [
+        ("X = abc", 4),
+        ("  X^2 + X^^2 = 0", 9),
+        ("X = 1*2", 5),
+        ("2X3X=0", 2),
+        ("X^2 + 1", 7),
+    ],
+)
+def test_polynomial_parser_error_position(polynom_str, position):
+    with pytest.raises(PolynomialSyntaxError) as e:
+        PolynomParser.parse(polynom_str)
+    assert e.value.position == position
+    assert f"at position {position}" in str(e.value)
+
+
+@pytest.mark.parametrize("polynom_data", data_polynom_parser_negative_string)
+def test_polynomial_parser_try_parse_negative(polynom_data):
+    polynom_str = polynom_data["input"]
+    result = PolynomParser.try_parse(polynom_str)
+    assert not result.ok
+    assert result.terms is None
+    if isinstance(polynom_str, str):
+        with pytest.raises(PolynomialSyntaxError) as e:
+            PolynomParser.parse(polynom_str)
+        assert result.position == e.value.position
+        assert PolynomParser.validate(polynom_str) == result
+
+
+@pytest.mark.parametrize(
+    "polynom_str,code,position",
+    [
+        ("X = abc", ErrorCode.INVALID_CHARACTERS, 4),
+        ("X = 1 = 2", ErrorCode.EQUAL_SIGN, 6),
+        ("X + 1", ErrorCode.EQUAL_SIGN, 5),
+        ("  X^2 + X^^2 = 0", ErrorCode.POWER_NOTATION, 9),
+        ("= X", ErrorCode.EMPTY_SIDE, 0),
+        ("X +- 1 = 0", ErrorCode.OPERATOR_SEQUENCE, 2),
+        ("X = 1*2", ErrorCode.INVALID_TERM, 5),
+        ("X² = 1 = 2", ErrorCode.EQUAL_SIGN, 7),
+        (b"X =\t1 = 2", ErrorCode.EQUAL_SIGN, 6),
+        ("X² = ".encode() + b"\xff", ErrorCode.INVALID_ENCODING, 6),
+        (None, ErrorCode.NOT_A_STRING, 0),
+    ],
+)
+def test_polynomial_parser_validate(polynom_str, code, position):
+    assert PolynomParser.validate(polynom_str) == (code, position, None, 0)
+
+
+def test_polynomial_parser_try_parse_positive():
+    result = PolynomParser.try_parse("2x^2 + 0.5 = x")
+    assert result.ok and result.code is ErrorCode.OK and result.position == -1
+    assert (result.terms, result.scale) == PolynomParser.parse_scaled("2x^2 + 0.5 = x")
+    assert PolynomParser.try_parse(b"X^2 = 4").terms == PolynomParser.parse("X^2 = 4")
+    assert PolynomParser.validate("x = 1").ok
+
+
+def test_polynomial_factory_cache():
+    factory = PolynomialFactory(PolynomParser(), cache_size=2)
+    first = factory.create("x^2 - 4 = 0")
+    assert factory.create("X^2-4=0") is first
+    assert factory.cache_info() == (1, 1, 0, 2, 1)
+
+    factory.create("x = 1")
+    factory.create("x = 2")  # evicts "x^2 - 4 = 0"
+    assert factory.create("X^2 - 4 = 0") is not first
+    info = factory.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+
+    with pytest.raises(PolynomialSyntaxError) as e:
+        factory.create("X = 1*2")
+    assert e.value.position == 5
+    assert PolynomialFactory(PolynomParser()).cache_info() is None
+
+
+def test_polynomial_factory_cache_bytes():
+    factory = PolynomialFactory(PolynomParser(), cache_size=4)
+    first = factory.create(b"x^2 = 2\n")
+    assert factory.create(b"X^2=2") is first
+    assert factory.create(b"  X ^2 = 2") is first
+    assert factory.cache_info()[:2] == (2, 1)
+
+
+def test_polynomial_sparse_coefficients(monkeypatch):
+    terms = [PolynomialTerm(3, 10**9), PolynomialTerm(1, 0), PolynomialTerm(-3, 10**9), PolynomialTerm(2, 7)]
+    assert Polynomial.reduce_coefficients(terms) == {0: 1, 7: 2}
+
+    monkeypatch.setattr(Polynomial, "__abstractmethods__", set())
+    polynom = Polynomial({0: 1, 2: 5})  # noqa
+    assert polynom.degree == 2
+    assert polynom.coefficient(1) == 0
+    assert polynom.terms == [PolynomialTerm(1, 0), PolynomialTerm(0, 1), PolynomialTerm(5, 2)]
+
+    with pytest.raises(ValueError, match="degree 5000000 is not supported"):
+        PolynomialFactory(PolynomParser()).create("X^5000000 = 1")
+
+
+@pytest.mark.parametrize("polynom_str", ["0X^5000000 + X = 1", "0*X^2 + X - 1 = 0", "X + 0 * X^3 = 1"])
+def test_polynomial_zero_terms_do_not_count_for_the_degree(polynom_str):
+    factory = PolynomialFactory(PolynomParser())
+    for polynomial in (factory.create(polynom_str), factory.create_from_chunks([polynom_str])):
+        assert isinstance(polynomial, PolynomialFirstDegree)
+        assert polynomial.coefficients == {0: -1, 1: 1}
+        assert polynomial.get_solution_string() == "x = 1"
+    assert Polynomial.from_coefficients({0: -1, 1: 1, 2: 0}).degree == 1
+    assert factory.create("0 * X = 0").solutions_count == float("inf")
+
+
+@pytest.mark.parametrize(
+    "polynom_str,terms,scale",
+    [
+        ("0.5X^2 + 1.25 = 0", [(50, 2), (125, 0), (0, 0)], 2),
+        ("1.50 * X = 3", [(15, 1), (-30, 0)], 1),
+        ("2.0 = X", [(2, 0), (-1, 1)], 0),
+    ],
+)
+def test_polynomial_parser_decimal_coefficients(polynom_str, terms, scale):
+    parsed, parsed_scale = PolynomParser.parse_scaled(polynom_str)
+    assert [(term.coefficient, term.degree) for term in parsed] == terms
+    assert parsed_scale == scale
+
+
+@pytest.mark.parametrize("polynom_str", ["X^2.5 = 0", "2. = X", ".5 = X", "1.5^2 = 0", "1..5 = X"])
+def test_polynomial_parser_rejects_decimal_degrees(polynom_str):
+    with pytest.raises(PolynomialSyntaxError):
+        PolynomParser.parse(polynom_str)
+
+
+def test_polynomial_decimal_coefficients():
+    polynomial = PolynomialFactory(PolynomParser()).create("0.5 * X^2 - 0.25 * X = 3.75")
+    assert polynomial.get_reduced_form() == "0.5 * X^2 - 0.25 * X^1 - 3.75 * X^0 = 0"
+    assert str(polynomial.discriminant) == "7.5625"
+    assert polynomial.integer_discriminant == 75625
+    assert polynomial.get_solution_string() == "x = 3, x = -5/2"
+    assert PolynomialFactory(PolynomParser()).create("1.5x = 0.3").get_solution_string() == "x = 1/5"
+
+
+@pytest.mark.parametrize(
+    "polynom_str",
+    ["5 * X^0 + 4 * X^1 - 9.3 * X^2 = 1 * X^0", "x² - 2.25 = 0", " 0.5X + X - 1.50 = 2x ", "X^7 + 3 = X^7 - 0.125"],
+)
+def test_polynomial_factory_create_from_chunks(polynom_str):
+    factory = PolynomialFactory(PolynomParser())
+    expected = factory.create(polynom_str)
+    for size in range(1, len(polynom_str) + 1):
+        chunks = [polynom_str[index : index + size] for index in range(0, len(polynom_str), size)]
+        polynomial = factory.create_from_chunks(iter(chunks))
+        assert (polynomial.coefficients, polynomial.scale) == (expected.coefficients, expected.scale)
+        assert polynomial.get_solution_string() == expected.get_solution_string()
+    assert factory.create_from_chunks(["", "X", "", "=", "1", ""]).get_solution_string() == "x = 1"
+
+
+@pytest.mark.parametrize(
+    "chunks,position",
+    [
+        (["X = ", "abc"], 4),
+        (["  X^2 + X", "^^2 = 0"], 9),
+        (["X = 1", "*2"], 5),
+        (["X^2 +", " 1"], 7),
+        (["X = 1 ", "= 2"], 6),
+        (["= X"], 0),
+        ([], 0),
+    ],
+)
+def test_polynomial_factory_create_from_chunks_errors(chunks, position):
+    with pytest.raises(PolynomialSyntaxError) as e:
+        PolynomialFactory(PolynomParser()).create_from_chunks(chunks)
+    assert e.value.position == position
+    assert f"at position {position}" in str(e.value)
+
+
+def test_polynomial_reduce_stream():
+    terms = [(3, 9, 0), (1, 0, 0), (-30, 9, 1), (25, 7, 2), (5, 0, 1)]
+    assert Polynomial.reduce_stream(iter(terms)) == ({0: 150, 7: 25}, 2)
+
+
+@pytest.mark.parametrize(
+    "polynom_str",
+    ["5 * X^0 + 4 * X^1 - 9.3 * X^2 = 1 * X^0", "x² - 2.25 = 0", "\tx = 1\r\n", "X^2 + 1", "X = 1*2", "1 = 1"],
+)
+def test_polynomial_parser_bytes(polynom_str):
+    try:
+        expected = PolynomParser.parse_scaled(polynom_str)
+    except PolynomialSyntaxError as e:
+        with pytest.raises(PolynomialSyntaxError) as error:
+            PolynomParser.parse_scaled(polynom_str.encode())
+        assert (str(error.value), error.value.position) == (str(e), e.position)
+    else:
+        assert PolynomParser.parse_scaled(polynom_str.encode()) == expected
+
+
+def test_polynomial_arithmetic():
+    factory = PolynomialFactory(PolynomParser())
+    x = factory.create("X = 0")
+
+    product = (x - 1) * (x - 2) * (x + 3)
+    assert type(product).__name__ == "PolynomialHigherDegree"
+    assert product.coefficients == {0: 6, 1: -7, 3: 1}
+    assert product.get_solution_string() == "x = -3, x = 1, x = 2"
+
+    square = (x - 1) ** 2
+    assert isinstance(square, Polynomial) and square.degree == 2
+    assert square.get_solution_string() == "x = 1"
+    assert (2 - x).coefficients == {0: 2, 1: -1}
+    assert (x * 0).coefficients == {} and (x - x).get_solution_string() == "Any X is solution"
+    assert (x**0).coefficients == {0: 1}
+
+    half = factory.create("0.5x = 1.5")
+    assert ((half * half).coefficients, (half * half).scale) == ({0: 225, 1: -150, 2: 25}, 2)
+    # the scale is reduced like the parser does
+    assert ((half * 2).coefficients, (half * 2).scale) == ({0: -3, 1: 1}, 0)
+    assert (half + x).get_reduced_form() == "1.5 * X^1 - 1.5 * X^0 = 0"
+
+    with pytest.raises(TypeError):
+        x + 0.5
+    with pytest.raises(ValueError):
+        x**-1
+
+
+def test_polynomial_evaluate():
+    import numpy as np
+
+    factory = PolynomialFactory(PolynomParser())
+    polynomial = factory.create("0.5 * X^3 - 2 * X + 1.25 = 0")
+    xs = np.linspace(-3, 3, 13)
+    expected = [sum(term.coefficient / 100 * x**term.degree for term in polynomial.terms) for x in xs]
+    assert np.allclose(polynomial.evaluate(xs), expected)
+    assert polynomial.evaluate(2) == 1.25 and np.ndim(polynomial.evaluate(2)) == 0
+    assert polynomial.evaluate([[0, 1], [2, 3]]).shape == (2, 2)
+    assert polynomial.evaluate(1j) == 1.25 - 2.5j
+
+    sparse = factory.create("X^1000 + 1 = 0")
+    assert sparse.evaluate([1, -1, 0]).tolist() == [2, 2, 1]
+    assert factory.create("1 = 1").evaluate([1.5, 2]).tolist() == [0, 0]
+
+
+@pytest.mark.parametrize("polynom_str", ["x^2 + 1 = 0", "2x^2 - 3x = 5", "0.5x = 3", "x^5 - x + 1 = 0", "1 = 1"])
+def test_polynomial_residuals(polynom_str):
+    import numpy as np
+
+    polynomial = PolynomialFactory(PolynomParser()).create(polynom_str)
+    residuals = polynomial.residuals()
+    assert residuals.shape == (len(polynomial.get_solutions()),)
+    assert np.all(residuals < 1e-9)
+
+
+@pytest.mark.parametrize(
+    "polynom_str,expected",
+    [
+        ("x^2 - 3x + 2 = 0", (2.0, 1.0, 0.0, 2)),
+        ("-x^2 - 3x - 2 = 0", (-2.0, -1.0, 0.0, 2)),
+        ("x^2 - 4x + 4 = 0", (2.0, 2.0, 0.0, 1)),
+        ("6x^2 + 6x + 3 = 0", (-0.5, -0.5, 0.5, 2)),
+        ("-x^2 - 4 = 0", (0.0, 0.0, -2.0, 2)),
+        ("x^2 + x = 0", (0.0, -1.0, 0.0, 2)),
+        ("-x^2 + x = 0", (0.0, 1.0, 0.0, 2)),
+        ("-x^2 - x = 0", (-1.0, 0.0, 0.0, 2)),
+        ("-x^2 = 0", (0.0, 0.0, 0.0, 1)),
+    ],
+)
+def test_polynomial_2nd_solve_float(polynom_str, expected):
+    polynomial = PolynomialFactory(PolynomParser()).create(polynom_str)
+    roots = polynomial.solve_float()
+    assert roots == expected
+    # no -0.0 roots
+    assert [math.copysign(1, value) for value in roots[:3]] == [math.copysign(1, value) for value in expected[:3]]
+    assert polynomial.get_solutions() == roots.roots
+    assert isinstance(roots.x1, float) and isinstance(roots.imag, float)
+
+
+def test_polynomial_2nd_float_roots_are_accurate():
+    # the textbook formula returns 0 for the small root of x^2 + 10^9 x + 1
+    polynomial = PolynomialFactory(PolynomParser()).create("x^2 + 1000000000 * x + 1 = 0")
+    small, large = polynomial.get_solutions()
+    assert small == pytest.approx(-1e-9, rel=1e-15)
+    assert large == pytest.approx(-1e9, rel=1e-15)
+
+
+def test_polynomial_2nd_zero_leading_coefficient():
+    polynomial = PolynomialSecondDegree({0: -5, 1: 1})
+    with pytest.raises(ValueError, match="Division by zero"):
+        polynomial.get_exact_solutions()
+    with pytest.raises(ValueError, match="Division by zero"):
+        polynomial.solve_float()
+    record = solve_record(PolynomialFactory(PolynomParser()), 1, "0*X^2 + X - 5 = 0")
+    assert (record["degree"], record["solutions_count"], record["solutions"], record["error"]) == (1, 1, "x = 5", None)
+
+
+def test_polynomial_canonical_key():
+    factory = PolynomialFactory(PolynomParser())
+    keys = {
+        factory.create(equation).canonical_key()
+        for equation in ("2X^2 - 4 = 0", "X^2 = 2", "-X^2 + 2 = 0", "-0.5 * X^2 + 1 = 0", "6 = 3X^2")
+    }
+    assert keys == {((0, -2), (2, 1))}
+    assert factory.create("X^2 = -2").canonical_key() == ((0, 2), (2, 1))
+    assert factory.create("0 = 0").canonical_key() == ()
+    assert factory.create("4 = 0").canonical_key() == ((0, 1),)
+
+    polynomial = factory.create("-6 * X^2 - 6 * X + 12 = 0")
+    canonical = polynomial.canonical()
+    assert type(canonical) is type(polynomial)
+    assert canonical.coefficients == {0: -2, 1: 1, 2: 1}
+    assert sorted(canonical.get_solutions()) == sorted(polynomial.get_solutions())
+
+
+def test_polynomial_is_immutable():
+    factory = PolynomialFactory(PolynomParser())
+    polynomial = factory.create("2 * X^2 - 4 = 0")
+    with pytest.raises(AttributeError):
+        polynomial.scale = 1
+    with pytest.raises(TypeError):
+        polynomial.coefficients[1] = 3
+    with pytest.raises(TypeError):
+        factory.polynomials[3] = Polynomial
+    polynomial.terms.clear()
+    assert polynomial.coefficients == {0: -4, 2: 2}
+    assert [term.coefficient for term in polynomial.terms] == [-4, 0, 2]
+
+
+@pytest.mark.parametrize("polynom_str", ["1 = 1", "2 * X = 1", "X^2 - 2 = 0", "0.5 * X^3 = 4"])
+def test_polynomial_pickle_round_trip(polynom_str):
+    polynomial = PolynomialFactory(PolynomParser()).create(polynom_str)
+    expected = polynomial.get_solution_string()
+    for copied in (pickle.loads(pickle.dumps(polynomial)), copy.deepcopy(polynomial)):
+        assert type(copied) is type(polynomial)
+        assert copied.coefficients == polynomial.coefficients and copied.scale == polynomial.scale
+        assert copied.get_solution_string() == expected
+        with pytest.raises(TypeError):
+            copied.coefficients[0] = 1
+
+
+def test_polynomial_memoized_across_threads():
+    polynomial = PolynomialFactory(PolynomParser()).create("X^2 - 3 * X + 1 = 0")
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: polynomial.get_exact_solutions(), range(64)))
+    assert all(result is results[0] for result in results)
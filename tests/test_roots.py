@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from computor.polynominal import Polynomial, PolynomialFactory, PolynomialHigherDegree, PolynomParser
+from computor import roots
+from computor.roots import find_roots
+
+
+@pytest.mark.parametrize(
+    "coefficients,expected",
+    [
+        ([1, -6, 11, -6], [1, 2, 3]),
+        ([1, -3, 3, -1], [1, 1, 1]),
+        ([1, 0, 0, 0], [0, 0, 0]),
+        ([2, 0, 0, -16], [2, -1 + 3**0.5 * 1j, -1 - 3**0.5 * 1j]),
+        ([1, -10, 35, -50, 24], [1, 2, 3, 4]),
+        ([1, 0, -5, 0, 4], [-2, -1, 1, 2]),
+        ([1, 0, 0, 0, 1], [(1 + 1j) / 2**0.5, (1 - 1j) / 2**0.5, (-1 + 1j) / 2**0.5, (-1 - 1j) / 2**0.5]),
+        ([0, 1, -1], [1]),
+    ],
+)
+def test_find_roots_closed_forms(coefficients, expected):
+    roots = find_roots(coefficients)
+    key = lambda root: (round(root.real, 6), round(root.imag, 6))  # noqa: E731
+    assert np.allclose(sorted(roots, key=key), sorted(map(complex, expected), key=key))
+
+
+@pytest.mark.parametrize("degree", [5, 10, 50, 150])
+def test_find_roots_aberth(degree):
+    rng = np.random.default_rng(degree)
+    coefficients = rng.integers(-20, 21, degree + 1)
+    coefficients[0] = 7
+    roots = np.array(find_roots(coefficients))
+    assert len(roots) == degree
+    scale = np.polyval(np.abs(coefficients), np.maximum(np.abs(roots), 1))
+    assert np.all(np.abs(np.polyval(coefficients, roots)) <= 1e-12 * scale)
+    expected = np.roots(coefficients)
+    # every root matches one of numpy's, in both directions
+    distances = np.abs(roots[:, None] - expected[None, :])
+    assert distances.min(axis=0).max() < 1e-6
+    assert distances.min(axis=1).max() < 1e-6
+
+
+@pytest.mark.parametrize("degree,constant", [(3, 10**160), (4, 10**300)])
+def test_find_roots_closed_forms_do_not_overflow(degree, constant):
+    roots = np.array(find_roots([1] + [0] * (degree - 1) + [-constant]))
+    assert np.all(np.isfinite(roots))
+    assert np.allclose(roots**degree / constant, 1)
+
+
+@pytest.mark.parametrize("degree", [7, 10, 15, 20])
+def test_find_roots_products_of_linear_factors(degree):
+    # (X - 1)(X - 2)...(X - degree), Wilkinson's polynomial for 20
+    coefficients = [1]
+    for root in range(1, degree + 1):
+        coefficients = [a - root * b for a, b in zip(coefficients + [0], [0] + coefficients)]
+    roots = sorted(find_roots(coefficients), key=lambda root: root.real)
+    # exact refinement of the integer coefficients, floats alone are off by up to 1 at degree 20
+    assert roots == [complex(root) for root in range(1, degree + 1)]
+
+
+@pytest.mark.parametrize(
+    "coefficients,expected",
+    [
+        ([1, -5, 10, -10, 5, -1], [1] * 5),
+        ([1, 0, 0, -2, 0, 0, 1], [1, complex(-0.5, 3**0.5 / 2), complex(-0.5, -(3**0.5) / 2)] * 2),
+    ],
+)
+def test_find_roots_repeated_roots_converge(coefficients, expected):
+    roots = np.array(find_roots(coefficients))
+    # a root of multiplicity m is only determined to about eps ** (1 / m)
+    distances = np.abs(roots[:, None] - np.array(expected)[None, :])
+    assert distances.min(axis=1).max() < 1e-2
+
+
+def test_find_roots_aberth_reports_unconverged_roots(monkeypatch):
+    monkeypatch.setattr(roots, "ABERTH_MAX_ITERATIONS", 1)
+    with pytest.raises(ValueError, match="did not converge in 1 iterations"):
+        find_roots(np.random.default_rng(0).integers(-20, 21, 11))
+
+
+def test_polynomial_higher_degree():
+    factory = PolynomialFactory(PolynomParser())
+    polynomial = factory.create("x^3 - 6x^2 + 11x = 6")
+    assert isinstance(polynomial, PolynomialHigherDegree)
+    assert polynomial.degree == 3
+    assert polynomial.solutions_count == 3
+    assert polynomial.get_solutions() == pytest.approx((1, 2, 3))
+    assert polynomial.get_solution_string() == "x = 1, x = 2, x = 3"
+    assert factory.create("X^4 + 4 = 0").get_solution_string() == (
+        "x = -1 - 1*I, x = -1 + 1*I, x = 1 - 1*I, x = 1 + 1*I"
+    )
+    assert [multiplicity for _, multiplicity in polynomial.get_roots_with_multiplicity()] == [1, 1, 1]
+    with pytest.raises(ValueError, match="degree 1001 is not supported"):
+        factory.create("X^1001 = 1")
+
+
+@pytest.mark.parametrize(
+    "polynom_str,solutions,multiplicities",
+    [
+        ("X^3 - 3X^2 + 3X - 1 = 0", "x = 1", (3,)),
+        ("X^6 - 2X^3 + 1 = 0", "x = -0.5 - 0.866025*I, x = -0.5 + 0.866025*I, x = 1", (2, 2, 2)),
+        ("X^4 + X^3 = 0", "x = -1, x = 0", (1, 3)),
+        ("X^5 - X^4 - X + 1 = 0", "x = -1, x = -1*I, x = 1*I, x = 1", (1, 1, 1, 2)),
+    ],
+)
+def test_polynomial_higher_degree_counts_distinct_roots(polynom_str, solutions, multiplicities):
+    polynomial = PolynomialFactory(PolynomParser()).create(polynom_str)
+    assert polynomial.solutions_count == len(multiplicities)
+    assert polynomial.get_solution_string() == solutions
+    assert tuple(multiplicity for _, multiplicity in polynomial.get_roots_with_multiplicity()) == multiplicities
+    assert len(polynomial.get_solutions()) == polynomial.solutions_count
+
+
+def test_polynomial_higher_degree_repeated_linear_factors():
+    # (X - 1)^2 (X - 2)^2 ... (X - 8)^2, degree 16
+    factor = Polynomial.from_coefficients({1: 1})
+    polynomial = Polynomial.from_coefficients({0: 1})
+    for root in range(1, 9):
+        polynomial = polynomial * (factor - root) ** 2
+    assert polynomial.degree == 16
+    assert polynomial.solutions_count == 8
+    assert polynomial.get_roots_with_multiplicity() == tuple((float(root), 2) for root in range(1, 9))
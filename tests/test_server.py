@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+from computor.server import SolverServer
+
+
+async def exchange(server, lines):
+    host, port = server.address[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write("".join(line + "\n" for line in lines).encode())
+    await writer.drain()
+    writer.write_eof()
+    responses = [json.loads(line) for line in (await reader.read()).splitlines()]
+    writer.close()
+    return responses
+
+
+def run_with_server(scenario, **options):
+    async def main():
+        server = SolverServer(**options)
+        await server.start_tcp()
+        try:
+            return await scenario(server)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_server_answers_in_request_order():
+    requests = [json.dumps({"id": i, "equation": f"x = {i}"}) for i in range(50)]
+    responses = run_with_server(lambda server: exchange(server, requests), batch_size=8)
+    assert [response["id"] for response in responses] == list(range(50))
+    assert responses[7]["solutions"] == "x = 7"
+    assert "line" not in responses[7]
+
+
+def test_server_reports_errors_per_request():
+    lines = [
+        "not json",
+        json.dumps({"id": "a", "equation": "X=abc"}),
+        json.dumps({"id": "b", "equation": "x^2 = 4"}),
+    ]
+    responses = run_with_server(lambda server: exchange(server, lines))
+    assert responses[0]["error"].startswith("Invalid request")
+    assert "Invalid polynomial string" in responses[1]["error"]
+    assert responses[2]["solutions"] == "x = 2, x = -2"
+
+
+def test_server_skips_lines_over_the_limit():
+    lines = [
+        json.dumps({"id": 1, "equation": "x = 1" + " " * 120000}),
+        json.dumps({"id": 2, "equation": "x = 2"}),
+        json.dumps({"id": 3, "equation": "x = 3" + " " * 300}),
+        json.dumps({"id": 4, "equation": "x = 4"}),
+    ]
+    responses = run_with_server(lambda server: exchange(server, lines))
+    assert len(responses) == 4
+    assert responses[0] == {"id": None, "error": "Invalid request: longer than 65536 bytes."}
+    assert responses[1]["id"] == 2 and responses[1]["solutions"] == "x = 2"
+    responses = run_with_server(lambda server: exchange(server, lines), line_limit=256)
+    assert [response["id"] for response in responses] == [None, 2, None, 4]
+
+
+def test_server_batches_concurrent_clients_and_counts():
+    async def scenario(server):
+        clients = [
+            exchange(server, [json.dumps({"id": i, "equation": f"{client} * x = {i}"}) for i in range(20)])
+            for client in range(1, 6)
+        ]
+        results = await asyncio.gather(*clients)
+        stats = await exchange(server, [json.dumps({"id": 0, "command": "stats"})])
+        return results, stats[0]["stats"]
+
+    results, counters = run_with_server(scenario, batch_size=16, queue_size=4)
+    for client, responses in enumerate(results, start=1):
+        assert [response["id"] for response in responses] == list(range(20))
+        assert responses[client * 2]["solutions"] == "x = 2"
+    assert counters["requests"] == 100
+    assert counters["errors"] == 0
+    # concurrent requests share batches
+    assert counters["batches"] < 100
+    assert counters["mean_batch_size"] > 1
+    assert counters["latency_p50_ms"] is not None
+
+
+def test_server_over_unix_socket(tmp_path):
+    path = str(tmp_path / "computor.sock")
+
+    async def main():
+        server = SolverServer()
+        await server.start_unix(path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(b'{"id": 1, "equation": "2 * x = 1"}\n')
+            response = json.loads(await reader.readline())
+            writer.close()
+            return response
+        finally:
+            await server.close()
+
+    assert asyncio.run(main())["solutions"] == "x = 1/2"
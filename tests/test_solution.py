@@ -0,0 +1,99 @@
+import io
+import json
+import math
+
+import numpy as np
+import pytest
+from computor.algebraic import AlgebraicNumber
+from computor.batch import solve_solutions, write_csv, write_jsonl, write_npy
+from computor.polynominal import PolynomialFactory, PolynomParser
+from computor.solution import RECORD_FIELDS, Solution, array_dtype, solve, to_array
+
+
+def test_solution_fields():
+    factory = PolynomialFactory(PolynomParser())
+    solution = solve(factory, "x^2 + 1 = 0", 3)
+    assert solution.ok and solution.error is None
+    assert (solution.line, solution.degree, solution.discriminant, solution.solutions_count) == (3, 2, -4, 2)
+    assert solution.exact_roots == (AlgebraicNumber(0, 1, 1, 1, -1), AlgebraicNumber(0, 1, -1, 1, -1))
+    assert np.allclose(solution.roots, [1j, -1j])
+    assert solution.solution_string == "x = I, x = -I"
+
+    assert solve(factory, "1 = 1").exact_roots == ()
+    assert solve(factory, "x^3 = 8").exact_roots is None
+
+    error = solve(factory, "X = abc", 4)
+    assert not error.ok
+    assert error.degree is None and error.roots == () and error.reduced_form is None
+    assert "invalid characters" in error.error
+
+
+def test_solution_record_is_rendered_on_demand(monkeypatch):
+    solution = solve(PolynomialFactory(PolynomParser()), " 0.5x = 1 ", 1)
+
+    def fail(self):
+        raise AssertionError("rendered")
+
+    monkeypatch.setattr(type(solution.polynomial), "get_reduced_form", fail)
+    monkeypatch.setattr(type(solution.polynomial), "get_solution_string", fail)
+    record = solution.to_record(("line", "equation", "degree", "solutions_count", "roots", "error"))
+    assert record == {
+        "line": 1,
+        "equation": "0.5x = 1",
+        "degree": 1,
+        "solutions_count": 1,
+        "roots": [[2.0, 0.0]],
+        "error": None,
+    }
+    with pytest.raises(KeyError):
+        solution.to_record(("degree", "bogus"))
+
+
+def test_solution_lazy_field_errors_are_kept():
+    # the exact roots of the full record fit, their float values do not
+    solution = solve(PolynomialFactory(PolynomParser()), f"X^2 = {10**400}", 1)
+    assert solution.to_record()["error"] is None
+    record = solution.to_record(("line", "roots", "error"))
+    assert record["line"] == 1 and record["roots"] is None
+    assert record["error"].startswith("OverflowError")
+    assert solution.to_record(("line", "roots")) == {"line": 1, "roots": None}
+    row = to_array([solution])[0]
+    assert row["error"] and row["degree"] == -1
+
+
+def test_solution_record_matches_batch_record():
+    factory = PolynomialFactory(PolynomParser())
+    record = solve(factory, "0.5 * X^2 = 1.25", 2).to_record()
+    assert tuple(record) == RECORD_FIELDS
+    assert record["discriminant"] == 2.5
+    assert solve(factory, "1 = 1").to_record()["solutions_count"] == "inf"
+    assert Solution(5, b"X = \xff", error="bad").to_record()["equation"] == "X = �"
+
+
+def test_solution_writers():
+    equations = [(1, "x = 2"), (2, "X = abc"), (3, "x^2 + 1 = 0"), (4, "x^3 - 6x^2 + 11x = 6")]
+    output = io.StringIO()
+    assert write_jsonl(solve_solutions(equations), output, ("line", "degree", "error")) == 4
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records[0] == {"line": 1, "degree": 1, "error": None}
+    assert records[1]["degree"] is None and records[1]["error"] is not None
+
+    output = io.StringIO()
+    assert write_csv(solve_solutions(equations), output, ("line", "solutions")) == 4
+    assert output.getvalue().splitlines()[:2] == ["line,solutions", "1,x = 2"]
+
+    output = io.BytesIO()
+    assert write_npy(solve_solutions(equations), output, max_roots=3) == 4
+    array = np.load(io.BytesIO(output.getvalue()))
+    assert array.dtype == array_dtype(3)
+    assert array["line"].tolist() == [1, 2, 3, 4]
+    assert array["degree"].tolist() == [1, -1, 2, 3]
+    assert array["error"].tolist() == [False, True, False, False]
+    assert math.isnan(array["discriminant"][0]) and array["discriminant"][2] == -4
+    assert np.allclose(array["roots"][2, :2], [1j, -1j]) and np.isnan(array["roots"][2, 2])
+    assert np.allclose(array["roots"][3], [1, 2, 3])
+
+    empty = io.BytesIO()
+    assert write_npy([], empty) == 0
+    assert np.load(io.BytesIO(empty.getvalue())).shape == (0,)
+    assert to_array([]).dtype == array_dtype()
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+# Runs the console script entry point in a fresh interpreter and lists the
+# modules it had to import on top of the bare interpreter.
+SCRIPT = """
+import sys
+before = set(sys.modules)
+sys.argv = ["computor"] + sys.argv[1:]
+import computor
+computor.main()
+print(" ".join(sorted(set(sys.modules) - before)))
+"""
+
+
+def run_entry_point(*arguments):
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, *arguments], capture_output=True, text=True, check=True
+    )
+    *output, modules = result.stdout.splitlines()
+    return output, set(modules.split())
+
+
+def test_single_equation_fast_path_imports():
+    output, modules = run_entry_point("x^2 - 4 = 0")
+    assert output == ["Solutions:  x = 2, x = -2"]
+    for heavy in ("argparse", "asyncio", "csv", "json", "multiprocessing", "numpy", "random"):
+        assert heavy not in modules
+
+
+def test_options_still_go_through_argparse():
+    output, modules = run_entry_point("-v", "2 * x = 1")
+    assert output[-1] == "Solutions:  x = 1/2"
+    assert "Polynomial degree:  1" in output
+    assert "argparse" in modules
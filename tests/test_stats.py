@@ -0,0 +1,54 @@
+import pytest
+
+from computor import stats
+from computor.polynominal import PolynomParser, PolynomialFactory
+
+
+@pytest.fixture
+def collecting():
+    stats.reset()
+    stats.enable()
+    yield
+    stats.disable()
+    stats.reset()
+
+
+def test_disabled_stages_record_nothing():
+    stats.reset()
+    PolynomialFactory(PolynomParser()).create("X^2 - 1 = 0").get_solution_string()
+    assert stats.snapshot().stages == {}
+
+
+def test_stages_and_sizes(collecting):
+    polynomial = PolynomialFactory(PolynomParser()).create("4 * X^2 + 3 * X - 1 = 2 * X^0")
+    polynomial.get_solution_string()
+    polynomial.get_solution_string()
+    snapshot = stats.snapshot()
+    assert snapshot.stages["parser.parse"].sizes["terms"] == (4, 4)
+    reduction = snapshot.stages["polynomial.reduce"]
+    assert reduction.calls == 1
+    assert reduction.sizes["max_degree"] == (2, 2)
+    assert reduction.sizes["coefficient_bits"] == (3, 3)
+    # the solution string is memoized, only the first call does any work
+    assert snapshot.stages["polynomial.solution_string"].calls == 1
+    assert snapshot.stages["algebraic.quadratic_roots"].calls == 1
+    assert snapshot.stages["polynomial.discriminant"].sizes["bits"] == (6, 6)
+
+
+def test_counters_and_summary(collecting):
+    stats.count("batch.errors")
+    stats.count("batch.errors", 2)
+    PolynomParser.parse("X = 1")
+    assert stats.snapshot().counters == {"batch.errors": 3}
+    summary = stats.format_summary()
+    assert "parser.parse" in summary
+    assert "terms=2.0/2" in summary
+    assert "batch.errors" in summary
+
+
+def test_snapshot_is_a_copy(collecting):
+    PolynomParser.parse("X = 1")
+    snapshot = stats.snapshot()
+    PolynomParser.parse("X = 1")
+    assert snapshot.stages["parser.parse"].calls == 1
+    assert stats.snapshot().stages["parser.parse"].calls == 2
@@ -0,0 +1,92 @@
+import pytest
+
+from computor.factorization import factorize, is_prime
+from computor.polynominal import PolynomialFactory, PolynomParser
+from computor.str_math import format_decimal, get_prime_factors, simplify_fraction, sqrt_str
+
+
+@pytest.mark.parametrize(
+    "x,y,expected",
+    [
+        (0, 5, (0, 1)),
+        (6, 3, (2, 1)),
+        (6, 4, (3, 2)),
+        (-6, 4, (-3, 2)),
+        (6, -4, (-3, 2)),
+        (-6, -4, (3, 2)),
+        (7, 13, (7, 13)),
+        (2**64 * 3**5, 2**70 * 7, (3**5, 2**6 * 7)),
+    ],
+)
+def test_simplify_fraction(x, y, expected):
+    assert simplify_fraction(x, y) == expected
+
+
+def test_simplify_fraction_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        simplify_fraction(1, 0)
+
+
+@pytest.mark.parametrize(
+    "number,expected",
+    [
+        (0, {}),
+        (1, {}),
+        (2, {2: 1}),
+        (360, {2: 3, 3: 2, 5: 1}),
+        (4093 * 4099, {4093: 1, 4099: 1}),
+        (1000000007 * 998244353, {998244353: 1, 1000000007: 1}),
+        (2**61 - 1, {2**61 - 1: 1}),
+        ((10**12 + 39) ** 2 * 3, {3: 1, 10**12 + 39: 2}),
+    ],
+)
+def test_factorize(number, expected):
+    assert factorize(number) == expected
+
+
+def test_get_prime_factors():
+    assert get_prime_factors(1) == set()
+    assert get_prime_factors(84) == {2, 3, 7}
+
+
+def test_is_prime():
+    assert [n for n in range(30) if is_prime(n)] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert not is_prime(3215031751)  # strong pseudoprime to bases 2, 3, 5 and 7
+
+
+@pytest.mark.parametrize(
+    "x,expected",
+    [
+        (0, "0"),
+        (1, "1"),
+        (-1, "1*I"),
+        (12, "2*sqrt(3)"),
+        (-36, "6*I"),
+        (7, "sqrt(7)"),
+        (-20, "2*sqrt(5)*I"),
+        (2**106, str(2**53)),
+        ((2**61 - 1) ** 2 * 12, f"{2 * (2**61 - 1)}*sqrt(3)"),
+        (10**18 + 12, "2*sqrt(250000000000000003)"),
+    ],
+)
+def test_sqrt_str(x, expected):
+    assert sqrt_str(x) == expected
+
+
+def test_solution_string_with_large_coefficients():
+    polynomial = PolynomialFactory(PolynomParser()).create("X^2 - 1000000000000000000000 = 0")
+    assert polynomial.get_solution_string() == "x = 10000000000*sqrt(10), x = -10000000000*sqrt(10)"
+
+
+def test_sqrt_str_of_hard_to_factor_number_stays_exact():
+    # two 20-digit primes are far beyond the rho budget
+    number = 4 * (10**19 + 51) * (10**20 + 39)
+    assert sqrt_str(number) == f"2*sqrt({(10**19 + 51) * (10**20 + 39)})"
+
+
+@pytest.mark.parametrize(
+    "value,scale,expected",
+    [(125, 2, "1.25"), (-5, 1, "-0.5"), (-50, 2, "-0.5"), (300, 2, "3"), (7, 0, "7"), (1, 3, "0.001")],
+)
+def test_format_decimal(value, scale, expected):
+    assert format_decimal(value, scale) == expected
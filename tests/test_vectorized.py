@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from computor.polynominal import PolynomialFactory, PolynomParser
+from computor.vectorized import solve_quadratics
+from test_data import data_polynom_second_degree_all_positive_tuple
+
+
+def coefficients(polynomial):
+    by_degree = {term.degree: term.coefficient for term in polynomial.terms}
+    return by_degree.get(2, 0), by_degree.get(1, 0), by_degree.get(0, 0)
+
+
+def test_solve_quadratics_matches_polynomials():
+    equations = [equation for equation, _, _ in data_polynom_second_degree_all_positive_tuple]
+    equations += ["2x - 6 = 0", "x = x", "1 = 0", "x^2 = 0", "6x^2 + 6x + 3 = 0"]
+    factory = PolynomialFactory(PolynomParser())
+    polynomials = [factory.create(equation) for equation in equations]
+    a, b, c = np.array([coefficients(polynomial) for polynomial in polynomials]).T
+
+    result = solve_quadratics(a, b, c)
+
+    for i, polynomial in enumerate(polynomials):
+        assert result.degree[i] == polynomial.degree
+        assert result.solutions_count[i] == polynomial.solutions_count
+        if polynomial.degree == 2:
+            assert result.discriminant[i] == polynomial.discriminant
+        roots = [root for root in (result.x1[i], result.x2[i]) if not np.isnan(root)]
+        assert len(roots) == len(polynomial.get_solutions())
+        assert np.allclose(sorted(roots, key=lambda x: (x.real, x.imag)),
+                           sorted(polynomial.get_solutions(), key=lambda x: (complex(x).real, complex(x).imag)))
+
+
+@pytest.mark.parametrize(
+    "a,b,c,degree,count",
+    [
+        (0, 0, 0, 0, float("inf")),
+        (0, 0, 5, 0, -1),
+        (0, 2, -6, 1, 1),
+        (1, 0, 0, 2, 1),
+        (1, 0, 1, 2, 2),
+    ],
+)
+def test_solve_quadratics_degenerate(a, b, c, degree, count):
+    result = solve_quadratics(a, b, c)
+    assert result.degree == degree
+    assert result.solutions_count == count
+
+
+@pytest.mark.parametrize(
+    "equation,b,c",
+    [
+        ("0 * X^2 + 2 * X - 6 = 0", 2, -6),
+        ("0 * X^2 - 3 * X = 0", -3, 0),
+        ("0 * X^2 + 5 = 0", 0, 5),
+        ("0 * X^2 = 0", 0, 0),
+    ],
+)
+def test_solve_quadratics_zero_a_matches_factory(equation, b, c):
+    polynomial = PolynomialFactory(PolynomParser()).create(equation)
+    result = solve_quadratics(0, b, c)
+    assert result.degree == polynomial.degree
+    assert result.solutions_count == polynomial.solutions_count
+    roots = [root for root in (result.x1, result.x2) if not np.isnan(root)]
+    assert np.allclose(roots, polynomial.get_solutions())